@@ -1,3 +1,6 @@
+import time
+BOOT_STARTED = time.time()  # Boot-to-first-request is measured from here
+
 # Python 3.13+ compatibility fix
 try:
     import fix_cgi
@@ -10,24 +13,35 @@ from flask import Flask, render_template, request, redirect, url_for, flash, jso
 
 from flask_login import LoginManager, login_user, logout_user, login_required, current_user, UserMixin
 from werkzeug.security import generate_password_hash, check_password_hash
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 import sqlite3
-import feedparser
 import threading
-import time
 import random
 import re
 import sys
 import io
 import logging
 import json
+import atexit
 import hashlib
 import requests
+import asyncio
+import multiprocessing
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
 from urllib.parse import urlparse, quote, unquote, urljoin
 import urllib3
-from bs4 import BeautifulSoup
 import html
+from utils.http_client import get_http_client
+from utils.content_identity import ContentIdentity
+from utils.near_duplicates import SIGNATURE_VERSION, SimHash, NearDuplicateIndex
+from utils.html_cleaner import HTMLCleaner
+from utils.feed_stream import FeedStreamParser
+from utils.date_parsing import DateParser, DateNormalizer
+from utils.feed_entry import Entry
+from utils.fetch_trace import SourceTrace, STAGES, percentile
+from utils.fetch_lease import FetchLease
+from utils.db_pool import ConnectionPool, apply_pragmas
 urllib3.disable_warnings(urllib3.exceptions.InsecureRequestWarning)
 
 # Fix Unicode encoding
@@ -66,8 +80,38 @@ class FlaskConfig:
     SITE_URL = os.environ.get('SITE_URL', 'https://mzansi-insights.onrender.com')
     
     # Content Update
-    UPDATE_INTERVAL_MINUTES = 60  # Fetch every 60 minutes
+    UPDATE_INTERVAL_MINUTES = 60  # Starting poll interval for a source
+    POLL_MIN_MINUTES = int(os.environ.get('POLL_MIN_MINUTES', 5))  # Hottest sources
+    POLL_MAX_MINUTES = int(os.environ.get('POLL_MAX_MINUTES', 240))  # Quietest sources
+    POLL_TARGET_NEW_ENTRIES = 3  # Aim for this many new articles per poll
+    POLL_RATE_SMOOTHING = 0.3  # Weight of the latest poll in the publication rate average
     MAX_ARTICLES_PER_SOURCE = 20  # Fetch up to 20 articles per source
+    FETCH_WORKERS = int(os.environ.get('FETCH_WORKERS', 4))  # Sources downloaded in parallel
+    FETCH_CYCLE_BUDGET_SECONDS = int(os.environ.get('FETCH_CYCLE_BUDGET_SECONDS', 300))  # Wall-clock limit per cycle
+    FETCH_ENGINE = os.environ.get('FETCH_ENGINE', 'threads')  # 'threads' or 'asyncio'
+    FETCH_MAX_CONNECTIONS = int(os.environ.get('FETCH_MAX_CONNECTIONS', 100))  # asyncio engine only
+    FETCH_PER_HOST_LIMIT = int(os.environ.get('FETCH_PER_HOST_LIMIT', 2))  # asyncio engine only
+    NORMALIZE_PROCESSES = int(os.environ.get('NORMALIZE_PROCESSES', 0))  # 0 = normalize entries in the fetch threads
+    FEED_PROFILE_MAX_FAILURES = 3  # Re-probe all URL variations after this many misses
+    FEED_MAX_BYTES = int(os.environ.get('FEED_MAX_BYTES', 1024 * 1024))  # Stop reading a feed body after this
+    FEED_STOP_AFTER_SEEN = 1  # Stop at the first ingested entry; raise for feeds that pin an old item on top
+    FEED_SEEN_RING_SIZE = 100  # Recent GUIDs/URLs remembered per source
+    FEED_WATERMARK_GRACE_MINUTES = 360  # Entries dated this far before the newest one still count as new
+    BREAKER_FAILURE_THRESHOLD = 3  # Consecutive failed cycles before a source is skipped
+    BREAKER_BASE_BACKOFF_MINUTES = 15  # First skip window, doubles on every further failure
+    BREAKER_MAX_BACKOFF_MINUTES = 24 * 60
+    NEAR_DUPLICATE_WINDOW = int(os.environ.get('NEAR_DUPLICATE_WINDOW', 100000))  # Recent posts kept in the SimHash index
+    NEAR_DUPLICATE_MAX_DISTANCE = 5  # Differing SimHash bits still treated as the same story
+    SIMHASH_BACKFILL_CHUNK = 500  # Posts re-signed per commit at startup
+    FETCH_RUNS_RETENTION_DAYS = int(os.environ.get('FETCH_RUNS_RETENTION_DAYS', 14))  # Run history kept for the dashboard
+    FETCH_LEASE_TTL_SECONDS = int(os.environ.get('FETCH_LEASE_TTL_SECONDS', 90))  # Leader lease, renewed every third of this
+    FETCH_IN_WEB = os.environ.get('FETCH_IN_WEB', 'true').lower() == 'true'  # false when worker.py does the fetching
+    DB_CACHE_SIZE_KB = int(os.environ.get('DB_CACHE_SIZE_KB', 16 * 1024))  # SQLite page cache per connection
+    DB_MMAP_SIZE_MB = int(os.environ.get('DB_MMAP_SIZE_MB', 128))  # Memory-mapped reads, shared by all connections
+    DB_BUSY_TIMEOUT_SECONDS = 5  # Wait this long for another process's write lock
+    CATEGORY_CACHE_SECONDS = 300  # Categories seeded by another process show up within this
+    STARTUP_RETRY_SECONDS = 1  # First wait after a failed database setup or warm-up, doubling each time
+    STARTUP_RETRY_MAX_SECONDS = 60
     
     # Debug settings
     DEBUG = os.environ.get('DEBUG', 'False').lower() == 'true'
@@ -89,17 +133,23 @@ def get_db_path():
             os.makedirs(data_dir, exist_ok=True)
         return os.path.join(data_dir, 'posts.db')
 
+# Applied once to every new connection; WAL mode for better concurrency
+SQLITE_PRAGMAS = {
+    'journal_mode': 'WAL',
+    'synchronous': 'NORMAL',
+    'cache_size': -FlaskConfig.DB_CACHE_SIZE_KB,
+    'mmap_size': FlaskConfig.DB_MMAP_SIZE_MB * 1024 * 1024,
+    'temp_store': 'MEMORY'
+}
+
 def init_database():
-    """Initialize database connection"""
+    """Initialize database connection (unpooled, for schema setup)"""
     db_path = get_db_path()
     logger.info(f"Database path: {db_path}")
     
-    conn = sqlite3.connect(db_path)
+    conn = sqlite3.connect(db_path, timeout=FlaskConfig.DB_BUSY_TIMEOUT_SECONDS)
     conn.row_factory = sqlite3.Row
-    
-    # Enable WAL mode for better concurrency
-    conn.execute('PRAGMA journal_mode=WAL')
-    conn.execute('PRAGMA synchronous=NORMAL')
+    apply_pragmas(conn, SQLITE_PRAGMAS)
     
     return conn
 
@@ -109,9 +159,13 @@ def setup_database():
     logger.info("SETTING UP DATABASE...")
     logger.info("=" * 60)
     
+    conn = None
     try:
         conn = init_database()
         c = conn.cursor()
+        # Migration lock: processes booting together take turns, and each one
+        # after the first finds the schema in place; readers are not blocked
+        c.execute("BEGIN IMMEDIATE")
         
         # Users table
         c.execute('''CREATE TABLE IF NOT EXISTS users (
@@ -149,21 +203,219 @@ def setup_database():
             pub_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
             updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            canonical_url TEXT,
+            title_fingerprint TEXT,
+            simhash INTEGER,
+            simhash_version INTEGER,
+            published_at INTEGER,
             FOREIGN KEY (category_id) REFERENCES categories(id)
         )''')
         
+        # Columns added after the first release
+        post_columns = {row[1] for row in c.execute("PRAGMA table_info(posts)").fetchall()}
+        for column, column_type in (('canonical_url', 'TEXT'), ('title_fingerprint', 'TEXT'), ('simhash', 'INTEGER'),
+                                    ('published_at', 'INTEGER'), ('simhash_version', 'INTEGER')):
+            if column not in post_columns:
+                c.execute(f"ALTER TABLE posts ADD COLUMN {column} {column_type}")
+                logger.info(f"✅ Added posts.{column}")
+        
+        if 'published_at' not in post_columns:
+            # SQLite applies any +HH:MM suffix older rows were stored with
+            c.execute("UPDATE posts SET published_at = CAST(strftime('%s', pub_date) AS INTEGER) "
+                      "WHERE published_at IS NULL AND pub_date IS NOT NULL")
+        # Listings sort on published_at; posts without a feed date sort by ingest time
+        c.execute("UPDATE posts SET published_at = CAST(strftime('%s', created_at) AS INTEGER) "
+                  "WHERE published_at IS NULL")
+        
+        # Copies of a story from other sources, linked to the post we kept
+        c.execute('''CREATE TABLE IF NOT EXISTS post_duplicates (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            post_id INTEGER NOT NULL,
+            source_name TEXT NOT NULL,
+            title TEXT NOT NULL,
+            source_url TEXT NOT NULL,
+            canonical_url TEXT UNIQUE NOT NULL,
+            distance INTEGER,
+            created_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            FOREIGN KEY (post_id) REFERENCES posts(id)
+        )''')
+        
+        # Conditional GET validators per feed URL
+        c.execute('''CREATE TABLE IF NOT EXISTS feed_cache (
+            feed_url TEXT PRIMARY KEY,
+            source_name TEXT NOT NULL,
+            etag TEXT,
+            last_modified TEXT,
+            body_hash TEXT,
+            checked_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )''')
+        
+        # Learned feed resolution profile per source
+        c.execute('''CREATE TABLE IF NOT EXISTS feed_profiles (
+            source_name TEXT PRIMARY KEY,
+            feed_url TEXT NOT NULL,
+            strategy TEXT NOT NULL,
+            verified_at TIMESTAMP,
+            failures INTEGER DEFAULT 0
+        )''')
+        
+        # Circuit breaker state per source
+        c.execute('''CREATE TABLE IF NOT EXISTS source_health (
+            source_name TEXT PRIMARY KEY,
+            state TEXT DEFAULT 'closed',
+            consecutive_failures INTEGER DEFAULT 0,
+            next_attempt_at TIMESTAMP,
+            last_success_at TIMESTAMP,
+            last_failure_at TIMESTAMP,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )''')
+        
+        # Newest ingested entry per source plus a ring of recent GUIDs/URLs
+        c.execute('''CREATE TABLE IF NOT EXISTS source_watermarks (
+            source_name TEXT PRIMARY KEY,
+            newest_guid TEXT,
+            newest_published_at INTEGER,
+            recent_guids TEXT,
+            updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )''')
+        
+        # Adaptive polling schedule per source
+        c.execute('''CREATE TABLE IF NOT EXISTS source_schedule (
+            source_name TEXT PRIMARY KEY,
+            interval_minutes REAL NOT NULL,
+            new_per_hour REAL,
+            last_polled_at TIMESTAMP,
+            next_poll_at TIMESTAMP
+        )''')
+        
+        # One row per fetch cycle and one per source fetched in it, with stage timings
+        c.execute('''CREATE TABLE IF NOT EXISTS fetch_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            started_at TIMESTAMP NOT NULL,
+            finished_at TIMESTAMP,
+            engine TEXT,
+            trigger TEXT,
+            sources INTEGER DEFAULT 0,
+            bytes INTEGER DEFAULT 0,
+            entries_seen INTEGER DEFAULT 0,
+            entries_new INTEGER DEFAULT 0,
+            errors INTEGER DEFAULT 0,
+            duration_ms INTEGER
+        )''')
+        c.execute('''CREATE TABLE IF NOT EXISTS fetch_source_runs (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            run_id INTEGER NOT NULL,
+            source_name TEXT NOT NULL,
+            started_at TIMESTAMP NOT NULL,
+            status TEXT,
+            total_ms INTEGER,
+            connect_ms INTEGER,
+            download_ms INTEGER,
+            parse_ms INTEGER,
+            clean_ms INTEGER,
+            image_ms INTEGER,
+            dedupe_ms INTEGER,
+            insert_ms INTEGER,
+            bytes INTEGER DEFAULT 0,
+            entries_seen INTEGER DEFAULT 0,
+            entries_new INTEGER DEFAULT 0,
+            errors INTEGER DEFAULT 0,
+            last_error TEXT,
+            FOREIGN KEY (run_id) REFERENCES fetch_runs(id)
+        )''')
+        
+        # Fetch leadership lease: the one process allowed to fetch, its heartbeat
+        # and whether it is fetching; other processes only read this
+        c.execute('''CREATE TABLE IF NOT EXISTS fetch_leases (
+            name TEXT PRIMARY KEY,
+            holder TEXT,
+            acquired_at REAL,
+            heartbeat_at REAL,
+            expires_at REAL,
+            fetching INTEGER DEFAULT 0,
+            fetch_requested_at REAL
+        )''')
+        
+        # Published-post counts per category and per source, kept current by the
+        # triggers below so the nav, sidebars and /sources never COUNT(*) posts
+        # The triggers go with the posts table (reset_db.py drops it), so any
+        # missing one means the counts below are stale and need a recount
+        counters_current = c.execute(
+            "SELECT COUNT(*) FROM sqlite_master WHERE type = 'trigger' AND name IN "
+            "('trg_posts_count_insert', 'trg_posts_count_delete', 'trg_posts_count_update')"
+        ).fetchone()[0] == 3
+        c.execute('''CREATE TABLE IF NOT EXISTS category_post_counts (
+            category_id INTEGER PRIMARY KEY,
+            post_count INTEGER NOT NULL DEFAULT 0
+        )''')
+        c.execute('''CREATE TABLE IF NOT EXISTS source_post_counts (
+            source_name TEXT PRIMARY KEY,
+            post_count INTEGER NOT NULL DEFAULT 0
+        ) WITHOUT ROWID''')
+        
+        count_post = '''
+            INSERT INTO category_post_counts (category_id, post_count)
+                SELECT NEW.category_id, 1 WHERE NEW.is_published = 1 AND NEW.category_id IS NOT NULL
+                ON CONFLICT (category_id) DO UPDATE SET post_count = post_count + 1;
+            INSERT INTO source_post_counts (source_name, post_count)
+                SELECT NEW.source_name, 1 WHERE NEW.is_published = 1
+                ON CONFLICT (source_name) DO UPDATE SET post_count = post_count + 1;'''
+        uncount_post = '''
+            UPDATE category_post_counts SET post_count = post_count - 1
+                WHERE category_id = OLD.category_id AND OLD.is_published = 1;
+            UPDATE source_post_counts SET post_count = post_count - 1
+                WHERE source_name = OLD.source_name AND OLD.is_published = 1;'''
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS trg_posts_count_insert AFTER INSERT ON posts BEGIN {count_post} END")
+        c.execute(f"CREATE TRIGGER IF NOT EXISTS trg_posts_count_delete AFTER DELETE ON posts BEGIN {uncount_post} END")
+        # Only the counted columns, so view increments do not fire it
+        c.execute("CREATE TRIGGER IF NOT EXISTS trg_posts_count_update "
+                  f"AFTER UPDATE OF category_id, source_name, is_published ON posts BEGIN {uncount_post} {count_post} END")
+        
         # Create index for faster lookups
         c.execute('CREATE INDEX IF NOT EXISTS idx_posts_slug ON posts(slug)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_posts_category ON posts(category_id)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_posts_created_at ON posts(created_at DESC)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_posts_published_at ON posts(published_at DESC)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_posts_category_published_at ON posts(category_id, published_at DESC)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_posts_source_url ON posts(source_url)')
         c.execute('CREATE INDEX IF NOT EXISTS idx_posts_source_name ON posts(source_name)')
+        c.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_posts_canonical_url ON posts(canonical_url)')
+        c.execute('CREATE UNIQUE INDEX IF NOT EXISTS idx_posts_title_fingerprint ON posts(title_fingerprint)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_post_duplicates_post ON post_duplicates(post_id)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_fetch_source_runs_source ON fetch_source_runs(source_name, started_at)')
+        c.execute('CREATE INDEX IF NOT EXISTS idx_fetch_source_runs_run ON fetch_source_runs(run_id)')
+        
+        # Backfill content identity; later copies of an article keep NULL and stay
+        # out of the unique indexes
+        unfingerprinted = c.execute(
+            "SELECT id, title, source_url, source_name FROM posts WHERE canonical_url IS NULL ORDER BY id"
+        ).fetchall()
+        if unfingerprinted:
+            c.executemany("UPDATE OR IGNORE posts SET canonical_url = ? WHERE id = ?",
+                          [(ContentIdentity.canonical_url(row['source_url']), row['id']) for row in unfingerprinted])
+            c.executemany("UPDATE OR IGNORE posts SET title_fingerprint = ? WHERE id = ?",
+                          [(ContentIdentity.title_fingerprint(row['title'], row['source_name']), row['id'])
+                           for row in unfingerprinted])
+            logger.info(f"✅ Fingerprinted {len(unfingerprinted)} existing posts")
+        
+        if not counters_current:
+            # Count the posts that predate the triggers, in one transaction with the
+            # clearing DELETE so rows inserted meanwhile by a fetch are not counted twice
+            c.execute("DELETE FROM category_post_counts")
+            c.execute("DELETE FROM source_post_counts")
+            c.execute("INSERT INTO category_post_counts (category_id, post_count) "
+                      "SELECT category_id, COUNT(*) FROM posts "
+                      "WHERE is_published = 1 AND category_id IS NOT NULL GROUP BY category_id")
+            c.execute("INSERT INTO source_post_counts (source_name, post_count) "
+                      "SELECT source_name, COUNT(*) FROM posts WHERE is_published = 1 GROUP BY source_name")
+            logger.info("✅ Counted existing posts per category and source")
         
         # Create admin user if not exists
         c.execute("SELECT COUNT(*) FROM users WHERE username = ?", (FlaskConfig.ADMIN_USERNAME,))
         if c.fetchone()[0] == 0:
             pwd_hash = generate_password_hash(FlaskConfig.ADMIN_PASSWORD)
-            c.execute("INSERT INTO users (username, password_hash) VALUES (?, ?)", 
+            # OR IGNORE: workers starting together may all get here
+            c.execute("INSERT OR IGNORE INTO users (username, password_hash) VALUES (?, ?)", 
                      (FlaskConfig.ADMIN_USERNAME, pwd_hash))
             logger.info("✅ Admin user created")
         
@@ -185,12 +437,13 @@ def setup_database():
         for name, slug, desc, icon, color in CATEGORIES:
             c.execute("SELECT id FROM categories WHERE slug = ?", (slug,))
             if c.fetchone() is None:
-                c.execute("INSERT INTO categories (name, slug, description, icon, color) VALUES (?, ?, ?, ?, ?)",
+                c.execute("INSERT OR IGNORE INTO categories (name, slug, description, icon, color) VALUES (?, ?, ?, ?, ?)",
                          (name, slug, desc, icon, color))
                 logger.info(f"✅ Category created: {name}")
         
         conn.commit()
-        conn.close()
+        sign_existing_posts(conn)
+        category_registry.invalidate()
         
         logger.info("✅ Database setup complete")
         logger.info("=" * 60)
@@ -199,18 +452,182 @@ def setup_database():
     except Exception as e:
         logger.error(f"❌ Database setup failed: {e}", exc_info=True)
         return False
+    finally:
+        if conn is not None:
+            # Also drops the migration lock of a failed setup
+            conn.close()
+
+def sign_existing_posts(conn):
+    """SimHash signatures for the recent posts the near-duplicate index covers,
+    recomputed for posts signed by an older signature()
+    
+    Signatures are computed with no transaction open and written a chunk per
+    commit, so a fetch or view update waits for one chunk, not the whole window.
+    """
+    unsigned = [row[0] for row in conn.execute(
+        "SELECT id FROM (SELECT id, simhash, simhash_version FROM posts ORDER BY id DESC LIMIT ?) "
+        "WHERE simhash IS NULL OR simhash_version IS NOT ?",
+        (FlaskConfig.NEAR_DUPLICATE_WINDOW, SIGNATURE_VERSION)
+    ).fetchall()]
+    chunk_size = FlaskConfig.SIMHASH_BACKFILL_CHUNK
+    for start in range(0, len(unsigned), chunk_size):
+        ids = unsigned[start:start + chunk_size]
+        rows = conn.execute(f"SELECT id, title, content FROM posts WHERE id IN ({','.join('?' * len(ids))})",
+                            ids).fetchall()
+        signed = [(SimHash.to_db(SimHash.signature(row['title'], row['content'])), SIGNATURE_VERSION, row['id'])
+                  for row in rows]
+        conn.executemany("UPDATE posts SET simhash = ?, simhash_version = ? WHERE id = ?", signed)
+        conn.commit()
+    if unsigned:
+        logger.info(f"✅ Computed SimHash for {len(unsigned)} existing posts")
+
+# One connection per thread, reused across requests and fetch cycles
+db_pool = ConnectionPool(get_db_path(), SQLITE_PRAGMAS, timeout=FlaskConfig.DB_BUSY_TIMEOUT_SECONDS)
+atexit.register(db_pool.close_all)
 
 def get_db_connection():
-    """Get database connection"""
-    return init_database()
+    """This thread's pooled connection; close() checks it back in"""
+    return db_pool.connection()
+
+class CategoryRegistry:
+    """Categories by id, loaded once and shared by every request
+    
+    Listings decorate each post with its category from here instead of a
+    query per post. setup_database, the only writer, invalidates it; rows
+    seeded by another process (worker.py) are picked up once ttl expires.
+    """
+    
+    DEFAULT = {'name': 'News', 'slug': 'news', 'icon': 'newspaper', 'color': '#4361ee'}
+    
+    def __init__(self, ttl):
+        self.ttl = ttl
+        self.by_id = {}
+        self.loaded_at = 0.0
+    
+    def load(self, conn=None):
+        own_conn = conn is None
+        conn = conn or get_db_connection()
+        try:
+            rows = conn.execute("SELECT id, name, slug, icon, color FROM categories").fetchall()
+        finally:
+            if own_conn:
+                conn.close()
+        # Swap in a whole new dict so readers on other threads never see a partial one
+        self.by_id = {row['id']: {'name': row['name'], 'slug': row['slug'],
+                                  'icon': row['icon'], 'color': row['color']} for row in rows}
+        self.loaded_at = time.time()
+    
+    def invalidate(self):
+        self.loaded_at = 0.0
+    
+    def get(self, category_id):
+        """Template-ready name/slug/icon/color for a category id, News if unknown"""
+        if time.time() - self.loaded_at > self.ttl:
+            try:
+                self.load()
+            except sqlite3.Error:
+                return self.DEFAULT
+        return self.by_id.get(category_id, self.DEFAULT)
+
+category_registry = CategoryRegistry(FlaskConfig.CATEGORY_CACHE_SECONDS)
 
 # ============= CONTENT FETCHER =============
+class UnchangedFeed:
+    """Feed result for a 304 or byte-identical response: nothing new to parse"""
+    entries = ()
+    bozo = False
+    not_modified = True
+
+class MinimalFeed:
+    """Feed built by the BeautifulSoup XML fallback parser"""
+    strategy = 'soup_xml'
+    
+    def __init__(self):
+        self.entries = []
+        self.bozo = False
+
+class ParsedFeed(MinimalFeed):
+    """Entries feedparser read, converted so its result can be dropped"""
+    strategy = 'feedparser'
+
+class ScrapedFeed(MinimalFeed):
+    """Feed built from article links on a source's homepage"""
+    strategy = 'scrape'
+
+class FetchCycle:
+    """What one fetch run's workers leave for the writer: stage traces, feed
+    validators and profile outcomes, each keyed by source name
+    
+    Every run starts a new one and workers hold on to the cycle they were
+    started in, so a straggler still running past the budget writes into a
+    cycle nobody reads any more instead of into the next run's state.
+    """
+    
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.traces = {}
+        self.cache_updates = {}
+        self.profile_updates = {}
+    
+    def trace(self, source_name):
+        """SourceTrace of a source in this run, created on first use"""
+        with self.lock:
+            trace = self.traces.get(source_name)
+            if trace is None:
+                trace = self.traces[source_name] = SourceTrace(source_name)
+            return trace
+
 class ContentFetcher:
     def __init__(self):
         self.is_fetching = False
         self.last_fetch_time = None
         self.last_fetch_count = 0
         
+        # Pooled keep-alive session shared by all fetch threads
+        self.http = get_http_client()
+        
+        # Conditional GET validators, loaded from the DB at the start of a cycle
+        self.cache_lock = threading.Lock()
+        self.feed_cache = {}
+        
+        # Learned feed resolution per source (URL + parser strategy that worked)
+        self.feed_profiles = {}
+        
+        # Circuit breaker state per source, only touched by the writer thread
+        self.source_health = {}
+        
+        # Adaptive polling: interval, publication rate and next poll per source
+        self.poll_schedule = {}
+        
+        # Category slug -> id, refreshed at the start of every cycle
+        self.category_ids = {}
+        
+        # High-water mark per source (newest GUID and pub date, ring of recent
+        # GUIDs/URLs) so feed iteration stops at entries already ingested
+        self.watermarks = {}
+        
+        # Publication dates, with the date field and format each source uses
+        self.dates = DateNormalizer()
+        
+        # Traces, new validators and profile outcomes of the current fetch run,
+        # waiting for the writer
+        self.cycle = FetchCycle()
+        
+        # Only the process holding this lease fetches; every gunicorn worker and
+        # instance has a fetcher, the rest just serve reads
+        self.lease = FetchLease(get_db_path(), ttl=FlaskConfig.FETCH_LEASE_TTL_SECONDS)
+        
+        # SimHash index of recent posts, loaded once per lease term and kept
+        # current by the writer; new signatures wait for their source's commit
+        self.near_duplicates = NearDuplicateIndex(FlaskConfig.NEAR_DUPLICATE_WINDOW,
+                                                  FlaskConfig.NEAR_DUPLICATE_MAX_DISTANCE)
+        self.near_duplicates_term = None
+        self.pending_signatures = {}
+        
+        # Optional process pool for entry normalization, created on first use
+        self.normalize_pool = None
+        self.normalize_pool_lock = threading.Lock()
+        
         # WORKING South African News Sources (Updated URLs)
         self.NEWS_SOURCES = [
             {
@@ -307,282 +724,760 @@ class ContentFetcher:
             },
         ]
     
-    def fetch_feed_with_proxy(self, source):
-        """Fetch RSS feed with proper headers and error handling"""
-        try:
-            headers = {
-                'User-Agent': source.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'),
-                'Accept': 'application/rss+xml, application/xml, text/xml, */*; q=0.01',
-                'Accept-Language': 'en-US,en;q=0.9',
-                'Accept-Encoding': 'gzip, deflate, br',
-                'Connection': 'keep-alive',
-                'Cache-Control': 'max-age=0',
-                'DNT': '1',
-                'Upgrade-Insecure-Requests': '1',
-                'Sec-Fetch-Dest': 'document',
-                'Sec-Fetch-Mode': 'navigate',
-                'Sec-Fetch-Site': 'none',
-                'Sec-Fetch-User': '?1'
+    def build_request_headers(self, source):
+        """Browser-like request headers for a source"""
+        headers = {
+            'User-Agent': source.get('user_agent', 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'),
+            'Accept': 'application/rss+xml, application/xml, text/xml, */*; q=0.01',
+            'Accept-Language': 'en-US,en;q=0.9',
+            'Accept-Encoding': 'gzip, deflate',  # br is left undecoded without brotli installed
+            'Connection': 'keep-alive',
+            'Cache-Control': 'max-age=0',
+            'DNT': '1',
+            'Upgrade-Insecure-Requests': '1',
+            'Sec-Fetch-Dest': 'document',
+            'Sec-Fetch-Mode': 'navigate',
+            'Sec-Fetch-Site': 'none',
+            'Sec-Fetch-User': '?1'
+        }
+        
+        # Add referer for specific sites
+        if 'mybroadband' in source['url']:
+            headers['Referer'] = 'https://mybroadband.co.za/'
+            headers['Origin'] = 'https://mybroadband.co.za'
+        elif 'businesstech' in source['url']:
+            headers['Referer'] = 'https://businesstech.co.za/'
+            headers['Origin'] = 'https://businesstech.co.za'
+        
+        return headers
+    
+    def get_url_variations(self, source):
+        """Feed URL plus alternative formats for problematic feeds"""
+        url_variations = [source['url']]
+        
+        # Add alternative URL formats
+        base_url = source['url']
+        if '/feed' in base_url:
+            url_variations.append(base_url.replace('/feed', '/feed.xml'))
+            url_variations.append(base_url.replace('/feed', '/rss'))
+            url_variations.append(base_url.replace('/feed', '/atom.xml'))
+        elif '/rss' in base_url:
+            url_variations.append(base_url.replace('/rss', '/feed'))
+            url_variations.append(base_url.replace('/rss', '/feed.xml'))
+        
+        return url_variations
+    
+    def parse_feed_content(self, source, content, strategy='feedparser'):
+        """Parse a feed body with feedparser, falling back to BeautifulSoup XML.
+        
+        strategy='soup_xml' goes straight to the fallback for sources whose
+        profile says feedparser can't read them.
+        """
+        # Parser libraries load on first use, so web-only processes never import them
+        import feedparser
+        from bs4 import BeautifulSoup
+        
+        # Method 1: Direct feedparser parse
+        parsed = feedparser.parse(content) if strategy != 'soup_xml' else None
+        feed = None
+        if parsed is not None and parsed.entries:
+            feed = ParsedFeed()
+            feed.entries = [Entry.from_feedparser(raw, self.dates.timestamp(raw, source['name']))
+                            for raw in parsed.entries[:FlaskConfig.MAX_ARTICLES_PER_SOURCE]]
+        
+        # If feedparser fails, try BeautifulSoup as XML
+        if parsed is None or (parsed.bozo and not parsed.entries):
+            logger.info(f"Feedparser failed, trying BeautifulSoup XML parsing for {source['name']}")
+            soup = BeautifulSoup(content, 'xml')
+            
+            # Create a minimal feed object
+            feed = MinimalFeed()
+            
+            # Extract items
+            items = soup.find_all(['item', 'entry'])
+            for item in items[:FlaskConfig.MAX_ARTICLES_PER_SOURCE]:
+                # Extract title
+                title_elem = item.find('title')
+                if title_elem:
+                    entry = Entry(title_elem.get_text(strip=True))
+                else:
+                    continue  # Skip if no title
+                
+                # Extract link
+                link_elem = item.find('link')
+                if link_elem:
+                    if link_elem.get('href'):
+                        entry.link = link_elem['href']
+                    else:
+                        entry.link = link_elem.get_text(strip=True)
+                else:
+                    # Generate a placeholder link
+                    slug = hashlib.md5(entry.title.encode()).hexdigest()[:10]
+                    entry.link = f"{source['base_url']}/article/{slug}"
+                
+                # Extract description/content
+                desc_elem = item.find(['description', 'content:encoded', 'content', 'summary'])
+                if desc_elem:
+                    entry.summary = desc_elem.get_text(strip=True)[:500]
+                else:
+                    entry.summary = entry.title
+                
+                # Extract published date
+                date_elem = item.find(['pubDate', 'published', 'dc:date', 'date'])
+                if date_elem:
+                    entry.published_at = DateParser.to_epoch(date_elem.get_text(strip=True))
+                
+                feed.entries.append(entry)
+            
+            logger.info(f"BeautifulSoup extracted {len(feed.entries)} entries")
+        
+        return feed
+    
+    def scrape_articles(self, source, content):
+        """Build a feed from article links on a source's homepage"""
+        from bs4 import BeautifulSoup
+        soup = BeautifulSoup(content, 'html.parser')
+        
+        # Look for article links (common patterns)
+        article_links = []
+        
+        # Try different selectors
+        selectors = [
+            'article a', '.article a', '.news-item a', '.post a',
+            'h2 a', 'h3 a', '.title a', '.headline a',
+            '[class*="article"] a', '[class*="news"] a', '[class*="post"] a'
+        ]
+        
+        for selector in selectors:
+            links = soup.select(selector)
+            for link in links:
+                href = link.get('href', '')
+                text = link.get_text(strip=True)
+                
+                if (href and href.startswith('http') and 
+                    text and len(text) > 20 and 
+                    not any(x in href.lower() for x in ['contact', 'about', 'privacy', 'terms', 'login', 'register'])):
+                    
+                    # Make absolute URL if relative
+                    if href.startswith('/'):
+                        href = urljoin(source['base_url'], href)
+                    
+                    article_links.append(Entry(
+                        title=text[:200],
+                        link=href,
+                        summary=f'Latest news from {source["name"]}',
+                        published_at=int(time.time())
+                    ))
+            
+            if article_links:
+                break
+        
+        if not article_links:
+            return None
+        
+        # Create a minimal feed
+        feed = ScrapedFeed()
+        feed.entries = article_links[:FlaskConfig.MAX_ARTICLES_PER_SOURCE]
+        logger.info(f"Web scrape found {len(feed.entries)} articles")
+        return feed
+    
+    def load_feed_cache(self, conn):
+        """Load stored ETag / Last-Modified / body hash for every feed URL"""
+        rows = conn.execute(
+            "SELECT feed_url, etag, last_modified, body_hash FROM feed_cache"
+        ).fetchall()
+        
+        with self.cache_lock:
+            self.feed_cache = {row['feed_url']: dict(row) for row in rows}
+    
+    def conditional_headers(self, feed_url, headers):
+        """Copy of headers with If-None-Match / If-Modified-Since for a cached feed"""
+        with self.cache_lock:
+            cached = self.feed_cache.get(feed_url)
+        
+        if not cached or not (cached.get('etag') or cached.get('last_modified')):
+            return headers
+        
+        headers = dict(headers)
+        headers.pop('Cache-Control', None)
+        if cached.get('etag'):
+            headers['If-None-Match'] = cached['etag']
+        if cached.get('last_modified'):
+            headers['If-Modified-Since'] = cached['last_modified']
+        return headers
+    
+    def is_unchanged_body(self, feed_url, body):
+        """True if a 200 body is byte-identical to the last parsed one"""
+        with self.cache_lock:
+            cached = self.feed_cache.get(feed_url)
+        return bool(cached and cached.get('body_hash') == hashlib.sha1(body).hexdigest())
+    
+    def feed_validators(self, feed_url, response_headers, body):
+        """Validators of a successfully parsed feed response
+        
+        body is None when only part of the feed was read; no hash is kept then.
+        """
+        return {
+            'feed_url': feed_url,
+            'etag': response_headers.get('ETag'),
+            'last_modified': response_headers.get('Last-Modified'),
+            'body_hash': hashlib.sha1(body).hexdigest() if body is not None else None
+        }
+    
+    def remember_feed_validators(self, source, feed, cycle=None):
+        """Queue the validators of the feed a source settled on for the writer
+        
+        Only the winning URL's response gets here, so a slower variation
+        can't replace its validators.
+        """
+        validators = getattr(feed, 'validators', None)
+        if validators:
+            cycle = cycle or self.cycle
+            with cycle.lock:
+                cycle.cache_updates[source['name']] = validators
+    
+    def save_feed_cache(self, conn, source):
+        """Persist queued validators for a source whose entries were written"""
+        with self.cycle.lock:
+            update = self.cycle.cache_updates.pop(source['name'], None)
+        if not update:
+            return
+        
+        with self.cache_lock:
+            self.feed_cache[update['feed_url']] = update
+        
+        conn.execute('''INSERT OR REPLACE INTO feed_cache
+            (feed_url, source_name, etag, last_modified, body_hash, checked_at)
+            VALUES (?, ?, ?, ?, ?, CURRENT_TIMESTAMP)''',
+            (update['feed_url'], source['name'], update['etag'],
+             update['last_modified'], update['body_hash']))
+    
+    def load_watermarks(self, conn):
+        """Load every source's high-water mark"""
+        rows = conn.execute(
+            "SELECT source_name, newest_guid, newest_published_at, recent_guids FROM source_watermarks"
+        ).fetchall()
+        
+        watermarks = {}
+        for row in rows:
+            recent = json.loads(row['recent_guids'] or '[]')
+            watermarks[row['source_name']] = {
+                'newest_guid': row['newest_guid'],
+                'newest_published_at': row['newest_published_at'],
+                'recent_guids': recent,
+                'seen': set(recent)
             }
+        
+        with self.cache_lock:
+            self.watermarks = watermarks
+    
+    def get_watermark(self, source):
+        """High-water mark of a source, None before its first ingest"""
+        with self.cache_lock:
+            return self.watermarks.get(source['name'])
+    
+    @staticmethod
+    def entry_guids(entry):
+        """Identities an entry is remembered by: its GUID and canonical link"""
+        guids = []
+        if entry.guid:
+            guids.append(entry.guid.strip())
+        if entry.link:
+            guids.append(ContentIdentity.canonical_url(entry.link))
+        return guids
+    
+    @staticmethod
+    def is_entry_seen(watermark, entry):
+        """True if an entry was already ingested according to the high-water mark"""
+        if not watermark:
+            return False
+        if any(guid in watermark['seen'] for guid in ContentFetcher.entry_guids(entry)):
+            return True
+        # Backdated stories can show up late, so only entries well before the
+        # newest one we took are assumed to be old ones with a changed GUID
+        published_at = entry.published_at
+        return bool(published_at and watermark['newest_published_at'] and published_at <
+                    watermark['newest_published_at'] - FlaskConfig.FEED_WATERMARK_GRACE_MINUTES * 60)
+    
+    def save_watermark(self, conn, source, articles):
+        """Advance a source's high-water mark past the articles just processed"""
+        if not articles:
+            return
+        
+        watermark = self.get_watermark(source) or {
+            'newest_guid': None, 'newest_published_at': None, 'recent_guids': []}
+        
+        # Feed order is newest first; the ring keeps the latest identities
+        recent = []
+        for guid in [g for article in articles for g in article['guids']] + watermark['recent_guids']:
+            if guid not in recent:
+                recent.append(guid)
+        recent = recent[:FlaskConfig.FEED_SEEN_RING_SIZE]
+        
+        # A future pubDate would hide every real entry behind it
+        latest_plausible = time.time() + 3600
+        timestamps = [article['published_at'] for article in articles
+                      if article['published_at'] and article['published_at'] <= latest_plausible]
+        if watermark['newest_published_at']:
+            timestamps.append(watermark['newest_published_at'])
+        
+        updated = {
+            'newest_guid': articles[0]['guids'][0] if articles[0]['guids'] else watermark['newest_guid'],
+            'newest_published_at': max(timestamps) if timestamps else None,
+            'recent_guids': recent,
+            'seen': set(recent)
+        }
+        with self.cache_lock:
+            self.watermarks[source['name']] = updated
+        
+        conn.execute('''INSERT OR REPLACE INTO source_watermarks
+            (source_name, newest_guid, newest_published_at, recent_guids, updated_at)
+            VALUES (?, ?, ?, ?, CURRENT_TIMESTAMP)''',
+            (source['name'], updated['newest_guid'], updated['newest_published_at'], json.dumps(recent)))
+    
+    def new_feed_stream(self, source, strategy):
+        """FeedStreamParser for one response body of a source"""
+        watermark = self.get_watermark(source)
+        
+        def is_seen(entry):
+            return self.is_entry_seen(watermark, entry)
+        
+        return FeedStreamParser(
+            max_entries=FlaskConfig.MAX_ARTICLES_PER_SOURCE,
+            is_seen=is_seen,
+            max_bytes=FlaskConfig.FEED_MAX_BYTES,
+            stop_after_seen=FlaskConfig.FEED_STOP_AFTER_SEEN,
+            # The XML fallback profile means the stream parser can't read this feed
+            parse=strategy != 'soup_xml'
+        )
+    
+    def finish_feed_stream(self, source, feed_url, stream, response_headers, strategy):
+        """Feed from a streamed body; malformed XML goes through parse_feed_content
+        
+        Returns UnchangedFeed when the body is identical to the last one or
+        when the stream stopped on stored entries before finding a new one.
+        Validators of a usable response ride along as feed.validators.
+        """
+        feed = stream.finish()
+        body = stream.body() if stream.complete else None
+        
+        if body is not None and self.is_unchanged_body(feed_url, body):
+            logger.info(f"Feed unchanged since last fetch: {feed_url}")
+            return UnchangedFeed()
+        
+        if stream.failed or not stream.parse:
+            # Lenient parsers need the bytes read so far, capped by FEED_MAX_BYTES
+            feed = self.parse_feed_content(source, stream.body(), strategy)
+        elif feed.stopped_at_seen and not feed.entries:
+            logger.info(f"No entries newer than the stored ones in {feed_url}")
+            unchanged = UnchangedFeed()
+            unchanged.validators = self.feed_validators(feed_url, response_headers, body)
+            return unchanged
+        elif feed.truncated:
+            logger.info(f"Stopped reading {feed_url} at {FlaskConfig.FEED_MAX_BYTES} bytes")
+        
+        if feed and hasattr(feed, 'entries') and len(feed.entries) > 0:
+            feed.validators = self.feed_validators(feed_url, response_headers, body)
+        return feed
+    
+    def load_feed_profiles(self, conn):
+        """Load the learned resolution profile of every source"""
+        rows = conn.execute(
+            "SELECT source_name, feed_url, strategy, verified_at, failures FROM feed_profiles"
+        ).fetchall()
+        
+        with self.cache_lock:
+            self.feed_profiles = {row['source_name']: dict(row) for row in rows}
+    
+    def get_feed_profile(self, source):
+        """Profile to resolve a source with, or None to probe every variation"""
+        with self.cache_lock:
+            profile = self.feed_profiles.get(source['name'])
+        
+        if not profile or profile['failures'] >= FlaskConfig.FEED_PROFILE_MAX_FAILURES:
+            return None
+        
+        # Learned for a URL the source no longer lists: re-probe the configured ones
+        expected_urls = [source.get('base_url')] if profile['strategy'] == 'scrape' else self.get_url_variations(source)
+        if profile['feed_url'] not in expected_urls:
+            logger.info(f"Ignoring {source['name']} profile for old URL {profile['feed_url']}")
+            return None
+        return profile
+    
+    def get_profile_plan(self, source, profile):
+        """Feed URLs to try and whether the homepage scrape is allowed"""
+        if not profile:
+            return self.get_url_variations(source), True
+        
+        logger.info(f"Using learned {profile['strategy']} profile for {source['name']}: {profile['feed_url']}")
+        if profile['strategy'] == 'scrape':
+            return [], True
+        return [profile['feed_url']], False
+    
+    def record_feed_resolution(self, source, profile, feed, feed_url, cycle=None):
+        """Queue the profile outcome of a fetch for the writer"""
+        if getattr(feed, 'not_modified', False):
+            # 304s don't say which parser would have worked, keep what we knew
+            strategy = profile['strategy'] if profile else 'feedparser'
+        elif feed and len(feed.entries) > 0:
+            strategy = getattr(feed, 'strategy', 'feedparser')
+        else:
+            feed_url = None
+        
+        cycle = cycle or self.cycle
+        with cycle.lock:
+            if feed_url:
+                cycle.profile_updates[source['name']] = {
+                    'feed_url': feed_url,
+                    'strategy': strategy,
+                    'verified_at': datetime.now().strftime('%Y-%m-%d %H:%M:%S'),
+                    'failures': 0
+                }
+            elif profile:
+                cycle.profile_updates[source['name']] = dict(profile, failures=profile['failures'] + 1)
+    
+    def save_feed_profile(self, conn, source):
+        """Persist the queued profile outcome for a processed source"""
+        with self.cycle.lock:
+            update = self.cycle.profile_updates.pop(source['name'], None)
+        if not update:
+            return
+        
+        with self.cache_lock:
+            self.feed_profiles[source['name']] = update
+        
+        if update['failures'] >= FlaskConfig.FEED_PROFILE_MAX_FAILURES:
+            logger.info(f"  🔎 {source['name']} profile failed {update['failures']} times, re-probing next cycle")
+        
+        conn.execute('''INSERT OR REPLACE INTO feed_profiles
+            (source_name, feed_url, strategy, verified_at, failures)
+            VALUES (?, ?, ?, ?, ?)''',
+            (source['name'], update['feed_url'], update['strategy'],
+             update['verified_at'], update['failures']))
+    
+    def load_source_health(self, conn):
+        """Load circuit breaker state for every source"""
+        rows = conn.execute("SELECT * FROM source_health").fetchall()
+        self.source_health = {row['source_name']: dict(row) for row in rows}
+    
+    def breaker_allows(self, source, now=None):
+        """False while a source's breaker is open and its backoff hasn't expired"""
+        health = self.source_health.get(source['name'])
+        if not health or health['state'] != 'open':
+            return True
+        
+        now = now or datetime.now()
+        next_attempt = datetime.strptime(health['next_attempt_at'], '%Y-%m-%d %H:%M:%S')
+        if now < next_attempt:
+            return False
+        
+        # Backoff expired: let one trial cycle through
+        health['state'] = 'half_open'
+        logger.info(f"  🔌 {source['name']} breaker half-open, retrying")
+        return True
+    
+    def record_source_health(self, conn, source, succeeded, now=None):
+        """Update and persist the breaker after a source was fetched"""
+        now = now or datetime.now()
+        stamp = now.strftime('%Y-%m-%d %H:%M:%S')
+        health = self.source_health.get(source['name']) or {
+            'source_name': source['name'], 'state': 'closed', 'consecutive_failures': 0,
+            'next_attempt_at': None, 'last_success_at': None, 'last_failure_at': None
+        }
+        
+        if succeeded:
+            health.update(state='closed', consecutive_failures=0, next_attempt_at=None, last_success_at=stamp)
+        else:
+            failures = health['consecutive_failures'] + 1
+            health.update(consecutive_failures=failures, last_failure_at=stamp)
             
-            # Add referer for specific sites
-            if 'mybroadband' in source['url']:
-                headers['Referer'] = 'https://mybroadband.co.za/'
-                headers['Origin'] = 'https://mybroadband.co.za'
-            elif 'businesstech' in source['url']:
-                headers['Referer'] = 'https://businesstech.co.za/'
-                headers['Origin'] = 'https://businesstech.co.za'
+            if health['state'] == 'half_open' or failures >= FlaskConfig.BREAKER_FAILURE_THRESHOLD:
+                backoff = min(
+                    FlaskConfig.BREAKER_BASE_BACKOFF_MINUTES * 2 ** max(failures - FlaskConfig.BREAKER_FAILURE_THRESHOLD, 0),
+                    FlaskConfig.BREAKER_MAX_BACKOFF_MINUTES
+                )
+                health.update(state='open',
+                              next_attempt_at=(now + timedelta(minutes=backoff)).strftime('%Y-%m-%d %H:%M:%S'))
+                logger.warning(f"  🔌 {source['name']} breaker open after {failures} failures, "
+                               f"skipping for {backoff} minutes")
+        
+        self.source_health[source['name']] = health
+        conn.execute('''INSERT OR REPLACE INTO source_health
+            (source_name, state, consecutive_failures, next_attempt_at,
+             last_success_at, last_failure_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP)''',
+            (source['name'], health['state'], health['consecutive_failures'],
+             health['next_attempt_at'], health['last_success_at'], health['last_failure_at']))
+    
+    def load_poll_schedule(self, conn):
+        """Load the adaptive polling schedule of every source"""
+        rows = conn.execute("SELECT * FROM source_schedule").fetchall()
+        self.poll_schedule = {row['source_name']: dict(row) for row in rows}
+    
+    def is_poll_due(self, source, now=None):
+        """True once a source's next poll time has passed"""
+        schedule = self.poll_schedule.get(source['name'])
+        if not schedule or not schedule['next_poll_at']:
+            return True
+        
+        now = now or datetime.now()
+        return now >= datetime.strptime(schedule['next_poll_at'], '%Y-%m-%d %H:%M:%S')
+    
+    def seconds_until_next_poll(self, now=None):
+        """Sleep time until the earliest source is due and its breaker allows it"""
+        now = now or datetime.now()
+        next_times = []
+        
+        for source in self.NEWS_SOURCES:
+            if not source.get('enabled', True):
+                continue
             
-            timeout = 15  # Increased timeout
+            schedule = self.poll_schedule.get(source['name'])
+            if not schedule or not schedule['next_poll_at']:
+                return 0
+            due = datetime.strptime(schedule['next_poll_at'], '%Y-%m-%d %H:%M:%S')
             
-            # Try multiple URL variations for problematic feeds
-            url_variations = [source['url']]
+            health = self.source_health.get(source['name'])
+            if health and health['state'] == 'open' and health['next_attempt_at']:
+                due = max(due, datetime.strptime(health['next_attempt_at'], '%Y-%m-%d %H:%M:%S'))
+            next_times.append(due)
+        
+        if not next_times:
+            return FlaskConfig.UPDATE_INTERVAL_MINUTES * 60
+        
+        wait = (min(next_times) - now).total_seconds()
+        return min(max(wait, 0), FlaskConfig.POLL_MAX_MINUTES * 60)
+    
+    def update_poll_schedule(self, conn, source, new_entries, succeeded, now=None):
+        """Re-plan a source's next poll from how many new articles it produced.
+        
+        The publication rate is an exponential moving average of new articles
+        per hour between polls; the interval is chosen so the next poll should
+        find about POLL_TARGET_NEW_ENTRIES, within POLL_MIN/MAX_MINUTES.
+        """
+        now = now or datetime.now()
+        schedule = self.poll_schedule.get(source['name']) or {
+            'source_name': source['name'], 'interval_minutes': FlaskConfig.UPDATE_INTERVAL_MINUTES,
+            'new_per_hour': None, 'last_polled_at': None, 'next_poll_at': None
+        }
+        interval = schedule['interval_minutes']
+        rate = schedule['new_per_hour']
+        
+        # The first poll returns the feed's backlog, which says nothing about its rate
+        if succeeded and schedule['last_polled_at']:
+            last_polled = datetime.strptime(schedule['last_polled_at'], '%Y-%m-%d %H:%M:%S')
+            elapsed_hours = max((now - last_polled).total_seconds() / 3600, 1 / 60)
+            observed = new_entries / elapsed_hours
+            if rate is None:
+                rate = observed
+            else:
+                rate = FlaskConfig.POLL_RATE_SMOOTHING * observed + (1 - FlaskConfig.POLL_RATE_SMOOTHING) * rate
             
-            # Add alternative URL formats
-            base_url = source['url']
-            if '/feed' in base_url:
-                url_variations.append(base_url.replace('/feed', '/feed.xml'))
-                url_variations.append(base_url.replace('/feed', '/rss'))
-                url_variations.append(base_url.replace('/feed', '/atom.xml'))
-            elif '/rss' in base_url:
-                url_variations.append(base_url.replace('/rss', '/feed'))
-                url_variations.append(base_url.replace('/rss', '/feed.xml'))
+            interval = FlaskConfig.POLL_TARGET_NEW_ENTRIES / rate * 60 if rate else interval * 1.5
+            interval = min(max(interval, FlaskConfig.POLL_MIN_MINUTES), FlaskConfig.POLL_MAX_MINUTES)
+        
+        schedule.update(
+            interval_minutes=interval,
+            new_per_hour=rate,
+            last_polled_at=now.strftime('%Y-%m-%d %H:%M:%S') if succeeded else schedule['last_polled_at'],
+            next_poll_at=(now + timedelta(minutes=interval)).strftime('%Y-%m-%d %H:%M:%S')
+        )
+        self.poll_schedule[source['name']] = schedule
+        
+        conn.execute('''INSERT OR REPLACE INTO source_schedule
+            (source_name, interval_minutes, new_per_hour, last_polled_at, next_poll_at)
+            VALUES (?, ?, ?, ?, ?)''',
+            (source['name'], schedule['interval_minutes'], schedule['new_per_hour'],
+             schedule['last_polled_at'], schedule['next_poll_at']))
+    
+    def get_trace(self, source):
+        """SourceTrace of a source in the current run, created on first use"""
+        return self.cycle.trace(source['name'])
+    
+    def start_fetch_run(self, conn, trigger):
+        """Open a fetch_runs row for this cycle and drop history past retention"""
+        self.cycle = FetchCycle()
+        
+        cutoff = (datetime.now() - timedelta(days=FlaskConfig.FETCH_RUNS_RETENTION_DAYS)).strftime('%Y-%m-%d %H:%M:%S')
+        conn.execute("DELETE FROM fetch_source_runs WHERE started_at < ?", (cutoff,))
+        conn.execute("DELETE FROM fetch_runs WHERE started_at < ?", (cutoff,))
+        run_id = conn.execute(
+            "INSERT INTO fetch_runs (started_at, engine, trigger) VALUES (?, ?, ?)",
+            (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), FlaskConfig.FETCH_ENGINE, trigger)
+        ).lastrowid
+        conn.commit()
+        return run_id
+    
+    def save_source_run(self, conn, run_id, source, status, fetch_seconds):
+        """Persist a source's trace for this run; committed with the source's entries"""
+        trace = self.get_trace(source)
+        spans = trace.milliseconds()
+        total_ms = round(fetch_seconds * 1000) + spans['dedupe'] + spans['insert']
+        conn.execute(f'''INSERT INTO fetch_source_runs
+            (run_id, source_name, started_at, status, total_ms, {', '.join(f'{stage}_ms' for stage in STAGES)},
+             bytes, entries_seen, entries_new, errors, last_error)
+            VALUES ({', '.join('?' * (10 + len(STAGES)))})''',
+            (run_id, source['name'], datetime.fromtimestamp(trace.started_at).strftime('%Y-%m-%d %H:%M:%S'),
+             status, total_ms, *(spans[stage] for stage in STAGES),
+             trace.counters['bytes'], trace.counters['entries_seen'], trace.counters['entries_new'],
+             trace.counters['errors'], trace.last_error))
+    
+    def finish_fetch_run(self, conn, run_id, started):
+        """Close the run row with totals over the sources it recorded"""
+        conn.execute('''UPDATE fetch_runs SET
+            finished_at = ?, duration_ms = ?,
+            sources = (SELECT COUNT(*) FROM fetch_source_runs WHERE run_id = ?),
+            bytes = (SELECT COALESCE(SUM(bytes), 0) FROM fetch_source_runs WHERE run_id = ?),
+            entries_seen = (SELECT COALESCE(SUM(entries_seen), 0) FROM fetch_source_runs WHERE run_id = ?),
+            entries_new = (SELECT COALESCE(SUM(entries_new), 0) FROM fetch_source_runs WHERE run_id = ?),
+            errors = (SELECT COALESCE(SUM(errors), 0) FROM fetch_source_runs WHERE run_id = ?)
+            WHERE id = ?''',
+            (datetime.now().strftime('%Y-%m-%d %H:%M:%S'), round((time.time() - started) * 1000),
+             run_id, run_id, run_id, run_id, run_id, run_id))
+        conn.commit()
+    
+    def fetch_feed_with_proxy(self, source, cycle=None):
+        """Fetch RSS feed with proper headers and error handling"""
+        cycle = cycle or self.cycle
+        trace = cycle.trace(source['name'])
+        try:
+            headers = self.build_request_headers(source)
             
             feed = None
             successful_url = None
+            profile = self.get_feed_profile(source)
+            url_variations, allow_scrape = self.get_profile_plan(source, profile)
+            strategy = profile['strategy'] if profile else 'feedparser'
             
+            # Try multiple URL variations for problematic feeds
             for feed_url in url_variations:
                 try:
                     logger.info(f"Trying URL: {feed_url}")
                     
-                    response = requests.get(
-                        feed_url,
-                        headers=headers,
-                        timeout=timeout,
-                        verify=False,
-                        allow_redirects=True
-                    )
+                    # With stream=True this returns once the headers are in
+                    with trace.span('connect'):
+                        response = self.http.get(
+                            feed_url,
+                            headers=self.conditional_headers(feed_url, headers),
+                            verify=False,
+                            allow_redirects=True,
+                            stream=True
+                        )
                     
                     logger.info(f"Response from {source['name']} ({feed_url}): {response.status_code}")
                     
+                    if response.status_code == 304:
+                        response.close()
+                        logger.info(f"Feed unchanged since last fetch: {feed_url}")
+                        feed = UnchangedFeed()
+                        successful_url = feed_url
+                        break
+                    
                     if response.status_code == 200:
                         successful_url = feed_url
                         
-                        # Try different parsing methods
+                        # Parse while downloading; stop reading once we have enough
+                        stream = self.new_feed_stream(source, strategy)
+                        read_started = time.perf_counter()
                         try:
-                            # Method 1: Direct feedparser parse
-                            feed = feedparser.parse(response.content)
-                            
-                            # If feedparser fails, try BeautifulSoup as XML
-                            if feed.bozo and (not feed.entries or len(feed.entries) == 0):
-                                logger.info(f"Feedparser failed, trying BeautifulSoup XML parsing for {source['name']}")
-                                soup = BeautifulSoup(response.content, 'xml')
-                                
-                                # Create a minimal feed object
-                                class MinimalFeed:
-                                    def __init__(self):
-                                        self.entries = []
-                                        self.bozo = False
-                                
-                                feed = MinimalFeed()
-                                
-                                # Extract items
-                                items = soup.find_all(['item', 'entry'])
-                                for item in items[:FlaskConfig.MAX_ARTICLES_PER_SOURCE]:
-                                    entry = {}
-                                    
-                                    # Extract title
-                                    title_elem = item.find('title')
-                                    if title_elem:
-                                        entry['title'] = title_elem.get_text(strip=True)
-                                    else:
-                                        continue  # Skip if no title
-                                    
-                                    # Extract link
-                                    link_elem = item.find('link')
-                                    if link_elem:
-                                        if link_elem.get('href'):
-                                            entry['link'] = link_elem['href']
-                                        else:
-                                            entry['link'] = link_elem.get_text(strip=True)
-                                    else:
-                                        # Generate a placeholder link
-                                        slug = hashlib.md5(entry['title'].encode()).hexdigest()[:10]
-                                        entry['link'] = f"{source['base_url']}/article/{slug}"
-                                    
-                                    # Extract description/content
-                                    desc_elem = item.find(['description', 'content:encoded', 'content', 'summary'])
-                                    if desc_elem:
-                                        entry['summary'] = desc_elem.get_text(strip=True)[:500]
-                                    else:
-                                        entry['summary'] = entry['title']
-                                    
-                                    # Extract published date
-                                    date_elem = item.find(['pubDate', 'published', 'dc:date', 'date'])
-                                    if date_elem:
-                                        entry['published'] = date_elem.get_text(strip=True)
-                                    
-                                    feed.entries.append(entry)
-                                
-                                logger.info(f"BeautifulSoup extracted {len(feed.entries)} entries")
+                            for chunk in response.iter_content(chunk_size=64 * 1024):
+                                if stream.feed(chunk):
+                                    break
+                        finally:
+                            response.close()
+                            trace.record_stream(stream, time.perf_counter() - read_started)
                         
+                        try:
+                            with trace.span('parse'):
+                                feed = self.finish_feed_stream(source, feed_url, stream, response.headers, strategy)
                         except Exception as parse_error:
                             logger.error(f"Parse error for {source['name']}: {parse_error}")
+                            trace.error(f"Parse error: {parse_error}")
                             continue
                         
+                        if getattr(feed, 'not_modified', False):
+                            break
                         if feed and hasattr(feed, 'entries') and len(feed.entries) > 0:
                             logger.info(f"Successfully parsed {len(feed.entries)} entries from {feed_url}")
                             break
                         else:
                             logger.warning(f"No entries found in {feed_url}")
+                    else:
+                        response.close()
                 
                 except requests.exceptions.RequestException as req_err:
                     logger.warning(f"Failed to fetch {feed_url}: {req_err}")
+                    trace.error(f"{feed_url}: {req_err}")
                     continue
                 except Exception as e:
                     logger.warning(f"Error processing {feed_url}: {e}")
+                    trace.error(f"{feed_url}: {e}")
                     continue
             
             # If all URL variations failed, try a web scrape as last resort
-            if not feed or not hasattr(feed, 'entries') or len(feed.entries) == 0:
+            if allow_scrape and not getattr(feed, 'not_modified', False) and (
+                    not feed or not hasattr(feed, 'entries') or len(feed.entries) == 0):
                 logger.info(f"All RSS feeds failed, trying web scrape for {source['name']}")
                 try:
-                    response = requests.get(
-                        source['base_url'],
-                        headers=headers,
-                        timeout=timeout,
-                        verify=False
-                    )
+                    with trace.span('download'):
+                        response = self.http.get(
+                            source['base_url'],
+                            headers=headers,
+                            verify=False
+                        )
                     
                     if response.status_code == 200:
-                        soup = BeautifulSoup(response.content, 'html.parser')
-                        
-                        # Look for article links (common patterns)
-                        article_links = []
-                        
-                        # Try different selectors
-                        selectors = [
-                            'article a', '.article a', '.news-item a', '.post a',
-                            'h2 a', 'h3 a', '.title a', '.headline a',
-                            '[class*="article"] a', '[class*="news"] a', '[class*="post"] a'
-                        ]
-                        
-                        for selector in selectors:
-                            links = soup.select(selector)
-                            for link in links:
-                                href = link.get('href', '')
-                                text = link.get_text(strip=True)
-                                
-                                if (href and href.startswith('http') and 
-                                    text and len(text) > 20 and 
-                                    not any(x in href.lower() for x in ['contact', 'about', 'privacy', 'terms', 'login', 'register'])):
-                                    
-                                    # Make absolute URL if relative
-                                    if href.startswith('/'):
-                                        href = urljoin(source['base_url'], href)
-                                    
-                                    article_links.append({
-                                        'title': text[:200],
-                                        'link': href,
-                                        'summary': f'Latest news from {source["name"]}',
-                                        'published': datetime.now().strftime('%a, %d %b %Y %H:%M:%S GMT')
-                                    })
-                            
-                            if article_links:
-                                break
-                        
-                        if article_links:
-                            # Create a minimal feed
-                            class ScrapedFeed:
-                                def __init__(self):
-                                    self.entries = []
-                                    self.bozo = False
-                            
-                            feed = ScrapedFeed()
-                            feed.entries = article_links[:FlaskConfig.MAX_ARTICLES_PER_SOURCE]
-                            logger.info(f"Web scrape found {len(feed.entries)} articles")
+                        trace.count('bytes', len(response.content))
+                        with trace.span('parse'):
+                            feed = self.scrape_articles(source, response.content) or feed
+                        successful_url = source['base_url']
                 
                 except Exception as scrape_error:
                     logger.error(f"Web scrape failed for {source['name']}: {scrape_error}")
+                    trace.error(f"Scrape: {scrape_error}")
             
+            self.remember_feed_validators(source, feed, cycle)
+            self.record_feed_resolution(source, profile, feed, successful_url, cycle)
             return feed
             
         except Exception as e:
             logger.error(f"Unexpected error in fetch_feed_with_proxy for {source['name']}: {e}", exc_info=True)
+            trace.error(e)
             return None
     
-    def extract_image_from_entry(self, entry, source_base_url):
-        """Extract image URL from entry"""
+    def extract_image_from_entry(self, entry, source_base_url, parsed=None):
+        """Extract image URL from entry
+        
+        parsed is the entry's fragment memo from parse_html, so content already
+        cleaned for the article text is not parsed a second time.
+        """
         try:
-            # Method 1: Check for media content
-            if hasattr(entry, 'media_content') and entry.media_content:
-                for media in entry.media_content:
-                    if isinstance(media, dict) and media.get('type', '').startswith('image/'):
-                        img_url = media.get('url', '')
-                        if img_url and img_url.startswith('http'):
-                            return img_url
-            
-            # Method 2: Check media thumbnail
-            if hasattr(entry, 'media_thumbnail') and entry.media_thumbnail:
-                for thumb in entry.media_thumbnail:
-                    if isinstance(thumb, dict):
-                        img_url = thumb.get('url', '')
-                        if img_url and img_url.startswith('http'):
-                            return img_url
+            # Method 1: media:content, media:thumbnail or an image enclosure
+            if entry.media_image:
+                return entry.media_image
             
-            # Method 3: Check for enclosures
-            if hasattr(entry, 'enclosures') and entry.enclosures:
-                for enc in entry.enclosures:
-                    if isinstance(enc, dict) and enc.get('type', '').startswith('image/'):
-                        img_url = enc.get('href', '') or enc.get('url', '')
+            # Method 2: First <img> in content/summary, from the same single parse
+            for content in (entry.content, entry.summary):
+                if content:
+                    try:
+                        img_url = self.parse_html(content, 0, parsed).image_src
                         if img_url and img_url.startswith('http'):
                             return img_url
+                        elif img_url and img_url.startswith('/'):
+                            return urljoin(source_base_url, img_url)
+                    except:
+                        # Try regex as fallback
+                        img_match = re.search(r'<img[^>]+src="([^">]+)"', content, re.IGNORECASE)
+                        if img_match:
+                            img_url = img_match.group(1)
+                            if img_url and img_url.startswith('http'):
+                                return img_url
+                            elif img_url and img_url.startswith('/'):
+                                return urljoin(source_base_url, img_url)
             
-            # Method 4: Extract from content/summary using BeautifulSoup
-            content_fields = ['content', 'summary', 'description']
-            
-            for field in content_fields:
-                if hasattr(entry, field):
-                    content = getattr(entry, field)
-                    
-                    # Handle different content types
-                    if isinstance(content, list) and len(content) > 0:
-                        if hasattr(content[0], 'value'):
-                            content = content[0].value
-                        else:
-                            content = str(content[0])
-                    elif isinstance(content, dict):
-                        content = content.get('value', '')
-                    else:
-                        content = str(content)
-                    
-                    if content:
-                        try:
-                            soup = BeautifulSoup(content, 'html.parser')
-                            img_tag = soup.find('img')
-                            if img_tag and img_tag.get('src'):
-                                img_url = img_tag['src']
-                                if img_url and img_url.startswith('http'):
-                                    return img_url
-                                elif img_url and img_url.startswith('/'):
-                                    return urljoin(source_base_url, img_url)
-                        except:
-                            # Try regex as fallback
-                            img_match = re.search(r'<img[^>]+src="([^">]+)"', content, re.IGNORECASE)
-                            if img_match:
-                                img_url = img_match.group(1)
-                                if img_url and img_url.startswith('http'):
-                                    return img_url
-                                elif img_url and img_url.startswith('/'):
-                                    return urljoin(source_base_url, img_url)
-            
-            # Method 5: Check for links in entry
-            if hasattr(entry, 'links'):
-                for link in entry.links:
-                    if isinstance(link, dict) and link.get('type', '').startswith('image/'):
-                        img_url = link.get('href', '')
-                        if img_url and img_url.startswith('http'):
-                            return img_url
+            # Method 3: Image links in entry
+            if entry.link_image:
+                return entry.link_image
             
         except Exception as e:
             logger.debug(f"Image extraction error: {e}")
@@ -612,7 +1507,28 @@ class ContentFetcher:
         
         return fallback_images['news']
     
-    def clean_html_content(self, html_content, max_length=2000):
+    def parse_html(self, html_content, max_chars, parsed=None):
+        """HTMLCleaner.parse, memoized per entry in parsed (fragment -> (max_chars, result))
+        
+        A cached parse is reused when it collected at least max_chars of text;
+        max_chars=0 asks only for the first image.
+        """
+        if parsed is None:
+            return HTMLCleaner.parse(html_content, max_chars)
+        
+        # Surrounding whitespace never changes the result, and get_entry_content strips it
+        html_content = html_content.strip()
+        cached = parsed.get(html_content)
+        if cached:
+            cached_chars, result = cached
+            if result.complete or max_chars <= cached_chars:
+                return result
+        
+        result = HTMLCleaner.parse(html_content, max_chars)
+        parsed[html_content] = (max_chars, result)
+        return result
+    
+    def clean_html_content(self, html_content, max_length=2000, parsed=None):
         """Clean HTML content to plain text with better handling"""
         if not html_content:
             return ""
@@ -632,33 +1548,9 @@ class ContentFetcher:
             
             html_content = str(html_content)
             
-            # Parse HTML with BeautifulSoup
-            soup = BeautifulSoup(html_content, 'html.parser')
-            
-            # Remove unwanted elements
-            unwanted_tags = ['script', 'style', 'iframe', 'nav', 'header', 'footer', 
-                           'aside', 'form', 'button', 'input', 'select', 'textarea']
-            
-            for tag in unwanted_tags:
-                for element in soup.find_all(tag):
-                    element.decompose()
-            
-            # Also remove divs with certain classes
-            unwanted_classes = ['advertisement', 'ad', 'sidebar', 'navigation', 
-                              'comments', 'share', 'related', 'promo']
-            
-            for cls in unwanted_classes:
-                for element in soup.find_all(class_=lambda x: x and cls in x.lower()):
-                    element.decompose()
-            
-            # Get text
-            text = soup.get_text(separator=' ', strip=True)
-            
-            # Decode HTML entities
-            text = html.unescape(text)
-            
-            # Clean up whitespace
-            text = ' '.join(text.split())
+            # One streaming pass: unwanted subtrees are skipped while parsing
+            # and parsing stops once there is more text than we keep
+            text = self.parse_html(html_content, max_length, parsed).text
             
             # Truncate if too long
             if len(text) > max_length:
@@ -689,57 +1581,21 @@ class ContentFetcher:
     
     def get_entry_content(self, entry):
         """Get content from entry with multiple fallbacks"""
-        # Define content extraction methods
-        content_extractors = [
-            # Try full content first
-            lambda: getattr(entry, 'content', None),
-            lambda: getattr(entry, 'content:encoded', None),
-            lambda: getattr(entry, 'content:encoded#html', None),
-            
-            # Then try summary/detail
-            lambda: (getattr(entry, 'summary_detail', None) and 
-                    (getattr(entry.summary_detail, 'value', None) or 
-                     str(entry.summary_detail))),
-            lambda: getattr(entry, 'summary', None),
-            
-            # Then description
-            lambda: getattr(entry, 'description', None),
-            
-            # Finally title
-            lambda: getattr(entry, 'title', 'No content available')
-        ]
-        
-        for extractor in content_extractors:
-            try:
-                content = extractor()
-                if content:
-                    # Handle different content types
-                    if isinstance(content, list):
-                        if len(content) > 0:
-                            if hasattr(content[0], 'value'):
-                                content = content[0].value
-                            else:
-                                content = str(content[0])
-                        else:
-                            continue
-                    elif isinstance(content, dict):
-                        content = content.get('value', '')
-                    
-                    content_str = str(content).strip()
-                    if content_str and len(content_str) > 50:
-                        return content_str
-            except:
-                continue
+        # Full content first, then the summary, finally the title
+        for content in (entry.content, entry.summary, entry.title):
+            content_str = content.strip()
+            if content_str and len(content_str) > 50:
+                return content_str
         
         return 'No content available'
     
     def get_entry_excerpt(self, content, max_length=200):
-        """Create excerpt from content"""
+        """Create excerpt from content already cleaned by clean_html_content"""
         if not content:
             return ""
         
-        # Clean the content
-        cleaned = self.clean_html_content(content, max_length * 3)
+        # Plain text already, only the part we might keep matters
+        cleaned = content[:max_length * 3]
         
         # Remove URLs and special characters
         cleaned = re.sub(r'https?://\S+|www\.\S+', '', cleaned)
@@ -790,61 +1646,30 @@ class ContentFetcher:
         
         return slug
     
-    def get_publication_date(self, entry):
-        """Get publication date from entry with multiple fallbacks"""
-        date_fields = [
-            ('published_parsed', lambda x: datetime(*x[:6]) if x else None),
-            ('updated_parsed', lambda x: datetime(*x[:6]) if x else None),
-            ('created_parsed', lambda x: datetime(*x[:6]) if x else None),
-            ('pubDate', lambda x: self.parse_date_string(x) if x else None),
-            ('published', lambda x: self.parse_date_string(x) if x else None),
-            ('dc:date', lambda x: self.parse_date_string(x) if x else None),
-        ]
-        
-        for field_name, parser in date_fields:
-            if hasattr(entry, field_name):
-                try:
-                    value = getattr(entry, field_name)
-                    if value:
-                        date_obj = parser(value)
-                        if date_obj:
-                            return date_obj
-                except:
-                    continue
+    def get_publication_date(self, published_at):
+        """Naive UTC datetime for posts.pub_date from an entry's epoch"""
+        if published_at is not None:
+            return datetime.fromtimestamp(published_at, timezone.utc).replace(tzinfo=None)
         
         # If no date found, use current time minus random hours (to simulate freshness)
         random_hours = random.randint(1, 72)
-        return datetime.now() - timedelta(hours=random_hours)
+        return datetime.now(timezone.utc).replace(tzinfo=None, microsecond=0) - timedelta(hours=random_hours)
     
-    def parse_date_string(self, date_str):
-        """Parse various date string formats"""
-        if not date_str:
-            return None
-        
-        date_formats = [
-            '%a, %d %b %Y %H:%M:%S %Z',
-            '%a, %d %b %Y %H:%M:%S %z',
-            '%Y-%m-%dT%H:%M:%S%z',
-            '%Y-%m-%d %H:%M:%S',
-            '%d %b %Y %H:%M:%S',
-            '%b %d, %Y %H:%M:%S',
-        ]
-        
-        for fmt in date_formats:
-            try:
-                return datetime.strptime(date_str.strip(), fmt)
-            except:
-                continue
+    def fetch_and_save(self, only_due=False):
+        """Fetch and save articles from sources with improved error handling
         
-        return None
-    
-    def fetch_and_save(self):
-        """Fetch and save articles from sources with improved error handling"""
+        only_due=True (the scheduler) polls just the sources whose adaptive
+        poll time has come; manual fetches poll everything.
+        """
         if self.is_fetching:
             logger.info("Already fetching, skipping...")
             return 0
+        if not self.lease.acquire():
+            logger.info("Fetch lease held by another process, skipping...")
+            return 0
         
         self.is_fetching = True
+        self.lease.set_fetching(True)
         total_saved = 0
         start_time = time.time()
         
@@ -854,132 +1679,57 @@ class ContentFetcher:
             logger.info("=" * 60)
             
             conn = get_db_connection()
+            run_id = self.start_fetch_run(conn, 'scheduled' if only_due else 'manual')
+            self.load_feed_cache(conn)
+            self.load_feed_profiles(conn)
+            self.load_source_health(conn)
+            self.load_poll_schedule(conn)
+            self.load_category_map(conn)
+            self.load_near_duplicate_index(conn)
+            
+            self.load_watermarks(conn)
             
             enabled_sources = [s for s in self.NEWS_SOURCES if s.get('enabled', True)]
-            logger.info(f"Processing {len(enabled_sources)} enabled sources")
+            due_sources = [s for s in enabled_sources
+                           if (not only_due or self.is_poll_due(s)) and self.breaker_allows(s)]
+            logger.info(f"Processing {len(due_sources)} of {len(enabled_sources)} enabled sources "
+                        f"({FlaskConfig.FETCH_ENGINE} engine, {FlaskConfig.FETCH_CYCLE_BUDGET_SECONDS}s budget)")
             
-            for source in enabled_sources:
-                source_start_time = time.time()
-                source_saved = 0
-                
+            # Downloads and parsing run elsewhere; this thread is the only DB writer
+            use_asyncio = FlaskConfig.FETCH_ENGINE == 'asyncio'
+            if use_asyncio:
                 try:
-                    logger.info(f"📡 Fetching from {source['name']} ({source['category']})...")
-                    
-                    # Fetch the feed
-                    feed = self.fetch_feed_with_proxy(source)
-                    
-                    if not feed or not hasattr(feed, 'entries') or len(feed.entries) == 0:
-                        logger.warning(f"  ❌ No entries from {source['name']}")
-                        
-                        # Add a backup article if no content
-                        if random.random() < 0.3:  # 30% chance to add backup
-                            self.add_backup_article(conn, source)
-                        
-                        continue
-                    
-                    logger.info(f"  📊 Found {len(feed.entries)} entries from {source['name']}")
-                    
-                    # Process articles
-                    max_articles = min(len(feed.entries), FlaskConfig.MAX_ARTICLES_PER_SOURCE)
-                    
-                    for i, entry in enumerate(feed.entries[:max_articles]):
-                        try:
-                            # Skip if entry is not a dict/object
-                            if not entry:
-                                continue
-                            
-                            # Get title (handle different entry formats)
-                            if isinstance(entry, dict):
-                                title = entry.get('title', '')
-                            else:
-                                title = getattr(entry, 'title', '')
-                            
-                            title = str(title).strip()
-                            if not title or len(title) < 10:
-                                continue
-                            
-                            # Get source URL
-                            if isinstance(entry, dict):
-                                source_url = entry.get('link', '') or entry.get('url', '')
-                            else:
-                                source_url = getattr(entry, 'link', '')
-                            
-                            source_url = str(source_url).strip()
-                            if not source_url or not source_url.startswith('http'):
-                                # Create placeholder URL
-                                slug = self.generate_slug(title, source['name'])
-                                source_url = f"{source['base_url']}/article/{slug}"
-                            
-                            # Generate unique slug
-                            slug = self.generate_slug(title, source['name'])
-                            
-                            # Check if article already exists
-                            existing = conn.execute(
-                                "SELECT id FROM posts WHERE slug = ? OR source_url = ?", 
-                                (slug, source_url)
-                            ).fetchone()
-                            
-                            if existing:
-                                if i < 3:  # Log only first few duplicates
-                                    logger.debug(f"    ⏭️  Skipping duplicate: {title[:50]}...")
-                                continue
-                            
-                            # Get content
-                            raw_content = self.get_entry_content(entry)
-                            content = self.clean_html_content(raw_content, 2500)
-                            
-                            if not content or len(content) < 100:
-                                # Create minimal content
-                                content = f"{title}. Read the full article on {source['name']}."
-                            
-                            # Create excerpt
-                            excerpt = self.get_entry_excerpt(content, 250)
-                            if not excerpt or len(excerpt) < 50:
-                                excerpt = title[:200] + '...'
-                            
-                            # Get image
-                            if isinstance(entry, dict):
-                                # For dict entries, try to get image from dict
-                                image_url = entry.get('image', '') or entry.get('thumbnail', '')
-                                if not image_url:
-                                    image_url = self.extract_image_from_entry(entry, source.get('base_url', source_url))
-                            else:
-                                image_url = self.extract_image_from_entry(entry, source.get('base_url', source_url))
-                            
-                            # Get category ID
-                            cat_row = conn.execute(
-                                "SELECT id FROM categories WHERE slug = ?", 
-                                (source['category'],)
-                            ).fetchone()
-                            category_id = cat_row[0] if cat_row else 1
-                            
-                            # Get publication date
-                            pub_date = self.get_publication_date(entry)
-                            
-                            # Insert the article
-                            conn.execute('''INSERT INTO posts 
-                                (title, slug, content, excerpt, image_url, source_url, 
-                                 category_id, category, source_name, views, is_published, 
-                                 pub_date, created_at, updated_at)
-                                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)''',
-                                (title, slug, content, excerpt, image_url, source_url,
-                                 category_id, source['category'], source['name'], 
-                                 random.randint(10, 500), pub_date))
-                            
-                            source_saved += 1
-                            total_saved += 1
-                            
-                            if source_saved <= 3:
-                                logger.info(f"    ✅ Saved: {title[:60]}...")
-                            
-                        except sqlite3.IntegrityError as ie:
-                            # Duplicate entry, skip
-                            continue
-                        except Exception as e:
-                            logger.debug(f"    Article processing error: {str(e)[:80]}")
-                            continue
-                    
-                    source_time = time.time() - source_start_time
+                    # Optional, and loaded by the first asyncio cycle rather than at import
+                    import aiohttp  # noqa: F401
+                except ImportError:
+                    logger.warning("aiohttp not installed, falling back to threaded fetch")
+                    use_asyncio = False
+            if use_asyncio:
+                fetched_feeds = self.fetch_feeds_async(due_sources)
+            else:
+                fetched_feeds = self.fetch_feeds_concurrently(due_sources)
+            
+            # Each source is written in its own short transaction, so the write
+            # lock is never held while other sources are still downloading
+            for source, feed, articles, source_time in fetched_feeds:
+                if not self.lease.is_leader():
+                    # Another process took over; leave the remaining writes to it
+                    logger.warning("⚠️ Lost the fetch lease, not saving the remaining sources")
+                    break
+                try:
+                    source_saved = self.save_source_entries(conn, source, feed, articles)
+                    self.save_watermark(conn, source, articles)
+                    self.save_feed_cache(conn, source)
+                    self.save_feed_profile(conn, source)
+                    succeeded = getattr(feed, 'not_modified', False) or bool(
+                        feed and hasattr(feed, 'entries') and len(feed.entries) > 0)
+                    self.record_source_health(conn, source, succeeded)
+                    self.update_poll_schedule(conn, source, source_saved, succeeded)
+                    status = 'unchanged' if getattr(feed, 'not_modified', False) else 'ok' if succeeded else 'failed'
+                    self.save_source_run(conn, run_id, source, status, source_time)
+                    conn.commit()
+                    self.index_saved_signatures(source)
+                    total_saved += source_saved
                     
                     if source_saved > 0:
                         logger.info(f"✅ {source['name']}: Saved {source_saved} new articles ({source_time:.1f}s)")
@@ -987,10 +1737,18 @@ class ContentFetcher:
                         logger.info(f"ℹ️ {source['name']}: No new articles ({source_time:.1f}s)")
                     
                 except Exception as e:
+                    conn.rollback()
+                    self.pending_signatures.pop(source['name'], None)
                     logger.error(f"❌ Source {source['name']} failed: {str(e)[:100]}")
+                    try:
+                        self.get_trace(source).error(e)
+                        self.save_source_run(conn, run_id, source, 'error', source_time)
+                        conn.commit()
+                    except sqlite3.Error:
+                        conn.rollback()
                     continue
             
-            conn.commit()
+            self.finish_fetch_run(conn, run_id, start_time)
             conn.close()
             
             self.last_fetch_time = datetime.now()
@@ -1015,74 +1773,542 @@ class ContentFetcher:
             return 0
         finally:
             self.is_fetching = False
+            self.lease.set_fetching(False)
+            # Error paths above may leave the connection checked out mid-transaction
+            db_pool.release()
     
-    def add_backup_article(self, conn, source):
-        """Add a backup article when no content is available"""
+    def fetch_feeds_concurrently(self, sources, max_workers=None, budget_seconds=None):
+        """Download and parse feeds in a bounded thread pool.
+        
+        Yields (source, feed, articles, seconds) in completion order. Sources still
+        running when the cycle budget runs out are abandoned and retried
+        next cycle.
+        """
+        max_workers = max(1, min(max_workers or FlaskConfig.FETCH_WORKERS, len(sources) or 1))
+        budget_seconds = budget_seconds or FlaskConfig.FETCH_CYCLE_BUDGET_SECONDS
+        
+        # Workers write into this run's cycle even if they outlive its budget
+        cycle = self.cycle
+        
+        def timed_fetch(source):
+            started = time.time()
+            logger.info(f"📡 Fetching from {source['name']} ({source['category']})...")
+            feed = self.fetch_feed_with_proxy(source, cycle)
+            articles = self.collect_articles(source, feed, cycle)
+            return feed, articles, time.time() - started
+        
+        pool = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='feed-fetch')
+        futures = {pool.submit(timed_fetch, source): source for source in sources}
+        
         try:
-            backup_titles = [
-                f"Latest updates from {source['name']}",
-                f"Breaking news from {source['category'].title()} sector",
-                f"Important developments in South African {source['category']}",
-                f"{source['name']} brings you the latest insights",
-                f"Stay informed with {source['name']}'s coverage",
-            ]
-            
-            title = random.choice(backup_titles)
-            slug = self.generate_slug(title, source['name'])
-            
-            # Check if already exists
-            existing = conn.execute(
-                "SELECT id FROM posts WHERE slug = ?", 
-                (slug,)
-            ).fetchone()
-            
-            if existing:
-                return
-            
-            content = f"This is a summary of the latest news from {source['name']}. For full details, visit {source['base_url']}."
-            excerpt = content[:200] + '...'
-            image_url = self.get_fallback_image(source['category'])
-            
-            # Get category ID
-            cat_row = conn.execute(
-                "SELECT id FROM categories WHERE slug = ?", 
-                (source['category'],)
-            ).fetchone()
-            category_id = cat_row[0] if cat_row else 1
-            
-            conn.execute('''INSERT INTO posts 
-                (title, slug, content, excerpt, image_url, source_url, 
-                 category_id, category, source_name, views, is_published, 
-                 pub_date, created_at, updated_at)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)''',
-                (title, slug, content, excerpt, image_url, source['base_url'],
-                 category_id, source['category'], source['name'], 
-                 random.randint(5, 50),))
+            for future in as_completed(futures, timeout=budget_seconds):
+                source = futures[future]
+                try:
+                    feed, articles, source_time = future.result()
+                except Exception as e:
+                    logger.error(f"❌ Source {source['name']} failed: {str(e)[:100]}")
+                    cycle.trace(source['name']).error(e)
+                    feed, articles, source_time = None, [], 0.0
+                yield source, feed, articles, source_time
+        except FuturesTimeoutError:
+            pending = [futures[f]['name'] for f in futures if not f.done()]
+            logger.warning(f"⏱️  Fetch budget of {budget_seconds}s exhausted, skipping: {', '.join(pending)}")
+        finally:
+            # Don't block the writer on stragglers; their results are discarded
+            pool.shutdown(wait=False, cancel_futures=True)
+    
+    def fetch_feeds_async(self, sources, budget_seconds=None):
+        """Download every source on a single asyncio event loop.
+        
+        Yields (source, feed, articles, seconds) like fetch_feeds_concurrently. All URL
+        variations of a source are requested together and the first one that
+        parses to entries wins; the others are cancelled.
+        """
+        budget_seconds = budget_seconds or FlaskConfig.FETCH_CYCLE_BUDGET_SECONDS
+        results = asyncio.run(self._fetch_all_async(sources, budget_seconds))
+        
+        for source, feed, articles, source_time in sorted(results, key=lambda r: r[3]):
+            yield source, feed, articles, source_time
+    
+    async def _fetch_all_async(self, sources, budget_seconds):
+        """Run all source downloads under one global deadline"""
+        import aiohttp
+        
+        connector = aiohttp.TCPConnector(
+            limit=FlaskConfig.FETCH_MAX_CONNECTIONS,
+            limit_per_host=FlaskConfig.FETCH_PER_HOST_LIMIT,
+            ssl=False
+        )
+        timeout = aiohttp.ClientTimeout(total=15, sock_connect=3.05)
+        results = []
+        cycle = self.cycle
+        
+        # Parsing gets a bounded pool of its own: work left running by cancelled
+        # variations can't pile up, and the cycle ends without waiting for it
+        executor = ThreadPoolExecutor(max_workers=FlaskConfig.FETCH_WORKERS, thread_name_prefix='feed-parse')
+        try:
+            async with aiohttp.ClientSession(connector=connector, timeout=timeout) as session:
+                tasks = {asyncio.ensure_future(self._fetch_source_async(session, source, executor, cycle)): source
+                         for source in sources}
+                if not tasks:
+                    return results
+                
+                done, pending = await asyncio.wait(tasks, timeout=budget_seconds)
+                
+                if pending:
+                    skipped = [tasks[task]['name'] for task in pending]
+                    logger.warning(f"⏱️  Fetch budget of {budget_seconds}s exhausted, skipping: {', '.join(skipped)}")
+                    for task in pending:
+                        task.cancel()
+                    await asyncio.gather(*pending, return_exceptions=True)
+                
+                for task in done:
+                    source = tasks[task]
+                    if task.exception():
+                        logger.error(f"❌ Source {source['name']} failed: {str(task.exception())[:100]}")
+                        cycle.trace(source['name']).error(task.exception())
+                        results.append((source, None, [], 0.0))
+                        continue
+                    feed, articles, source_time = task.result()
+                    results.append((source, feed, articles, source_time))
+        finally:
+            executor.shutdown(wait=False, cancel_futures=True)
+        
+        return results
+    
+    async def _fetch_source_async(self, session, source, executor, cycle):
+        """Race a source's URL variations, then fall back to the homepage scrape"""
+        import aiohttp
+        
+        started = time.time()
+        loop = asyncio.get_running_loop()
+        headers = self.build_request_headers(source)
+        trace = cycle.trace(source['name'])
+        
+        logger.info(f"📡 Fetching from {source['name']} ({source['category']})...")
+        
+        async def try_url(feed_url):
+            request_headers = self.conditional_headers(feed_url, headers)
+            connect_started = time.perf_counter()
+            async with session.get(feed_url, headers=request_headers, allow_redirects=True) as response:
+                trace.add('connect', time.perf_counter() - connect_started)
+                logger.info(f"Response from {source['name']} ({feed_url}): {response.status}")
+                if response.status == 304:
+                    logger.info(f"Feed unchanged since last fetch: {feed_url}")
+                    return UnchangedFeed()
+                if response.status != 200:
+                    return None
+                
+                # expat only sees one chunk at a time, cheap enough for the loop
+                stream = self.new_feed_stream(source, strategy)
+                read_started = time.perf_counter()
+                try:
+                    async for chunk in response.content.iter_chunked(64 * 1024):
+                        if stream.feed(chunk):
+                            break
+                finally:
+                    trace.record_stream(stream, time.perf_counter() - read_started)
+                response_headers = response.headers
             
-            logger.info(f"    🔧 Added backup article for {source['name']}")
+            # Fallback parsing is CPU-bound, keep it off the event loop
+            with trace.span('parse'):
+                feed = await loop.run_in_executor(executor, self.finish_feed_stream,
+                                                  source, feed_url, stream, response_headers, strategy)
+            if getattr(feed, 'not_modified', False):
+                return feed
+            if feed and hasattr(feed, 'entries') and len(feed.entries) > 0:
+                logger.info(f"Successfully parsed {len(feed.entries)} entries from {feed_url}")
+                return feed
             
+            logger.warning(f"No entries found in {feed_url}")
+            return None
+        
+        profile = self.get_feed_profile(source)
+        url_variations, allow_scrape = self.get_profile_plan(source, profile)
+        strategy = profile['strategy'] if profile else 'feedparser'
+        
+        attempts = {asyncio.ensure_future(try_url(url)): url for url in url_variations}
+        feed = None
+        successful_url = None
+        
+        try:
+            pending = set(attempts)
+            while pending and not feed:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for attempt in done:
+                    try:
+                        feed = attempt.result()
+                    except (aiohttp.ClientError, asyncio.TimeoutError) as req_err:
+                        logger.warning(f"Failed to fetch {attempts[attempt]}: {req_err}")
+                        trace.error(f"{attempts[attempt]}: {req_err or type(req_err).__name__}")
+                        continue
+                    except Exception as e:
+                        logger.warning(f"Error processing {attempts[attempt]}: {e}")
+                        trace.error(f"{attempts[attempt]}: {e}")
+                        continue
+                    
+                    if feed:
+                        successful_url = attempts[attempt]
+                        break
+        finally:
+            # First usable variation wins, drop the rest
+            for attempt in attempts:
+                attempt.cancel()
+            await asyncio.gather(*attempts, return_exceptions=True)
+        
+        # If all URL variations failed, try a web scrape as last resort
+        if not feed and allow_scrape:
+            logger.info(f"All RSS feeds failed, trying web scrape for {source['name']}")
+            try:
+                download_started = time.perf_counter()
+                async with session.get(source['base_url'], headers=headers) as response:
+                    if response.status == 200:
+                        body = await response.read()
+                        trace.add('download', time.perf_counter() - download_started)
+                        trace.count('bytes', len(body))
+                        with trace.span('parse'):
+                            feed = await loop.run_in_executor(executor, self.scrape_articles, source, body)
+                        successful_url = source['base_url']
+            except Exception as scrape_error:
+                logger.error(f"Web scrape failed for {source['name']}: {scrape_error}")
+                trace.error(f"Scrape: {scrape_error}")
+        
+        self.remember_feed_validators(source, feed, cycle)
+        self.record_feed_resolution(source, profile, feed, successful_url, cycle)
+        articles = await loop.run_in_executor(executor, self.collect_articles, source, feed, cycle)
+        return feed, articles, time.time() - started
+    
+    def get_normalize_pool(self):
+        """Process pool for normalize_entries, or None to normalize in the calling thread"""
+        if FlaskConfig.NORMALIZE_PROCESSES <= 0:
+            return None
+        
+        with self.normalize_pool_lock:
+            if self.normalize_pool is None:
+                # Never fork: this process runs fetch and heartbeat threads and
+                # holds SQLite connections. Workers import app afresh instead
+                start_method = 'forkserver' if 'forkserver' in multiprocessing.get_all_start_methods() else 'spawn'
+                self.normalize_pool = ProcessPoolExecutor(
+                    max_workers=FlaskConfig.NORMALIZE_PROCESSES,
+                    mp_context=multiprocessing.get_context(start_method)
+                )
+                logger.info(f"Normalizing entries in {FlaskConfig.NORMALIZE_PROCESSES} worker processes")
+            return self.normalize_pool
+    
+    def collect_articles(self, source, feed, cycle=None):
+        """normalize_entries off the GIL in the process pool when one is configured
+        
+        Only the entries that will be used cross the process boundary, and
+        plain article dicts come back. Any pool failure falls back to
+        normalizing in this thread.
+        """
+        trace = (cycle or self.cycle).trace(source['name'])
+        pool = self.get_normalize_pool()
+        if pool is None or getattr(feed, 'not_modified', False) or not getattr(feed, 'entries', None):
+            return self.normalize_entries(source, feed, trace=trace)
+        
+        entries = list(feed.entries[:FlaskConfig.MAX_ARTICLES_PER_SOURCE])
+        try:
+            articles, spans, errors = pool.submit(
+                normalize_entries_in_process, source, entries,
+                getattr(feed, 'strategy', 'feedparser'), self.get_watermark(source)).result()
+            trace.merge(spans, errors)
+            return articles
         except Exception as e:
-            logger.debug(f"Backup article error: {e}")
+            logger.warning(f"Process pool normalization failed for {source['name']}, "
+                           f"normalizing in thread: {str(e)[:100]}")
+            with self.normalize_pool_lock:
+                if self.normalize_pool is pool:
+                    pool.shutdown(wait=False, cancel_futures=True)
+                    self.normalize_pool = None
+            return self.normalize_entries(source, feed, trace=trace)
+    
+    def normalize_entries(self, source, feed, watermark=None, trace=None):
+        """Collect phase: turn feed entries into insert-ready article dicts.
+        
+        Runs in the fetch workers and never touches the database, so no
+        SQLite lock is held while feeds are still downloading. Iteration
+        stops at the first entry the source's high-water mark has already
+        seen; scraped homepages are not in date order, so there seen
+        entries are only skipped. Clean and image time go to trace.
+        """
+        articles = []
+        
+        if getattr(feed, 'not_modified', False) or not feed or not hasattr(feed, 'entries'):
+            return articles
+        
+        if trace is None:
+            trace = self.get_trace(source)
+        
+        if watermark is None:
+            watermark = self.get_watermark(source)
+        stop_at_seen = getattr(feed, 'strategy', 'feedparser') != 'scrape'
+        seen_in_a_row = 0
+        
+        # Process articles
+        max_articles = min(len(feed.entries), FlaskConfig.MAX_ARTICLES_PER_SOURCE)
+        
+        for entry in feed.entries[:max_articles]:
+            try:
+                if self.is_entry_seen(watermark, entry):
+                    seen_in_a_row += 1
+                    if stop_at_seen and seen_in_a_row >= FlaskConfig.FEED_STOP_AFTER_SEEN:
+                        break
+                    continue
+                seen_in_a_row = 0
+                
+                title = entry.title.strip()
+                if not title or len(title) < 10:
+                    continue
+                
+                source_url = entry.link.strip()
+                if not source_url or not source_url.startswith('http'):
+                    # Create placeholder URL, stable across cycles so it still dedupes
+                    title_hash = hashlib.md5(title.encode()).hexdigest()[:10]
+                    source_url = f"{source['base_url']}/article/{title_hash}"
+                
+                # Generate unique slug
+                slug = self.generate_slug(title, source['name'])
+                
+                # Every HTML fragment of the entry is parsed once; text and
+                # first image both come from that parse
+                parsed = {}
+                
+                with trace.span('clean'):
+                    # Get content
+                    raw_content = self.get_entry_content(entry)
+                    content = self.clean_html_content(raw_content, 2500, parsed)
+                    
+                    if not content or len(content) < 100:
+                        # Create minimal content
+                        content = f"{title}. Read the full article on {source['name']}."
+                    
+                    # Create excerpt
+                    excerpt = self.get_entry_excerpt(content, 250)
+                    if not excerpt or len(excerpt) < 50:
+                        excerpt = title[:200] + '...'
+                
+                # Get image
+                with trace.span('image'):
+                    image_url = self.extract_image_from_entry(entry, source.get('base_url', source_url), parsed)
+                
+                articles.append({
+                    'title': title,
+                    'slug': slug,
+                    'canonical_url': ContentIdentity.canonical_url(source_url),
+                    'title_fingerprint': ContentIdentity.title_fingerprint(title, source['name']),
+                    'content': content,
+                    'excerpt': excerpt,
+                    'image_url': image_url,
+                    'source_url': source_url,
+                    'pub_date': self.get_publication_date(entry.published_at),
+                    'guids': self.entry_guids(entry),
+                    'published_at': entry.published_at,
+                    'simhash': SimHash.signature(title, content)
+                })
+                
+            except Exception as e:
+                logger.debug(f"    Article processing error: {str(e)[:80]}")
+                trace.error(f"Entry: {e}")
+                continue
+        
+        return articles
+    
+    def load_category_map(self, conn):
+        """Cache category slug -> id for the writer"""
+        rows = conn.execute("SELECT id, slug FROM categories").fetchall()
+        self.category_ids = {row['slug']: row['id'] for row in rows}
+    
+    def load_near_duplicate_index(self, conn):
+        """Fill the SimHash index from the most recent posts, once per lease term
+        
+        Posts written by another process while it held the lease never went
+        through this index, so it is rebuilt whenever leadership comes back.
+        """
+        if self.near_duplicates.loaded and self.near_duplicates_term == self.lease.term:
+            return
+        self.near_duplicates = NearDuplicateIndex(FlaskConfig.NEAR_DUPLICATE_WINDOW,
+                                                  FlaskConfig.NEAR_DUPLICATE_MAX_DISTANCE)
+        self.pending_signatures = {}
+        rows = conn.execute(
+            "SELECT id, simhash, source_name FROM posts WHERE simhash IS NOT NULL ORDER BY id DESC LIMIT ?",
+            (FlaskConfig.NEAR_DUPLICATE_WINDOW,)
+        ).fetchall()
+        for row in reversed(rows):
+            self.near_duplicates.add(row['id'], SimHash.from_db(row['simhash']), row['source_name'])
+        self.near_duplicates.loaded = True
+        self.near_duplicates_term = self.lease.term
+        logger.info(f"Near-duplicate index: {len(self.near_duplicates)} recent posts")
+    
+    def index_saved_signatures(self, source):
+        """Add a committed source's new posts to the SimHash index"""
+        for post_id, signature in self.pending_signatures.pop(source['name'], []):
+            self.near_duplicates.add(post_id, signature, source['name'])
+    
+    def find_existing_articles(self, conn, articles, chunk_size=400):
+        """Canonical URLs and title fingerprints from a batch that are already stored
+        
+        URLs already linked as another post's near-duplicate count as stored too.
+        """
+        known_urls, known_fingerprints = set(), set()
+        
+        # Chunked to stay under SQLite's 999 bound-parameter limit
+        for start in range(0, len(articles), chunk_size):
+            chunk = articles[start:start + chunk_size]
+            urls = [article['canonical_url'] for article in chunk]
+            fingerprints = [article['title_fingerprint'] for article in chunk]
+            rows = conn.execute(
+                f"SELECT canonical_url, title_fingerprint FROM posts "
+                f"WHERE canonical_url IN ({','.join('?' * len(urls))}) "
+                f"OR title_fingerprint IN ({','.join('?' * len(fingerprints))})",
+                urls + fingerprints
+            ).fetchall()
+            for row in rows:
+                known_urls.add(row['canonical_url'])
+                known_fingerprints.add(row['title_fingerprint'])
+            
+            rows = conn.execute(
+                f"SELECT canonical_url FROM post_duplicates WHERE canonical_url IN ({','.join('?' * len(urls))})",
+                urls
+            ).fetchall()
+            known_urls.update(row['canonical_url'] for row in rows)
+        
+        return known_urls, known_fingerprints
+    
+    def save_source_entries(self, conn, source, feed, articles):
+        """Write phase: insert one source's normalized articles, returns number saved"""
+        if getattr(feed, 'not_modified', False):
+            logger.info(f"  💤 {source['name']} feed unchanged, skipping parse")
+            return 0
+        
+        if not feed or not hasattr(feed, 'entries') or len(feed.entries) == 0:
+            logger.warning(f"  ❌ No entries from {source['name']}")
+            return 0
+        
+        logger.info(f"  📊 Found {len(feed.entries)} entries from {source['name']}")
+        
+        category_id = self.category_ids.get(source['category'], 1)
+        trace = self.get_trace(source)
+        trace.count('entries_seen', len(feed.entries))
+        dedupe_started = time.perf_counter()
+        
+        # One indexed lookup for the whole batch: same canonical URL or same
+        # normalized title from this source means we already have the article
+        known_urls, known_fingerprints = self.find_existing_articles(conn, articles)
+        
+        new_articles = []
+        for article in articles:
+            if article['canonical_url'] in known_urls or article['title_fingerprint'] in known_fingerprints:
+                continue
+            # Feeds sometimes list the same story twice
+            known_urls.add(article['canonical_url'])
+            known_fingerprints.add(article['title_fingerprint'])
+            new_articles.append(article)
+        
+        if len(new_articles) < len(articles):
+            logger.debug(f"    ⏭️  Skipping {len(articles) - len(new_articles)} duplicates")
+        
+        # Same story from another source, usually a wire copy: link it to the
+        # post we already have instead of adding a row. Matches within this
+        # source are left alone, feeds reuse templated bodies for distinct stories
+        distinct_articles, links = [], []
+        for article in new_articles:
+            signature = article['simhash']
+            match = self.near_duplicates.find(signature, exclude_source=source['name']) if signature else None
+            if match:
+                links.append((match[0], source['name'], article['title'], article['source_url'],
+                              article['canonical_url'], match[1]))
+            else:
+                distinct_articles.append(article)
+        
+        if links:
+            conn.executemany('''INSERT OR IGNORE INTO post_duplicates 
+                (post_id, source_name, title, source_url, canonical_url, distance)
+                VALUES (?, ?, ?, ?, ?, ?)''', links)
+            logger.info(f"    🔗 Linked {len(links)} near-duplicates to existing posts")
+        
+        trace.add('dedupe', time.perf_counter() - dedupe_started)
+        new_articles = distinct_articles
+        if not new_articles:
+            return 0
+        
+        insert_started = time.perf_counter()
+        # Listings sort on published_at: undated entries sort as just ingested,
+        # and future-dated ones cannot pin themselves to the top
+        now = int(time.time())
+        # rowcount, not total_changes: the counter triggers' writes would count too
+        inserted = conn.executemany('''INSERT OR IGNORE INTO posts 
+            (title, slug, content, excerpt, image_url, source_url, 
+             category_id, category, source_name, views, is_published, 
+             pub_date, published_at, canonical_url, title_fingerprint, simhash, simhash_version, created_at, updated_at)
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, 1, ?, ?, ?, ?, ?, ?, CURRENT_TIMESTAMP, CURRENT_TIMESTAMP)''',
+            [(article['title'], article['slug'], article['content'], article['excerpt'],
+              article['image_url'], article['source_url'],
+              category_id, source['category'], source['name'], 
+              random.randint(10, 500), article['pub_date'], min(article['published_at'] or now, now),
+              article['canonical_url'], article['title_fingerprint'], SimHash.to_db(article['simhash']),
+              SIGNATURE_VERSION)
+             for article in new_articles])
+        source_saved = inserted.rowcount
+        
+        # Ids of the rows just written, indexed once the source commits
+        signatures = {article['canonical_url']: article['simhash'] for article in new_articles if article['simhash']}
+        urls = list(signatures)
+        for start in range(0, len(urls), 400):
+            chunk = urls[start:start + 400]
+            rows = conn.execute(
+                f"SELECT id, canonical_url FROM posts WHERE canonical_url IN ({','.join('?' * len(chunk))})",
+                chunk
+            ).fetchall()
+            self.pending_signatures.setdefault(source['name'], []).extend(
+                (row['id'], signatures[row['canonical_url']]) for row in rows)
+        
+        trace.add('insert', time.perf_counter() - insert_started)
+        trace.count('entries_new', source_saved)
+        
+        for article in new_articles[:3]:
+            logger.info(f"    ✅ Saved: {article['title'][:60]}...")
+        
+        return source_saved
+
+# ContentFetcher used by normalize_entries_in_process inside a pool worker
+_process_fetcher = None
+
+def normalize_entries_in_process(source, entries, strategy, watermark):
+    """Process pool entry point: normalize one source's entries in a worker process
+    
+    Returns (articles, spans, errors); the parent merges the spans into its trace.
+    """
+    global _process_fetcher
+    if _process_fetcher is None:
+        _process_fetcher = ContentFetcher()
+    feed = MinimalFeed()
+    feed.entries = entries
+    feed.strategy = strategy
+    trace = SourceTrace(source['name'])
+    articles = _process_fetcher.normalize_entries(source, feed, watermark, trace)
+    return articles, trace.spans, trace.counters['errors']
 
 # ============= FLASK APP =============
+# Importing this module does no network I/O and starts no threads: the
+# schema, cache warm-up and fetching all run in start_background_tasks()
 app = Flask(__name__)
 app.config.from_object(FlaskConfig)
 
-print("=" * 60)
-print("🇿🇦 MZANSI INSIGHTS - NEWS AGGREGATOR")
-print("=" * 60)
-
-# Setup database
-db_setup_success = setup_database()
-
-# Initialize fetcher
+# Initialize fetcher (no I/O until a fetch runs)
 fetcher = ContentFetcher()
 
-# Test fetch on startup
-print("🚀 Testing fetch on startup...")
-initial_fetched = fetcher.fetch_and_save()
-print(f"✅ Initial fetch: {initial_fetched} articles")
-print(f"⏰ Next fetch in: {FlaskConfig.UPDATE_INTERVAL_MINUTES} minutes")
+# Readiness of this process, filled in by warm_up()
+boot_state = {
+    'database': False,
+    'caches': False,
+    'app_created_at': None,
+    'ready_at': None,
+    'first_request_at': None,
+    'error': None
+}
+_background_pid = None
+_background_lock = threading.Lock()
 
 login_manager = LoginManager()
 login_manager.init_app(app)
@@ -1120,7 +2346,8 @@ def get_time_ago(date_str):
         else:
             return "Recently"
         
-        diff = datetime.now() - post_date
+        # Stored dates are UTC (pub_date from feeds, created_at from SQLite)
+        diff = datetime.now(timezone.utc).replace(tzinfo=None) - post_date
         
         if diff.days > 365:
             years = diff.days // 365
@@ -1154,36 +2381,8 @@ def prepare_post(post_row):
         slug = post.get('slug', '')
         post['source_url'] = f"https://www.{source_name}.co.za/news/{slug}"
     
-    # Get category info
-    try:
-        conn = get_db_connection()
-        category = conn.execute(
-            "SELECT * FROM categories WHERE id = ?", 
-            (post.get('category_id', 1),)
-        ).fetchone()
-        conn.close()
-        
-        if category:
-            post['category_ref'] = {
-                'name': category['name'],
-                'slug': category['slug'],
-                'icon': category['icon'],
-                'color': category['color']
-            }
-        else:
-            post['category_ref'] = {
-                'name': 'News',
-                'slug': 'news',
-                'icon': 'newspaper',
-                'color': '#4361ee'
-            }
-    except:
-        post['category_ref'] = {
-            'name': 'News',
-            'slug': 'news',
-            'icon': 'newspaper',
-            'color': '#4361ee'
-        }
+    # From the in-memory registry: a listing costs no query per post
+    post['category_ref'] = category_registry.get(post.get('category_id', 1))
     
     return post
 
@@ -1191,23 +2390,34 @@ def get_categories_with_counts():
     """Get all categories with post counts"""
     try:
         conn = get_db_connection()
-        categories = []
-        cat_rows = conn.execute("SELECT * FROM categories ORDER BY name").fetchall()
-        
-        for cat in cat_rows:
-            cat_dict = dict(cat)
-            count = conn.execute(
-                "SELECT COUNT(*) FROM posts WHERE category_id = ? AND is_published = 1", 
-                (cat_dict['id'],)
-            ).fetchone()[0]
-            cat_dict['post_count'] = count
-            categories.append(cat_dict)
-        
+        rows = conn.execute(
+            "SELECT c.*, COALESCE(pc.post_count, 0) AS post_count FROM categories c "
+            "LEFT JOIN category_post_counts pc ON pc.category_id = c.id ORDER BY c.name"
+        ).fetchall()
         conn.close()
-        return categories
+        return [dict(row) for row in rows]
     except:
         return []
 
+def get_last_fetch_run(conn):
+    """(finished_at, new entries) of the last completed fetch run, shared by all workers"""
+    row = conn.execute(
+        "SELECT finished_at, entries_new FROM fetch_runs WHERE finished_at IS NOT NULL ORDER BY id DESC LIMIT 1"
+    ).fetchone()
+    if row:
+        return datetime.strptime(row['finished_at'], '%Y-%m-%d %H:%M:%S'), row['entries_new']
+    return fetcher.last_fetch_time, fetcher.last_fetch_count
+
+def get_fetch_status(conn):
+    """Leader lease state and time to the next scheduled fetch, the same in every worker"""
+    status = fetcher.lease.status()
+    if not status['is_leader']:
+        # A follower's schedule is never loaded by a fetch, read the leader's
+        fetcher.load_poll_schedule(conn)
+        fetcher.load_source_health(conn)
+    status['next_fetch_in_minutes'] = round(fetcher.seconds_until_next_poll() / 60)
+    return status
+
 # ============= ALL ROUTES =============
 @app.route('/')
 def index():
@@ -1217,19 +2427,19 @@ def index():
         
         # Featured/Latest post
         featured_raw = conn.execute(
-            "SELECT * FROM posts WHERE is_published = 1 ORDER BY created_at DESC LIMIT 1"
+            "SELECT * FROM posts WHERE is_published = 1 ORDER BY published_at DESC LIMIT 1"
         ).fetchone()
         featured = prepare_post(featured_raw) if featured_raw else None
         
         # Latest posts
         if featured:
             posts_raw = conn.execute(
-                "SELECT * FROM posts WHERE is_published = 1 AND id != ? ORDER BY created_at DESC LIMIT 12",
+                "SELECT * FROM posts WHERE is_published = 1 AND id != ? ORDER BY published_at DESC LIMIT 12",
                 (featured['id'],)
             ).fetchall()
         else:
             posts_raw = conn.execute(
-                "SELECT * FROM posts WHERE is_published = 1 ORDER BY created_at DESC LIMIT 12"
+                "SELECT * FROM posts WHERE is_published = 1 ORDER BY published_at DESC LIMIT 12"
             ).fetchall()
         
         posts = [prepare_post(row) for row in posts_raw]
@@ -1279,7 +2489,7 @@ def category_page(category_slug):
         
         # Get posts for this category
         posts_raw = conn.execute(
-            "SELECT * FROM posts WHERE category_id = ? AND is_published = 1 ORDER BY created_at DESC LIMIT 50",
+            "SELECT * FROM posts WHERE category_id = ? AND is_published = 1 ORDER BY published_at DESC LIMIT 50",
             (category['id'],)
         ).fetchall()
         posts = [prepare_post(row) for row in posts_raw]
@@ -1321,7 +2531,7 @@ def post_detail(slug):
         
         # Get related posts
         related_raw = conn.execute(
-            "SELECT * FROM posts WHERE category_id = ? AND slug != ? AND is_published = 1 ORDER BY created_at DESC LIMIT 4",
+            "SELECT * FROM posts WHERE category_id = ? AND slug != ? AND is_published = 1 ORDER BY published_at DESC LIMIT 4",
             (post['category_id'], slug)
         ).fetchall()
         related_posts = [prepare_post(row) for row in related_raw]
@@ -1350,7 +2560,7 @@ def search():
         if query and len(query) >= 2:
             search_term = f'%{query}%'
             posts_raw = conn.execute(
-                "SELECT * FROM posts WHERE (title LIKE ? OR content LIKE ? OR excerpt LIKE ?) AND is_published = 1 ORDER BY created_at DESC LIMIT 30",
+                "SELECT * FROM posts WHERE (title LIKE ? OR content LIKE ? OR excerpt LIKE ?) AND is_published = 1 ORDER BY published_at DESC LIMIT 30",
                 (search_term, search_term, search_term)
             ).fetchall()
             posts = [prepare_post(row) for row in posts_raw]
@@ -1380,14 +2590,12 @@ def sources():
         conn = get_db_connection()
         
         # Get sources with counts
+        article_counts = {row['source_name']: row['post_count']
+                          for row in conn.execute("SELECT source_name, post_count FROM source_post_counts")}
         sources_list = []
         for source in fetcher.NEWS_SOURCES:
             if source.get('enabled', True):
-                count_row = conn.execute(
-                    "SELECT COUNT(*) FROM posts WHERE source_name = ? AND is_published = 1", 
-                    (source['name'],)
-                ).fetchone()
-                article_count = count_row[0] if count_row else 0
+                article_count = article_counts.get(source['name'], 0)
                 
                 sources_list.append({
                     'name': source['name'],
@@ -1463,7 +2671,7 @@ def live_news():
                FROM posts p 
                LEFT JOIN categories c ON p.category_id = c.id 
                WHERE p.is_published = 1 
-               ORDER BY p.created_at DESC 
+               ORDER BY p.published_at DESC 
                LIMIT 10"""
         ).fetchall()
         conn.close()
@@ -1500,15 +2708,42 @@ def live_news():
             'message': str(e)
         })
 
+@app.route('/ready')
+def ready():
+    """Readiness probe: 200 once the schema is set up and caches are warm, 503 before"""
+    is_ready = boot_state['database'] and boot_state['caches']
+
+    def since_boot(moment):
+        return round((moment - BOOT_STARTED) * 1000) if moment else None
+
+    return jsonify({
+        'status': 'ready' if is_ready else 'starting',
+        'database': boot_state['database'],
+        'caches': boot_state['caches'],
+        'error': boot_state['error'],
+        'pid': os.getpid(),
+        'fetch_leader': fetcher.lease.is_leader(),
+        'app_created_ms': since_boot(boot_state['app_created_at']),
+        'first_request_ms': since_boot(boot_state['first_request_at']),
+        'ready_ms': since_boot(boot_state['ready_at'])
+    }), 200 if is_ready else 503
+
 @app.route('/api/fetch-now')
 def api_fetch_now():
     """Manually trigger fetch"""
-    if fetcher.is_fetching:
+    if fetcher.is_fetching or fetcher.lease.status()['fetching']:
         return jsonify({
             'status': 'already_fetching', 
             'message': 'Fetch already in progress'
         })
     
+    if not (FlaskConfig.FETCH_IN_WEB and fetcher.lease.acquire()):
+        fetcher.lease.request_fetch()
+        return jsonify({
+            'status': 'requested',
+            'message': 'Fetch requested from the leader process'
+        })
+    
     threading.Thread(target=fetcher.fetch_and_save, daemon=True).start()
     return jsonify({
         'status': 'started', 
@@ -1533,6 +2768,8 @@ def api_stats():
             "SELECT COUNT(*) FROM categories"
         ).fetchone()[0]
         
+        last_fetch_time, last_fetch_count = get_last_fetch_run(conn)
+        fetch_status = get_fetch_status(conn)
         conn.close()
         
         return jsonify({
@@ -1540,10 +2777,11 @@ def api_stats():
             'total_views': total_views,
             'categories': categories_count,
             'sources': len([s for s in fetcher.NEWS_SOURCES if s.get('enabled', True)]),
-            'last_fetch': fetcher.last_fetch_time.isoformat() if fetcher.last_fetch_time else None,
-            'last_fetch_count': fetcher.last_fetch_count,
-            'is_fetching': fetcher.is_fetching,
-            'next_fetch_in_minutes': FlaskConfig.UPDATE_INTERVAL_MINUTES,
+            'last_fetch': last_fetch_time.isoformat() if last_fetch_time else None,
+            'last_fetch_count': last_fetch_count,
+            'is_fetching': fetch_status['fetching'],
+            'fetch_leader': fetch_status['leader'],
+            'next_fetch_in_minutes': fetch_status['next_fetch_in_minutes'],
             'status': 'online',
             'time': datetime.now().strftime('%H:%M:%S')
         })
@@ -1554,6 +2792,115 @@ def api_stats():
             'error': str(e)
         })
 
+@app.route('/api/source-health')
+@login_required
+def api_source_health():
+    """Circuit breaker state per news source"""
+    try:
+        conn = get_db_connection()
+        rows = conn.execute("SELECT * FROM source_health").fetchall()
+        conn.close()
+        
+        health = {row['source_name']: dict(row) for row in rows}
+        sources_health = []
+        for source in fetcher.NEWS_SOURCES:
+            if source.get('enabled', True):
+                row = health.get(source['name'], {})
+                sources_health.append({
+                    'name': source['name'],
+                    'state': row.get('state', 'closed'),
+                    'consecutive_failures': row.get('consecutive_failures', 0),
+                    'next_attempt_at': row.get('next_attempt_at'),
+                    'last_success_at': row.get('last_success_at'),
+                    'last_failure_at': row.get('last_failure_at')
+                })
+        
+        return jsonify({
+            'status': 'success',
+            'sources': sources_health,
+            'count': len(sources_health)
+        })
+        
+    except Exception as e:
+        logger.error(f"Source health API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'sources': [],
+            'message': str(e)
+        })
+
+@app.route('/api/fetch-runs')
+@login_required
+def api_fetch_runs():
+    """Recent fetch runs and per-source latency percentiles over a time window"""
+    try:
+        hours = min(max(request.args.get('hours', 24, type=int), 1), FlaskConfig.FETCH_RUNS_RETENTION_DAYS * 24)
+        since = (datetime.now() - timedelta(hours=hours)).strftime('%Y-%m-%d %H:%M:%S')
+        
+        query = "SELECT * FROM fetch_source_runs WHERE started_at >= ?"
+        params = [since]
+        if request.args.get('source'):
+            query += " AND source_name = ?"
+            params.append(request.args['source'])
+        
+        conn = get_db_connection()
+        runs = conn.execute(
+            "SELECT * FROM fetch_runs WHERE started_at >= ? ORDER BY id DESC LIMIT 50", (since,)
+        ).fetchall()
+        rows = conn.execute(query + " ORDER BY started_at", params).fetchall()
+        conn.close()
+        
+        by_source = {}
+        for row in rows:
+            by_source.setdefault(row['source_name'], []).append(row)
+        
+        sources = []
+        for name, source_rows in sorted(by_source.items()):
+            totals = [row['total_ms'] for row in source_rows if row['total_ms'] is not None]
+            
+            # Hourly buckets show how latency moves over the window
+            hourly = {}
+            for row in source_rows:
+                if row['total_ms'] is not None:
+                    hourly.setdefault(row['started_at'][:13] + ':00', []).append(row['total_ms'])
+            
+            sources.append({
+                'name': name,
+                'runs': len(source_rows),
+                'p50_ms': percentile(totals, 50),
+                'p95_ms': percentile(totals, 95),
+                'p99_ms': percentile(totals, 99),
+                'stages_p50_ms': {stage: percentile([row[f'{stage}_ms'] for row in source_rows
+                                                     if row[f'{stage}_ms'] is not None], 50)
+                                  for stage in STAGES},
+                'bytes': sum(row['bytes'] or 0 for row in source_rows),
+                'entries_seen': sum(row['entries_seen'] or 0 for row in source_rows),
+                'entries_new': sum(row['entries_new'] or 0 for row in source_rows),
+                'errors': sum(row['errors'] or 0 for row in source_rows),
+                'last_status': source_rows[-1]['status'],
+                'last_error': next((row['last_error'] for row in reversed(source_rows) if row['last_error']), None),
+                'history': [{'hour': hour, 'runs': len(values),
+                             'p50_ms': percentile(values, 50), 'p95_ms': percentile(values, 95)}
+                            for hour, values in sorted(hourly.items())]
+            })
+        
+        return jsonify({
+            'status': 'success',
+            'hours': hours,
+            'runs': [dict(row) for row in runs],
+            'sources': sources,
+            'count': len(sources)
+        })
+        
+    except Exception as e:
+        logger.error(f"Fetch runs API error: {e}")
+        return jsonify({
+            'status': 'error',
+            'runs': [],
+            'sources': [],
+            'message': str(e)
+        })
+
 # ============= ADMIN ROUTES =============
 @app.route('/admin/login', methods=['GET', 'POST'])
 def admin_login():
@@ -1579,6 +2926,8 @@ def admin_login():
 @login_required
 def admin_dashboard():
     conn = get_db_connection()
+    last_fetch_time, last_fetch_count = get_last_fetch_run(conn)
+    fetch_status = get_fetch_status(conn)
     
     stats = {
         'total_posts': conn.execute("SELECT COUNT(*) FROM posts").fetchone()[0],
@@ -1586,29 +2935,35 @@ def admin_dashboard():
         'total_views': conn.execute("SELECT SUM(views) FROM posts").fetchone()[0] or 0,
         'categories': conn.execute("SELECT COUNT(*) FROM categories").fetchone()[0],
         'sources': len([s for s in fetcher.NEWS_SOURCES if s.get('enabled', True)]),
-        'fetching_status': 'Active' if fetcher.is_fetching else 'Idle',
-        'last_fetch': fetcher.last_fetch_time.strftime('%Y-%m-%d %H:%M:%S') if fetcher.last_fetch_time else 'Never',
-        'last_fetch_count': fetcher.last_fetch_count,
+        'fetching_status': 'Active' if fetch_status['fetching'] else 'Idle',
+        'fetch_leader': fetch_status['leader'] or 'None',
+        'last_fetch': last_fetch_time.strftime('%Y-%m-%d %H:%M:%S') if last_fetch_time else 'Never',
+        'last_fetch_count': last_fetch_count,
         'database_path': get_db_path()
     }
     
     recent = conn.execute(
-        "SELECT id, title, source_name, source_url, created_at FROM posts ORDER BY created_at DESC LIMIT 10"
+        "SELECT id, title, slug, source_name, source_url, category_id, is_published, pub_date, created_at "
+        "FROM posts ORDER BY created_at DESC LIMIT 10"
     ).fetchall()
     
     conn.close()
     
     return render_template('admin/dashboard.html',
                          stats=stats,
-                         recent_posts=recent,
+                         recent_posts=[prepare_post(row) for row in recent],
                          config=FlaskConfig,
                          now=datetime.now())
 
 @app.route('/admin/fetch-now')
 @login_required
 def admin_fetch_now():
-    threading.Thread(target=fetcher.fetch_and_save, daemon=True).start()
-    flash('Content fetch started in background!', 'info')
+    if FlaskConfig.FETCH_IN_WEB and fetcher.lease.acquire():
+        threading.Thread(target=fetcher.fetch_and_save, daemon=True).start()
+        flash('Content fetch started in background!', 'info')
+    else:
+        fetcher.lease.request_fetch()
+        flash('Fetch requested from the leader process', 'info')
     return redirect('/admin/dashboard')
 
 @app.route('/admin/logout')
@@ -1629,36 +2984,191 @@ def server_error(e):
     return render_template('500.html', config=FlaskConfig), 500
 
 # ============= BACKGROUND AUTO-FETCHER =============
+def run_fetch_loop():
+    """Fetch on schedule for as long as the process runs
+    
+    Every fetching process runs this loop, but only the fetch lease holder
+    fetches. Followers retry the lease once per heartbeat, so one of them
+    takes over within a heartbeat of the leader's lease expiring.
+    """
+    step = FlaskConfig.FETCH_LEASE_TTL_SECONDS / 3
+    leading = fetcher.lease.is_leader()
+    while True:
+        try:
+            time.sleep(step)
+            if not fetcher.lease.acquire():
+                if leading:
+                    logger.warning("⚠️ Fetch lease lost, following the new leader")
+                leading = False
+                continue
+            if not leading:
+                logger.info(f"👑 Took over the fetch lease as {fetcher.lease.holder}")
+                # Polls and breaker trips of whoever led meanwhile are only in the database
+                conn = get_db_connection()
+                try:
+                    fetcher.load_poll_schedule(conn)
+                    fetcher.load_source_health(conn)
+                finally:
+                    conn.close()
+                leading = True
+            
+            # Wake every heartbeat so fetch requests from web processes are picked up
+            requested = fetcher.lease.take_fetch_request()
+            if not requested and fetcher.seconds_until_next_poll() > 0:
+                continue
+            
+            # Run fetch
+            logger.info("🔄 RUNNING REQUESTED FETCH..." if requested else "🔄 RUNNING SCHEDULED FETCH...")
+            fetched = fetcher.fetch_and_save(only_due=not requested)
+            
+            if fetched > 0:
+                logger.info(f"✅ Scheduled fetch: {fetched} new articles")
+            else:
+                logger.info("✅ Scheduled fetch complete - no new articles")
+            logger.info(f"⏰ Next fetch in {fetcher.seconds_until_next_poll() / 60:.1f} minutes...")
+                
+        except Exception as e:
+            logger.error(f"❌ Background fetch error: {e}")
+            time.sleep(300)
+
+def run_startup_fetch():
+    """Full fetch on boot, done only by the process that wins the fetch lease"""
+    if fetcher.lease.acquire():
+        logger.info(f"🚀 Fetch leader {fetcher.lease.holder}, testing fetch on startup...")
+        initial_fetched = fetcher.fetch_and_save()
+        logger.info(f"✅ Initial fetch: {initial_fetched} articles")
+    else:
+        logger.info(f"👀 Fetch leader is {fetcher.lease.status()['leader']}, this process only serves reads")
+
+def wait_for_schema(poll_seconds=2):
+    """Block until the fetch worker has set up the database; web-only processes don't migrate"""
+    waiting_logged = False
+    while True:
+        conn = get_db_connection()
+        try:
+            if conn.execute("SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'fetch_leases'").fetchone():
+                return True
+        finally:
+            conn.close()
+        if not waiting_logged:
+            logger.info("⏳ Waiting for the fetch worker to set up the database...")
+            waiting_logged = True
+        time.sleep(poll_seconds)
+
 def start_auto_fetcher():
     """Start automatic background fetching"""
-    def fetch_loop():
-        while True:
-            try:
-                # Wait for the interval
-                wait_time = FlaskConfig.UPDATE_INTERVAL_MINUTES * 60
-                logger.info(f"⏰ Next fetch in {FlaskConfig.UPDATE_INTERVAL_MINUTES} minutes...")
-                time.sleep(wait_time)
-                
-                # Run fetch
-                logger.info("🔄 RUNNING SCHEDULED FETCH...")
-                fetched = fetcher.fetch_and_save()
-                
-                if fetched > 0:
-                    logger.info(f"✅ Scheduled fetch: {fetched} new articles")
-                else:
-                    logger.info("✅ Scheduled fetch complete - no new articles")
-                    
-            except Exception as e:
-                logger.error(f"❌ Background fetch error: {e}")
-                time.sleep(300)
-    
-    # Start thread
-    thread = threading.Thread(target=fetch_loop, daemon=True)
+    thread = threading.Thread(target=run_fetch_loop, daemon=True)
     thread.start()
-    logger.info(f"🚀 Auto-fetcher started - Updates every {FlaskConfig.UPDATE_INTERVAL_MINUTES} minutes")
+    logger.info(f"🚀 Auto-fetcher started - Polling each source every "
+                f"{FlaskConfig.POLL_MIN_MINUTES}-{FlaskConfig.POLL_MAX_MINUTES} minutes")
+
+def setup_database_with_retry():
+    """setup_database until it succeeds, backing off between attempts
+    
+    A database that is locked or not yet mounted at boot delays readiness
+    instead of leaving the process unready until it is restarted.
+    """
+    delay = FlaskConfig.STARTUP_RETRY_SECONDS
+    while not setup_database():
+        boot_state['error'] = f"Database setup failed, retrying in {delay:g}s"
+        logger.warning(f"⏳ {boot_state['error']}")
+        time.sleep(delay)
+        delay = min(delay * 2, FlaskConfig.STARTUP_RETRY_MAX_SECONDS)
+    return True
+
+def warm_up_caches():
+    """Load the in-memory caches every request and fetch relies on"""
+    conn = get_db_connection()
+    try:
+        fetcher.load_category_map(conn)
+        category_registry.load(conn)
+        fetcher.load_poll_schedule(conn)
+        fetcher.load_source_health(conn)
+        # Pull the home page's index and rows into SQLite's page cache
+        conn.execute("SELECT id FROM posts WHERE is_published = 1 ORDER BY published_at DESC LIMIT ?",
+                     (FlaskConfig.POSTS_PER_PAGE,)).fetchall()
+    finally:
+        conn.close()
+
+def warm_up():
+    """Background boot: schema, in-memory caches, then the startup fetch and fetch loop
+    
+    With FETCH_IN_WEB off, worker.py owns the schema and all fetching, so
+    this only waits for the database and warms the caches. Failures are
+    retried with backoff; /ready answers 503 until a pass succeeds.
+    """
+    delay = FlaskConfig.STARTUP_RETRY_SECONDS
+    while not boot_state['caches']:
+        try:
+            boot_state['database'] = setup_database_with_retry() if FlaskConfig.FETCH_IN_WEB else wait_for_schema()
+            warm_up_caches()
+            boot_state['caches'] = True
+        except Exception as e:
+            boot_state['error'] = f"Warm-up failed, retrying in {delay:g}s: {e}"
+            logger.error(f"❌ {boot_state['error']}", exc_info=True)
+            time.sleep(delay)
+            delay = min(delay * 2, FlaskConfig.STARTUP_RETRY_MAX_SECONDS)
+    boot_state['error'] = None
+    boot_state['ready_at'] = time.time()
+    logger.info(f"✅ Ready {boot_state['ready_at'] - BOOT_STARTED:.2f}s after boot")
+    
+    # Fetching never delays readiness
+    if FlaskConfig.FETCH_IN_WEB:
+        try:
+            run_startup_fetch()
+        except Exception as e:
+            logger.error(f"❌ Startup fetch failed: {e}", exc_info=True)
+    
+    if FlaskConfig.FETCH_IN_WEB:
+        start_auto_fetcher()
 
-# Start auto-fetcher
-start_auto_fetcher()
+def start_background_tasks():
+    """Start warm-up and the auto-fetcher once per process
+    
+    Keyed by pid because threads do not survive fork: under gunicorn --preload
+    the app is created in the master, and each worker starts its own here.
+    """
+    global _background_pid
+    with _background_lock:
+        if _background_pid == os.getpid():
+            return
+        _background_pid = os.getpid()
+    
+    if fetcher.lease.pid != os.getpid():
+        # Fetcher created before the fork: every worker needs its own lease identity
+        fetcher.lease = FetchLease(get_db_path(), ttl=FlaskConfig.FETCH_LEASE_TTL_SECONDS)
+    # Hand the lease over right away on a clean shutdown instead of after it expires
+    atexit.register(fetcher.lease.release)
+    
+    threading.Thread(target=warm_up, name='warm-up', daemon=True).start()
+
+@app.teardown_appcontext
+def release_db_connection(exc):
+    """Check the thread's connection back in after every request, even failed ones"""
+    db_pool.release()
+
+@app.before_request
+def ensure_background_tasks():
+    """Start background work on the first request of a process that has none yet"""
+    if boot_state['first_request_at'] is None:
+        boot_state['first_request_at'] = time.time()
+        logger.info(f"⏱️  First request {boot_state['first_request_at'] - BOOT_STARTED:.2f}s after boot")
+    if _background_pid != os.getpid():
+        start_background_tasks()
+
+def create_app():
+    """The configured Flask app, with nothing started
+    
+    Safe to call before forking (gunicorn --preload). Background work starts
+    per process: gunicorn.conf.py starts it as each worker boots, otherwise
+    the first request does.
+    """
+    if boot_state['app_created_at'] is None:
+        boot_state['app_created_at'] = time.time()
+        print("=" * 60)
+        print("🇿🇦 MZANSI INSIGHTS - NEWS AGGREGATOR")
+        print("=" * 60)
+    return app
 
 # ============= DEBUG & TEST ROUTES =============
 @app.route('/debug')
@@ -1675,6 +3185,7 @@ def debug():
             "SELECT id, title, source_url, source_name, created_at FROM posts WHERE is_published = 1 ORDER BY created_at DESC LIMIT 5"
         ).fetchall()
         
+        last_fetch_time, last_fetch_count = get_last_fetch_run(conn)
         conn.close()
         
         return jsonify({
@@ -1691,9 +3202,10 @@ def debug():
                 'categories': categories
             },
             'fetcher': {
-                'is_fetching': fetcher.is_fetching,
-                'last_fetch_time': fetcher.last_fetch_time.isoformat() if fetcher.last_fetch_time else None,
-                'last_fetch_count': fetcher.last_fetch_count,
+                'fetch_in_web': FlaskConfig.FETCH_IN_WEB,
+                'lease': fetcher.lease.status(),
+                'last_fetch_time': last_fetch_time.isoformat() if last_fetch_time else None,
+                'last_fetch_count': last_fetch_count,
                 'active_sources': len([s for s in fetcher.NEWS_SOURCES if s.get('enabled', True)])
             },
             'sample_posts': [
@@ -1713,18 +3225,23 @@ def debug():
 @app.route('/test-fetch')
 def test_fetch():
     """Test fetch directly"""
+    if not FlaskConfig.FETCH_IN_WEB:
+        fetcher.lease.request_fetch()
+        return "<h1>Fetch Test</h1><p>Fetch requested from the fetch worker</p>"
     result = fetcher.fetch_and_save()
     return f"<h1>Fetch Test</h1><p>Result: {result} articles fetched</p>"
 
 # ============= START APP =============
 if __name__ == '__main__':
+    create_app()
+    start_background_tasks()
     print(f"🌐 Site URL: {FlaskConfig.SITE_URL}")
     print(f"🔐 Admin: {FlaskConfig.SITE_URL}/admin/login")
     print(f"📧 Contact: {FlaskConfig.CONTACT_EMAIL}")
     print(f"📱 Phone: {FlaskConfig.CONTACT_PHONE}")
     print(f"💰 AdSense: {'ENABLED' if FlaskConfig.ADSENSE_ENABLED else 'DISABLED'}")
     print(f"📊 Active Sources: {len([s for s in fetcher.NEWS_SOURCES if s.get('enabled', True)])}")
-    print(f"⏰ Auto-update: Every {FlaskConfig.UPDATE_INTERVAL_MINUTES} minutes")
+    print(f"⏰ Auto-update: Adaptive, every {FlaskConfig.POLL_MIN_MINUTES}-{FlaskConfig.POLL_MAX_MINUTES} minutes per source")
     print("=" * 60)
     print("🚀 Ready to fetch news from South African sources!")
     print("=" * 60)
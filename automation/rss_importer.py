@@ -3,19 +3,21 @@
 RSS feed importer for auto-posting
 """
 import feedparser
-import requests
 from bs4 import BeautifulSoup
 import random
 from datetime import datetime
 from urllib.parse import urlparse
 import time
 
+from utils.http_client import get_http_client
+
 class RSSImporter:
     def __init__(self):
         self.user_agents = [
             'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36',
             'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36',
         ]
+        self.http = get_http_client()
         
         self.rss_feeds = {
             'grants': [
@@ -36,7 +38,8 @@ class RSSImporter:
         """Fetch and parse RSS feed"""
         try:
             headers = {'User-Agent': random.choice(self.user_agents)}
-            feed = feedparser.parse(feed_url)
+            response = self.http.get(feed_url, headers=headers, timeout=10)
+            feed = feedparser.parse(response.content)
             
             articles = []
             for entry in feed.entries[:5]:  # Get latest 5
@@ -67,7 +70,7 @@ class RSSImporter:
         """Fetch full article content"""
         try:
             headers = {'User-Agent': random.choice(self.user_agents)}
-            response = requests.get(url, headers=headers, timeout=10)
+            response = self.http.get(url, headers=headers, timeout=10)
             soup = BeautifulSoup(response.content, 'html.parser')
             
             # Remove unwanted elements
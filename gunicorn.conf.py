@@ -0,0 +1,8 @@
+# gunicorn.conf.py
+# Loaded automatically by gunicorn from the working directory
+
+def post_worker_init(worker):
+    """Start warm-up and the auto-fetcher in each worker once it has booted,
+    so it does not wait for a first request (also correct with --preload)"""
+    from app import start_background_tasks
+    start_background_tasks()
@@ -0,0 +1,81 @@
+# tests/bench_date_parsing.py
+"""
+Microbenchmark: DateParser and DateNormalizer against the strptime chain they replaced
+
+    python tests/bench_date_parsing.py
+
+Strings follow the formats news feeds actually send, one format per source
+the way real feeds do, so DateNormalizer's per-source memo gets its hits.
+"""
+
+import os
+import random
+import sys
+import timeit
+from datetime import datetime, timedelta, timezone
+from email.utils import parsedate_to_datetime
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from utils.date_parsing import DateNormalizer, DateParser  # noqa: E402
+
+STRINGS = 4000
+SOURCES = 40
+
+FORMATS = (
+    lambda t: t.strftime('%a, %d %b %Y %H:%M:%S GMT'),
+    lambda t: t.astimezone(timezone(timedelta(hours=2))).strftime('%a, %d %b %Y %H:%M:%S %z'),
+    lambda t: t.astimezone(timezone(timedelta(hours=2))).strftime('%a, %d %b %Y %H:%M:%S %z (SAST)'),
+    lambda t: t.astimezone(timezone(timedelta(hours=-5))).strftime('%a, %d %b %y %H:%M:%S EST'),
+    lambda t: t.strftime('%d %b %Y %I:%M %p GMT'),
+    lambda t: t.strftime('%Y-%m-%dT%H:%M:%SZ'),
+    lambda t: t.astimezone(timezone(timedelta(hours=2))).isoformat(),
+    lambda t: t.strftime('%Y-%m-%d %H:%M:%S'),
+    lambda t: t.strftime('%B %d, %Y %I:%M %p'),
+)
+
+def strptime_chain(date_str):
+    """ContentFetcher.parse_date_string as it was: six formats, one exception per miss"""
+    for fmt in ('%a, %d %b %Y %H:%M:%S %Z', '%a, %d %b %Y %H:%M:%S %z', '%Y-%m-%dT%H:%M:%S%z',
+                '%Y-%m-%d %H:%M:%S', '%d %b %Y %H:%M:%S', '%b %d, %Y %H:%M:%S'):
+        try:
+            return datetime.strptime(date_str.strip(), fmt)
+        except ValueError:
+            continue
+    return None
+
+def email_utils(date_str):
+    try:
+        return parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        return None
+
+def sample(seed=1):
+    rng = random.Random(seed)
+    start = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    source_formats = [rng.choice(FORMATS) for _ in range(SOURCES)]
+    strings = []
+    for n in range(STRINGS):
+        source = n % SOURCES
+        moment = start + timedelta(seconds=rng.randrange(300 * 86400))
+        strings.append((f'source-{source}', source_formats[source](moment)))
+    return strings
+
+def main():
+    strings = sample()
+    normalizer = DateNormalizer()
+    entries = [(name, {'published': value}) for name, value in strings]
+    runs = {
+        'strptime chain': lambda: [strptime_chain(value) for _, value in strings],
+        'email.utils': lambda: [email_utils(value) for _, value in strings],
+        'DateParser': lambda: [DateParser.to_epoch(value) for _, value in strings],
+        'DateNormalizer': lambda: [normalizer.timestamp(entry, name) for name, entry in entries],
+    }
+    print(f"{STRINGS} date strings from {SOURCES} sources")
+    for name, run in runs.items():
+        parsed = sum(result is not None for result in run())
+        seconds = min(timeit.repeat(run, number=5, repeat=5)) / 5
+        print(f"{name:<15} {seconds / STRINGS * 1e6:7.2f} us/string  {parsed:>5} parsed")
+
+if __name__ == '__main__':
+    main()
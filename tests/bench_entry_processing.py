@@ -0,0 +1,69 @@
+# tests/bench_entry_processing.py
+"""
+Benchmark: CPU per feed entry for normalize_entries against the old per-entry work
+
+    python tests/bench_entry_processing.py
+
+The old path cleaned the body with BeautifulSoup, cleaned the result again
+for the excerpt and built one more tree per field to find an image.
+"""
+
+import os
+import sys
+import time
+from urllib.parse import urljoin
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402  (imports app against a throwaway database)
+from test_html_cleaner import ARTICLE, bs4, soup_clean_html_content  # noqa: E402
+
+ENTRIES = 20
+SUMMARY = '<p>Eskom said on Tuesday that load shedding would be suspended, for now.</p>'
+
+def soup_first_image(fields, base_url):
+    """extract_image_from_entry's BeautifulSoup pass, as it was"""
+    for field in fields:
+        img = bs4.BeautifulSoup(field, 'html.parser').find('img')
+        if img and img.get('src'):
+            src = img['src']
+            return src if src.startswith('http') else urljoin(base_url, src)
+    return None
+
+def old_entry_processing(entries, base_url):
+    articles = []
+    for entry in entries:
+        content = soup_clean_html_content(entry.content, 2500)
+        excerpt = soup_clean_html_content(content, 250)
+        image_url = soup_first_image((entry.content, entry.summary), base_url)
+        articles.append((entry.title, content, excerpt, image_url))
+    return articles
+
+def main():
+    app = conftest.app_module
+    app.logger.disabled = True
+    source = {'name': 'BenchWire', 'url': 'https://bench.example/feed', 'base_url': 'https://bench.example',
+              'category': 'news', 'color': '#000', 'icon': 'rss'}
+    fetcher = app.ContentFetcher()
+    feed = app.MinimalFeed()
+    feed.strategy = 'feedparser'
+    feed.entries = [app.Entry(f'Load shedding suspended, update {n}', f'https://bench.example/story/{n}',
+                              content=ARTICLE, summary=SUMMARY) for n in range(ENTRIES)]
+
+    runs = {'before': lambda: old_entry_processing(feed.entries, source['base_url']),
+            'after': lambda: fetcher.normalize_entries(source, feed, watermark=fetcher.get_watermark(source))}
+    per_entry = {}
+    for name, run in runs.items():
+        best = None
+        for _ in range(5):
+            started = time.process_time()
+            articles = run()
+            elapsed = time.process_time() - started
+            assert len(articles) == ENTRIES
+            best = elapsed if best is None else min(best, elapsed)
+        per_entry[name] = best / ENTRIES
+        print(f"{name:<7} {per_entry[name] * 1000:7.3f} ms CPU per entry")
+    print(f"{per_entry['before'] / per_entry['after']:.1f}x less CPU per entry")
+
+if __name__ == '__main__':
+    main()
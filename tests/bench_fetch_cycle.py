@@ -0,0 +1,79 @@
+# tests/bench_fetch_cycle.py
+"""
+Benchmark: fetch cycle time against number of sources and fetch workers
+
+    python tests/bench_fetch_cycle.py
+
+Feeds come from a local server that answers each request after LATENCY
+seconds, standing in for a news site's response time. One worker is the
+sequential fetch the thread pool replaced.
+"""
+
+import logging
+import os
+import sys
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402  (imports app against a throwaway database)
+
+LATENCY = 0.1
+ENTRIES = 10
+SOURCE_COUNTS = (4, 16, 64)
+WORKER_COUNTS = (1, 4, 16)
+
+ITEM = '''<item><title>Story {n} from source {source}</title><link>http://bench.example/{source}/{n}</link>
+<description>Body of story {n}, long enough to be kept by the cleaner and the excerpt.</description>
+<pubDate>Tue, 13 Oct 2026 08:{n:02d}:00 GMT</pubDate></item>'''
+
+class SlowFeeds(BaseHTTPRequestHandler):
+    protocol_version = 'HTTP/1.1'
+
+    def do_GET(self):
+        time.sleep(LATENCY)
+        source = self.path.strip('/').split('/')[0]
+        body = ('<?xml version="1.0"?><rss version="2.0"><channel><title>bench</title>'
+                + ''.join(ITEM.format(n=n, source=source) for n in range(ENTRIES))
+                + '</channel></rss>').encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+def cycle_seconds(base_url, source_count, workers):
+    app = conftest.app_module
+    sources = [{'name': f'Bench{i}', 'url': f'{base_url}/s{i}/feed', 'base_url': base_url,
+                'category': 'news', 'color': '#000', 'icon': 'rss'} for i in range(source_count)]
+    fetcher = app.ContentFetcher()
+    started = time.perf_counter()
+    results = list(fetcher.fetch_feeds_concurrently(sources, max_workers=workers, budget_seconds=600))
+    elapsed = time.perf_counter() - started
+    assert sum(len(articles) for _, _, articles, _ in results) == source_count * ENTRIES
+    return elapsed
+
+def main():
+    conftest.app_module.logger.disabled = True
+    # Every bench source is the same host, so 16 workers overflow its 10-connection pool
+    logging.getLogger('urllib3').setLevel(logging.ERROR)
+    server = ThreadingHTTPServer(('127.0.0.1', 0), SlowFeeds)
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    base_url = f'http://127.0.0.1:{server.server_port}'
+    try:
+        print(f"{LATENCY * 1000:.0f} ms per response, {ENTRIES} entries per feed")
+        print('sources ' + ''.join(f'{f"workers={workers}":>13}' for workers in WORKER_COUNTS))
+        for source_count in SOURCE_COUNTS:
+            timings = [cycle_seconds(base_url, source_count, workers) for workers in WORKER_COUNTS]
+            print(f'{source_count:<8}' + ''.join(f'{seconds:12.2f}s' for seconds in timings))
+    finally:
+        server.shutdown()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,27 @@
+# tests/bench_html_cleaner.py
+"""
+Microbenchmark: streaming clean_html_content against the BeautifulSoup version
+
+    python tests/bench_html_cleaner.py
+"""
+
+import os
+import sys
+import timeit
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402  (imports app against a throwaway database)
+from test_html_cleaner import ARTICLE, soup_clean_html_content  # noqa: E402
+
+def main():
+    fetcher = conftest.app_module.ContentFetcher()
+    print(f"{len(ARTICLE)} byte article")
+    for max_length in (250, 2500):
+        for name, clean in (('beautifulsoup', soup_clean_html_content), ('streaming', fetcher.clean_html_content)):
+            runs = 200
+            seconds = min(timeit.repeat(lambda: clean(ARTICLE, max_length), number=runs, repeat=5)) / runs
+            print(f"max_length={max_length:<5} {name:<14} {seconds * 1000:7.3f} ms")
+
+if __name__ == '__main__':
+    main()
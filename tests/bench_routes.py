@@ -0,0 +1,81 @@
+# tests/bench_routes.py
+"""
+Benchmark: home, category and post page timings, pooled connections against
+a fresh connection per get_db_connection() call
+
+    python tests/bench_routes.py
+
+The unpooled run swaps get_db_connection back to what it was before
+utils/db_pool.py: sqlite3.connect plus the pragmas on every call.
+"""
+
+import os
+import sqlite3
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+import conftest  # noqa: E402  (imports app against a throwaway database)
+
+POSTS = 2000
+REQUESTS = 300
+ROUTES = (('home', '/'), ('category', '/category/news'), ('post', '/post/story-0'))
+
+def add_posts(conn):
+    conn.executemany(
+        "INSERT INTO posts (title, slug, content, excerpt, source_url, category_id, source_name, published_at) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+        [(f'Story {i}', f'story-{i}', 'Body text of the story. ' * 40, 'Excerpt', f'https://x.example/{i}',
+          i % 10 + 1, f'Source {i % 12}', 1790000000 - i * 600) for i in range(POSTS)])
+    conn.commit()
+
+def unpooled_connection():
+    conn = sqlite3.connect(conftest.app_module.get_db_path(), timeout=5)
+    conn.row_factory = sqlite3.Row
+    conftest.app_module.apply_pragmas(conn, conftest.app_module.SQLITE_PRAGMAS)
+    return conn
+
+def timings(client, path):
+    for _ in range(20):
+        client.get(path)
+    times = []
+    for _ in range(REQUESTS):
+        started = time.perf_counter()
+        response = client.get(path)
+        times.append(time.perf_counter() - started)
+        assert response.status_code == 200, response.status_code
+    times.sort()
+    return times[len(times) // 2], times[len(times) * 95 // 100]
+
+def main():
+    app = conftest.app_module
+    app.logger.disabled = True
+    # Measure the routes only: no warm-up thread or fetch loop
+    app._background_pid = os.getpid()
+    conn = app.get_db_connection()
+    add_posts(conn)
+    conn.close()
+    app.db_pool.release()
+
+    client = app.app.test_client()
+    pooled_connection = app.get_db_connection
+    try:
+        print(f"{POSTS} posts, {REQUESTS} requests per route")
+        for name, path in ROUTES:
+            results = []
+            for get_connection in (unpooled_connection, pooled_connection):
+                app.get_db_connection = get_connection
+                results.append(timings(client, path))
+            (before_p50, before_p95), (after_p50, after_p95) = results
+            print(f"{name:<9} unpooled p50 {before_p50 * 1000:6.2f} ms p95 {before_p95 * 1000:6.2f} ms   "
+                  f"pooled p50 {after_p50 * 1000:6.2f} ms p95 {after_p95 * 1000:6.2f} ms")
+    finally:
+        app.get_db_connection = pooled_connection
+        conn = app.get_db_connection()
+        conn.execute("DELETE FROM posts")
+        conn.commit()
+        conn.close()
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,82 @@
+# tests/conftest.py
+"""
+Shared fixtures: app imported against a throwaway database
+"""
+
+import os
+import sys
+import tempfile
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# app keeps its database at data/posts.db under the working directory
+os.chdir(tempfile.mkdtemp(prefix='mzansi-tests-'))
+os.environ['FETCH_IN_WEB'] = 'false'
+
+import app as app_module  # noqa: E402
+
+assert app_module.setup_database(), 'database setup failed'
+
+@pytest.fixture
+def app():
+    return app_module
+
+@pytest.fixture
+def conn():
+    """Pooled connection; posts and per-source state written by the test are removed afterwards"""
+    connection = app_module.get_db_connection()
+    yield connection
+    connection.rollback()
+    for table in ('post_duplicates', 'posts', 'source_health', 'source_schedule', 'source_watermarks'):
+        connection.execute(f"DELETE FROM {table}")
+    connection.commit()
+    connection.close()
+    app_module.db_pool.release()
+
+@pytest.fixture
+def fetcher(conn):
+    """Fresh ContentFetcher with its category map and SimHash index loaded"""
+    content_fetcher = app_module.ContentFetcher()
+    content_fetcher.load_category_map(conn)
+    content_fetcher.load_near_duplicate_index(conn)
+    return content_fetcher
+
+RSS = '''<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>
+<item><title>Rand firms against the dollar</title><link>http://feeds.example{path}/1</link>
+<description>The rand firmed in early trade on Tuesday as risk appetite returned to emerging markets.</description>
+<pubDate>Tue, 13 Oct 2026 08:00:00 GMT</pubDate></item></channel></rss>'''
+
+class FeedHandler(BaseHTTPRequestHandler):
+    """/feed and /feed.xml answer at once, /slow/feed after 0.6s; ETag is the path"""
+
+    def do_GET(self):
+        if self.path not in ('/feed', '/feed.xml', '/slow/feed'):
+            self.send_response(404)
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+            return
+        if self.path.startswith('/slow/'):
+            time.sleep(0.6)
+        body = RSS.format(path=self.path).encode()
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/rss+xml')
+        self.send_header('ETag', f'"{self.path}"')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args):
+        pass
+
+@pytest.fixture
+def feed_server():
+    """Base URL of a local feed server"""
+    server = ThreadingHTTPServer(('127.0.0.1', 0), FeedHandler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}'
+    server.shutdown()
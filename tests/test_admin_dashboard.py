@@ -0,0 +1,52 @@
+# tests/test_admin_dashboard.py
+from app import FlaskConfig
+
+def login(client):
+    response = client.post('/admin/login', data={'username': FlaskConfig.ADMIN_USERNAME,
+                                                 'password': FlaskConfig.ADMIN_PASSWORD})
+    assert response.status_code == 302
+
+def test_dashboard_renders_recent_posts(app, conn):
+    conn.execute("INSERT INTO posts (title, slug, content, source_url, category_id, source_name) "
+                 "VALUES ('Budget vote <b>today</b>', 'budget-vote', 'Body', 'https://x.example/a', 2, 'Wire')")
+    conn.commit()
+    client = app.app.test_client()
+    login(client)
+
+    response = client.get('/admin/dashboard')
+    assert response.status_code == 200
+    page = response.get_data(as_text=True)
+    assert 'Budget vote &lt;b&gt;today&lt;/b&gt;' in page
+    assert 'escapeHtml(source.last_error)' in page
+
+def test_fetch_runs_api_needs_login(app):
+    response = app.app.test_client().get('/api/fetch-runs?hours=24')
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+
+def test_fetch_runs_api(app):
+    client = app.app.test_client()
+    login(client)
+    response = client.get('/api/fetch-runs?hours=24')
+    assert response.status_code == 200
+    assert response.get_json()['status'] == 'success'
+
+def test_source_health_api_needs_login(app):
+    response = app.app.test_client().get('/api/source-health')
+    assert response.status_code == 302
+    assert '/admin/login' in response.headers['Location']
+
+def test_source_health_api_and_panel(app, conn):
+    conn.execute("INSERT OR REPLACE INTO source_health (source_name, state, consecutive_failures) VALUES (?, 'open', 3)",
+                 (app.fetcher.NEWS_SOURCES[0]['name'],))
+    conn.commit()
+    client = app.app.test_client()
+    login(client)
+
+    data = client.get('/api/source-health').get_json()
+    assert data['status'] == 'success'
+    first = data['sources'][0]
+    assert (first['state'], first['consecutive_failures']) == ('open', 3)
+    assert 'escapeHtml(source.name)' in client.get('/admin/dashboard').get_data(as_text=True)
+    conn.execute("DELETE FROM source_health")
+    conn.commit()
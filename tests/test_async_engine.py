@@ -0,0 +1,37 @@
+# tests/test_async_engine.py
+import threading
+import time
+
+import pytest
+
+aiohttp = pytest.importorskip('aiohttp')
+
+def test_only_the_winning_variation_queues_validators(fetcher, conn, feed_server):
+    source = {'name': 'RaceSource', 'url': f'{feed_server}/feed', 'base_url': feed_server,
+              'category': 'business', 'color': '#000', 'icon': 'rss'}
+    fetcher.load_feed_cache(conn)
+    fetcher.load_feed_profiles(conn)
+    fetcher.load_watermarks(conn)
+
+    # /feed.xml is still parsing in the executor when /feed wins the race
+    finish_feed_stream = fetcher.finish_feed_stream
+    slow_parse_done = threading.Event()
+
+    def finish(source, feed_url, *args):
+        if feed_url.endswith('/feed.xml'):
+            time.sleep(0.5)
+            feed = finish_feed_stream(source, feed_url, *args)
+            slow_parse_done.set()
+            return feed
+        time.sleep(0.1)
+        return finish_feed_stream(source, feed_url, *args)
+
+    fetcher.finish_feed_stream = finish
+    started = time.monotonic()
+    results = list(fetcher.fetch_feeds_async([source], budget_seconds=10))
+    elapsed = time.monotonic() - started
+
+    assert [(s['name'], len(articles)) for s, feed, articles, _ in results] == [('RaceSource', 1)]
+    assert elapsed < 0.5, 'the cycle waited for the losing variation'
+    assert slow_parse_done.wait(2)
+    assert fetcher.cycle.cache_updates['RaceSource']['etag'] == '"/feed"'
@@ -0,0 +1,63 @@
+# tests/test_conditional_get.py
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from conftest import RSS
+
+ETAG = '"v1"'
+LAST_MODIFIED = 'Tue, 13 Oct 2026 08:00:00 GMT'
+
+@pytest.fixture
+def validating_server():
+    """Feed server answering 304 to either matching validator; yields (base URL, request headers)"""
+    requests_seen = []
+
+    class Validating(BaseHTTPRequestHandler):
+        def do_GET(self):
+            requests_seen.append(dict(self.headers))
+            if self.headers.get('If-None-Match') == ETAG or self.headers.get('If-Modified-Since') == LAST_MODIFIED:
+                self.send_response(304)
+                self.send_header('ETag', ETAG)
+                self.end_headers()
+                return
+            body = RSS.format(path=self.path).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/rss+xml')
+            self.send_header('ETag', ETAG)
+            self.send_header('Last-Modified', LAST_MODIFIED)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    server = ThreadingHTTPServer(('127.0.0.1', 0), Validating)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield f'http://127.0.0.1:{server.server_port}', requests_seen
+    server.shutdown()
+
+def test_validators_round_trip_to_a_304(app, fetcher, conn, validating_server):
+    base_url, requests_seen = validating_server
+    source = {'name': 'CachedSource', 'url': f'{base_url}/feed', 'base_url': base_url,
+              'category': 'news', 'color': '#000', 'icon': 'rss'}
+    fetcher.load_feed_cache(conn)
+
+    feed = fetcher.fetch_feed_with_proxy(source)
+    assert len(feed.entries) == 1
+    assert 'If-None-Match' not in requests_seen[0] and 'If-Modified-Since' not in requests_seen[0]
+    fetcher.save_feed_cache(conn, source)
+    conn.commit()
+
+    # A restarted process reads the validators back from feed_cache
+    restarted = app.ContentFetcher()
+    restarted.load_feed_cache(conn)
+    feed = restarted.fetch_feed_with_proxy(source)
+    assert feed.not_modified
+    assert requests_seen[1]['If-None-Match'] == ETAG
+    assert requests_seen[1]['If-Modified-Since'] == LAST_MODIFIED
+    assert restarted.save_source_entries(conn, source, feed, restarted.collect_articles(source, feed)) == 0
+    conn.execute("DELETE FROM feed_cache")
+    conn.commit()
@@ -0,0 +1,38 @@
+# tests/test_content_identity.py
+import pytest
+
+from utils.content_identity import ContentIdentity
+
+CANONICAL_URLS = [
+    # Tracking parameters go, the rest are sorted
+    ('https://news.example/story?utm_source=x&id=7&fbclid=abc&b=2', 'https://news.example/story?b=2&id=7'),
+    ('https://news.example/story?_ga=1.2&ref=home', 'https://news.example/story'),
+    # Default ports, scheme and alternate hosts
+    ('http://news.example:80/story', 'https://news.example/story'),
+    ('https://www.news.example:443/story', 'https://news.example/story'),
+    ('https://m.news.example:8443/story', 'https://news.example:8443/story'),
+    # Trailing slashes, doubled slashes and AMP suffixes
+    ('https://news.example/story/', 'https://news.example/story'),
+    ('https://news.example//section//story/amp/', 'https://news.example/section/story'),
+    ('https://news.example', 'https://news.example/'),
+    # Fragments
+    ('https://news.example/story#comments', 'https://news.example/story'),
+    # Case: the host is lowered, the path is not
+    ('HTTPS://News.Example/Story', 'https://news.example/Story'),
+    ('  https://news.example/story  ', 'https://news.example/story'),
+    ('', ''),
+]
+
+@pytest.mark.parametrize('url, expected', CANONICAL_URLS)
+def test_canonical_url(url, expected):
+    assert ContentIdentity.canonical_url(url) == expected
+
+@pytest.mark.parametrize('url', ['https://news.example:port/story', 'http://[::1/story', 'https://news.example:99999/x'])
+def test_unsplittable_url_is_kept_as_given(url):
+    assert ContentIdentity.canonical_url(f' {url} ') == url
+
+def test_title_fingerprint_ignores_case_accents_and_punctuation():
+    assert (ContentIdentity.title_fingerprint('Café owners: “Load-shedding” hits!', 'Wire')
+            == ContentIdentity.title_fingerprint('cafe owners load shedding hits', 'WIRE'))
+    assert (ContentIdentity.title_fingerprint('Same title', 'Wire')
+            != ContentIdentity.title_fingerprint('Same title', 'Desk'))
@@ -0,0 +1,57 @@
+# tests/test_date_parsing.py
+import calendar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+
+import feedparser
+import pytest
+
+from utils.date_parsing import DateNormalizer, DateParser
+
+# Strings both reference parsers read correctly
+RFC822_DATES = [
+    'Tue, 13 Oct 2026 08:00:00 GMT',
+    'Tue, 13 Oct 2026 08:00:00 +0200',
+    'Tue, 13 Oct 2026 08:00:00 +0200 (SAST)',
+    'Tue, 13 Oct 2026 08:00:00 GMT (Coordinated Universal Time)',
+    'Fri, 16 Oct 2026 21:30:00 -0500',
+    'Fri, 16 Oct 26 21:30:00 EST',
+    '13 Oct 2026 08:00 +0200',
+    '16 Oct 2026 21:30 GMT',
+    'Tue, 13 Oct 2026 8:00:00 AM GMT',
+    'Sat, 29 Feb 2028 23:59:59 +0000',
+]
+
+@pytest.mark.parametrize('value', RFC822_DATES)
+def test_matches_email_utils(value):
+    assert DateParser.to_epoch(value) == int(parsedate_to_datetime(value).timestamp())
+
+@pytest.mark.parametrize('value', RFC822_DATES + ['2026-10-16T21:30:00+02:00', '2026-10-16T21:30:00.123Z'])
+def test_matches_feedparser(value):
+    assert DateParser.to_epoch(value) == calendar.timegm(feedparser.datetimes._parse_date(value))
+
+# Both references take AM/PM for a zone name, so they read these as morning
+# times and drop any offset that follows
+MERIDIEM_DATES = [
+    ('16 Oct 2026 09:30 PM', datetime(2026, 10, 16, 21, 30)),
+    ('Tue, 13 Oct 2026 12:15:00 PM +0200', datetime(2026, 10, 13, 10, 15)),
+    ('16 Oct 2026 09:30 PM +0200', datetime(2026, 10, 16, 19, 30)),
+    ('Fri, 16 Oct 2026 12:05:00 AM GMT', datetime(2026, 10, 16, 0, 5)),
+    ('Oct 16, 2026 9:30 PM', datetime(2026, 10, 16, 21, 30)),
+    ('October 16, 2026 at 9:30 pm (SAST)', datetime(2026, 10, 16, 21, 30)),
+]
+
+@pytest.mark.parametrize('value, expected', MERIDIEM_DATES)
+def test_meridiem_is_not_a_zone(value, expected):
+    assert DateParser.to_epoch(value) == int(expected.replace(tzinfo=timezone.utc).timestamp())
+
+@pytest.mark.parametrize('value', ['', 'yesterday', '31 Feb 2026 10:00 GMT', '16 Oct 2026 13:30 PM',
+                                   'Tue, 13 Oct 2026 08:00:00 +2500', '2026-13-01'])
+def test_unreadable_dates_give_none(value):
+    assert DateParser.to_epoch(value) is None
+
+def test_normalizer_falls_back_to_the_next_field():
+    normalizer = DateNormalizer()
+    entry = {'published': 'not a date', 'updated': 'Tue, 13 Oct 2026 08:00:00 +0200 (SAST)'}
+    assert normalizer.timestamp(entry, 'Wire') == 1791871200
+    assert normalizer.hints['Wire'] == ('updated', 0)
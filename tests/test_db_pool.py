@@ -0,0 +1,83 @@
+# tests/test_db_pool.py
+import sqlite3
+import threading
+
+import pytest
+
+from utils.db_pool import ConnectionPool
+
+@pytest.fixture
+def pool(tmp_path):
+    connection_pool = ConnectionPool(str(tmp_path / 'pool.db'), {'journal_mode': 'WAL'})
+    conn = connection_pool.connection()
+    conn.execute("CREATE TABLE notes (body TEXT)")
+    conn.commit()
+    conn.close()
+    yield connection_pool
+    connection_pool.close_all()
+
+def count(pool):
+    conn = pool.connection()
+    try:
+        return conn.execute("SELECT COUNT(*) FROM notes").fetchone()[0]
+    finally:
+        conn.close()
+
+def test_nested_checkouts_share_one_transaction(pool):
+    outer = pool.connection()
+    inner = pool.connection()
+    assert inner is outer
+
+    inner.execute("INSERT INTO notes VALUES ('draft')")
+    inner.close()
+    # A helper closing its checkout must not end the caller's transaction
+    assert outer.in_transaction
+    outer.commit()
+    outer.close()
+    assert count(pool) == 1
+
+def test_outermost_close_rolls_back_uncommitted_writes(pool):
+    outer = pool.connection()
+    outer.execute("INSERT INTO notes VALUES ('draft')")
+    inner = pool.connection()
+    inner.close()
+    outer.close()
+
+    assert not outer.in_transaction
+    assert count(pool) == 0
+
+def test_release_ends_checkouts_that_were_never_closed(pool):
+    conn = pool.connection()
+    pool.connection()
+    conn.execute("INSERT INTO notes VALUES ('leaked')")
+    pool.release()
+
+    assert conn.checkouts == 0 and not conn.in_transaction
+    assert count(pool) == 0
+
+def test_one_connection_per_thread_reused_across_checkouts(pool):
+    first = pool.connection()
+    first.close()
+    assert pool.connection() is first
+    pool.release()
+
+    other = []
+    thread = threading.Thread(target=lambda: other.append(pool.connection()))
+    thread.start()
+    thread.join()
+    assert other[0] is not first
+    assert pool.opened == 2
+
+    # A forked child never reuses its parent's connection
+    pool.local.pid = -1
+    assert pool.connection() is not first
+    pool.release()
+
+def test_close_all_closes_every_thread_connection(pool):
+    conn = pool.connection()
+    conn.close()
+    pool.close_all()
+
+    with pytest.raises(sqlite3.ProgrammingError):
+        conn.execute("SELECT 1")
+    assert pool.connection() is not conn
@@ -0,0 +1,24 @@
+# tests/test_feed_profiles.py
+import pytest
+
+def profile(feed_url, strategy='feedparser', failures=0):
+    return {'feed_url': feed_url, 'strategy': strategy, 'verified_at': '2026-10-17 08:00:00', 'failures': failures}
+
+@pytest.fixture
+def source():
+    return {'name': 'BusinessTech', 'url': 'https://businesstech.example/feed', 'base_url': 'https://businesstech.example'}
+
+def test_profile_for_a_listed_url_is_used(fetcher, source):
+    fetcher.feed_profiles[source['name']] = profile('https://businesstech.example/rss')
+    assert fetcher.get_feed_profile(source)['feed_url'] == 'https://businesstech.example/rss'
+
+def test_profile_for_an_old_url_is_ignored(fetcher, source):
+    fetcher.feed_profiles[source['name']] = profile('https://old-host.example/feed')
+    assert fetcher.get_feed_profile(source) is None
+    assert fetcher.get_profile_plan(source, None) == (fetcher.get_url_variations(source), True)
+
+def test_scrape_profile_follows_base_url(fetcher, source):
+    fetcher.feed_profiles[source['name']] = profile('https://businesstech.example', strategy='scrape')
+    assert fetcher.get_feed_profile(source) is not None
+    source['base_url'] = 'https://new.businesstech.example'
+    assert fetcher.get_feed_profile(source) is None
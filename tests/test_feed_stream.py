@@ -0,0 +1,66 @@
+# tests/test_feed_stream.py
+from utils.feed_stream import FeedStreamParser
+
+def rss(count, first=0):
+    items = ''.join(
+        f'<item><title>Story {n}</title><link>https://feeds.example/{n}</link><guid>story-{n}</guid>'
+        f'<description>{"Body text. " * 20}</description></item>'
+        for n in range(first, first + count))
+    return f'<?xml version="1.0"?><rss version="2.0"><channel><title>t</title>{items}</channel></rss>'.encode()
+
+def stream(parser, body, chunk_size=256):
+    """Feed body in chunks the way the fetch loop does; returns the bytes handed over"""
+    handed = 0
+    for offset in range(0, len(body), chunk_size):
+        handed += chunk_size
+        if parser.feed(body[offset:offset + chunk_size]):
+            break
+    return handed
+
+def test_byte_cap_stops_reading_and_keeps_complete_entries():
+    body = rss(50)
+    parser = FeedStreamParser(max_entries=100, max_bytes=4000)
+    handed = stream(parser, body)
+    feed = parser.finish()
+
+    assert handed < len(body)
+    assert parser.bytes_read == len(parser.body()) == 4000
+    assert feed.truncated and not parser.complete
+    # Only entries closed inside the cap are kept, newest first
+    assert 0 < len(feed.entries) < 50
+    assert [entry.title for entry in feed.entries] == [f'Story {n}' for n in range(len(feed.entries))]
+
+def test_stops_after_enough_seen_entries_in_a_row():
+    seen = {'story-3', 'story-4', 'story-5', 'story-7'}
+    body = rss(40)
+    parser = FeedStreamParser(max_entries=100, is_seen=lambda entry: entry.guid in seen, stop_after_seen=2)
+    handed = stream(parser, body)
+    feed = parser.finish()
+
+    assert handed < len(body)
+    assert feed.stopped_at_seen and not feed.truncated
+    assert [entry.guid for entry in feed.entries] == ['story-0', 'story-1', 'story-2']
+
+def test_a_lone_seen_entry_is_skipped_not_a_stop():
+    seen = {'story-1'}
+    parser = FeedStreamParser(max_entries=100, is_seen=lambda entry: entry.guid in seen, stop_after_seen=2)
+    stream(parser, rss(4))
+    feed = parser.finish()
+
+    assert not feed.stopped_at_seen and parser.complete
+    assert [entry.guid for entry in feed.entries] == ['story-0', 'story-2', 'story-3']
+
+def test_stops_at_max_entries():
+    body = rss(40)
+    parser = FeedStreamParser(max_entries=5)
+    assert stream(parser, body) < len(body)
+    assert [entry.guid for entry in parser.finish().entries] == [f'story-{n}' for n in range(5)]
+
+def test_malformed_body_is_buffered_for_the_lenient_parser():
+    body = rss(3).replace(b'</title><link>', b'</title><link>&nbsp;', 1)
+    parser = FeedStreamParser(max_entries=100)
+    stream(parser, body)
+    parser.finish()
+
+    assert parser.failed
+    assert parser.body() == body
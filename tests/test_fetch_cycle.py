@@ -0,0 +1,47 @@
+# tests/test_fetch_cycle.py
+import time
+
+def test_straggler_does_not_write_into_the_next_cycle(fetcher, conn, feed_server):
+    source = {'name': 'SlowSource', 'url': f'{feed_server}/slow/feed', 'base_url': feed_server,
+              'category': 'news', 'color': '#000', 'icon': 'rss'}
+    fetcher.load_feed_cache(conn)
+    fetcher.load_feed_profiles(conn)
+    fetcher.load_watermarks(conn)
+    first = fetcher.cycle
+
+    # The budget runs out while the source is still downloading
+    assert list(fetcher.fetch_feeds_concurrently([source], budget_seconds=0.2)) == []
+    fetcher.start_fetch_run(conn, 'manual')
+    second = fetcher.cycle
+    assert second is not first
+
+    deadline = time.monotonic() + 5
+    while 'SlowSource' not in first.profile_updates and time.monotonic() < deadline:
+        time.sleep(0.05)
+
+    assert first.cache_updates['SlowSource']['etag'] == '"/slow/feed"'
+    assert second.cache_updates == {} and second.profile_updates == {} and second.traces == {}
+
+def test_cycle_normalizes_in_the_process_pool(app, fetcher, conn, feed_server, monkeypatch):
+    source = {'name': 'PoolSource', 'url': f'{feed_server}/feed', 'base_url': feed_server,
+              'category': 'news', 'color': '#000', 'icon': 'rss'}
+    monkeypatch.setattr(app.FlaskConfig, 'NORMALIZE_PROCESSES', 1)
+    fetcher.load_feed_cache(conn)
+    fetcher.load_feed_profiles(conn)
+    fetcher.load_watermarks(conn)
+
+    def in_thread(*args, **kwargs):
+        raise AssertionError('normalized in the fetch thread')
+
+    # Only a pool failure falls back to this instance's normalize_entries
+    fetcher.normalize_entries = in_thread
+    try:
+        results = list(fetcher.fetch_feeds_concurrently([source], budget_seconds=30))
+        assert fetcher.normalize_pool is not None
+        assert fetcher.normalize_pool._mp_context.get_start_method() != 'fork'
+    finally:
+        if fetcher.normalize_pool is not None:
+            fetcher.normalize_pool.shutdown()
+
+    [(_, _, articles, _)] = results
+    assert [article['title'] for article in articles] == ['Rand firms against the dollar']
@@ -0,0 +1,77 @@
+# tests/test_fetch_lease.py
+from utils.near_duplicates import SimHash
+
+def test_term_changes_only_when_leadership_starts(app):
+    lease, other = app.FetchLease(app.get_db_path(), ttl=30), app.FetchLease(app.get_db_path(), ttl=30)
+    try:
+        assert lease.acquire() and lease.term == 1
+        assert lease.acquire() and lease.term == 1  # renewal
+        assert not other.acquire()
+        lease.release()
+        assert other.acquire()
+        other.release()
+        assert lease.acquire() and lease.term == 2
+    finally:
+        lease.release()
+        other.release()
+
+def test_index_is_rebuilt_when_leadership_comes_back(app, fetcher, conn):
+    other = app.FetchLease(app.get_db_path(), ttl=30)
+    try:
+        assert fetcher.lease.acquire()
+        fetcher.load_near_duplicate_index(conn)
+        fetcher.lease.release()
+
+        # Another process leads for a while and writes a post
+        assert other.acquire()
+        signature = SimHash.signature('Taxi strike ends', 'Operators agreed to return to the roads on Monday.')
+        post_id = conn.execute(
+            "INSERT INTO posts (title, slug, content, source_url, source_name, simhash) VALUES (?, ?, ?, ?, ?, ?)",
+            ('Taxi strike ends', 'taxi-strike-ends', 'Body', 'https://x.example/taxi', 'Wire', SimHash.to_db(signature))
+        ).lastrowid
+        conn.commit()
+        other.release()
+
+        assert fetcher.lease.acquire()
+        fetcher.load_near_duplicate_index(conn)
+        assert fetcher.near_duplicates.find(signature, exclude_source='Outlet') == (post_id, 0)
+    finally:
+        fetcher.lease.release()
+        other.release()
+
+class StopLoop(BaseException):
+    pass
+
+def test_takeover_reloads_schedule_and_breakers(app, conn, monkeypatch):
+    conn.execute("INSERT INTO source_schedule (source_name, interval_minutes, next_poll_at) "
+                 "VALUES ('Wire', 30, '2099-01-01 00:00:00')")
+    conn.execute("INSERT INTO source_health (source_name, state, consecutive_failures, next_attempt_at) "
+                 "VALUES ('Wire', 'open', 3, '2099-01-01 00:00:00')")
+    conn.commit()
+
+    # This process last led before another one polled Wire and tripped its breaker
+    monkeypatch.setattr(app.fetcher, 'poll_schedule', {})
+    monkeypatch.setattr(app.fetcher, 'source_health', {})
+    monkeypatch.setattr(app.fetcher.lease, 'is_leader', lambda: False)
+    monkeypatch.setattr(app.fetcher.lease, 'acquire', lambda: True)
+    monkeypatch.setattr(app.fetcher.lease, 'take_fetch_request', lambda: False)
+    monkeypatch.setattr(app.fetcher, 'seconds_until_next_poll', lambda: 60)
+    sleeps = []
+
+    def sleep(seconds):
+        sleeps.append(seconds)
+        if len(sleeps) > 1:
+            raise StopLoop
+
+    monkeypatch.setattr(app.time, 'sleep', sleep)
+    try:
+        app.run_fetch_loop()
+    except StopLoop:
+        pass
+    finally:
+        conn.execute("DELETE FROM source_schedule WHERE source_name = 'Wire'")
+        conn.execute("DELETE FROM source_health WHERE source_name = 'Wire'")
+        conn.commit()
+
+    assert app.fetcher.poll_schedule['Wire']['next_poll_at'] == '2099-01-01 00:00:00'
+    assert app.fetcher.source_health['Wire']['state'] == 'open'
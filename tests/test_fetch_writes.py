@@ -0,0 +1,64 @@
+# tests/test_fetch_writes.py
+import sqlite3
+import threading
+import time
+
+def add_viewed_post(conn):
+    conn.execute("INSERT INTO posts (title, slug, content, source_url, source_name) "
+                 "VALUES ('Viewed', 'viewed', 'Body', 'https://x.example/viewed', 'Wire')")
+    conn.commit()
+
+def bump_views(app, timeout):
+    """post_detail's view update on a connection of its own; returns seconds taken"""
+    other = sqlite3.connect(app.get_db_path(), timeout=timeout)
+    try:
+        started = time.monotonic()
+        other.execute("UPDATE posts SET views = views + 1 WHERE slug = 'viewed'")
+        other.commit()
+        return time.monotonic() - started
+    finally:
+        other.close()
+
+def test_views_are_not_blocked_while_feeds_download(app, fetcher, conn, feed_server):
+    add_viewed_post(conn)
+    fetcher.NEWS_SOURCES = [{'name': 'SlowWire', 'url': f'{feed_server}/slow/feed', 'base_url': feed_server,
+                             'category': 'news', 'color': '#000', 'icon': 'rss'}]
+    saved = []
+    fetch = threading.Thread(target=lambda: saved.append(fetcher.fetch_and_save()))
+    fetch.start()
+
+    # A write lock held across the download would make these time out
+    waits = []
+    while fetch.is_alive():
+        waits.append(bump_views(app, timeout=0.1))
+    fetch.join()
+    fetcher.lease.release()
+
+    assert saved == [1]
+    assert len(waits) > 1 and max(waits) < 0.1
+
+def test_view_update_waits_out_a_source_write(app, fetcher, conn):
+    add_viewed_post(conn)
+    write_open = threading.Event()
+
+    def write_source():
+        # The fetch writer's own pooled connection, mid-way through a source
+        writer = app.get_db_connection()
+        try:
+            writer.execute("INSERT INTO posts (title, slug, content, source_url, source_name) "
+                           "VALUES ('Batch', 'batch', 'Body', 'https://x.example/batch', 'Wire')")
+            write_open.set()
+            time.sleep(0.3)
+            writer.commit()
+        finally:
+            writer.close()
+            app.db_pool.release()
+
+    writer = threading.Thread(target=write_source)
+    writer.start()
+    assert write_open.wait(2)
+    waited = bump_views(app, timeout=app.FlaskConfig.DB_BUSY_TIMEOUT_SECONDS)
+    writer.join()
+
+    assert 0.1 < waited < app.FlaskConfig.DB_BUSY_TIMEOUT_SECONDS
+    assert conn.execute("SELECT views FROM posts WHERE slug = 'viewed'").fetchone()[0] == 1
@@ -0,0 +1,113 @@
+# tests/test_html_cleaner.py
+"""
+The streaming cleaner against the BeautifulSoup implementation it replaced
+"""
+
+import html
+import random
+from types import SimpleNamespace
+
+import pytest
+
+bs4 = pytest.importorskip('bs4')
+
+def soup_clean_html_content(html_content, max_length=2000):
+    """clean_html_content as it was before utils/html_cleaner.py"""
+    if isinstance(html_content, list):
+        html_content = html_content[0].value if hasattr(html_content[0], 'value') else str(html_content[0])
+    elif isinstance(html_content, dict):
+        html_content = html_content.get('value', '')
+    soup = bs4.BeautifulSoup(str(html_content), 'html.parser')
+
+    for tag in ['script', 'style', 'iframe', 'nav', 'header', 'footer',
+                'aside', 'form', 'button', 'input', 'select', 'textarea']:
+        for element in soup.find_all(tag):
+            element.decompose()
+    for cls in ['advertisement', 'ad', 'sidebar', 'navigation', 'comments', 'share', 'related', 'promo']:
+        for element in soup.find_all(class_=lambda x: x and cls in x.lower()):
+            element.decompose()
+
+    text = ' '.join(html.unescape(soup.get_text(separator=' ', strip=True)).split())
+    if len(text) > max_length:
+        truncated = text[:max_length]
+        last_period = truncated.rfind('. ')
+        last_sentence = truncated.rfind('.')
+        if last_period > max_length * 0.5:
+            text = truncated[:last_period + 1] + '..'
+        elif last_sentence > max_length * 0.5:
+            text = truncated[:last_sentence + 1] + '..'
+        else:
+            text = truncated + '...'
+    return text
+
+ARTICLE = ('<div class="entry-content"><header><h1>Site</h1></header><img src="/wp-content/lead.jpg" alt="">'
+           '<p>Eskom said on Tuesday that load shedding would be suspended &ndash; for now. '
+           '<a href="/x">Read more</a></p><div class="advert-top ad">Buy now</div>'
+           + ''.join(f'<p>Paragraph {i} of the story, with <b>bold</b> &amp; <i>italic</i> text. '
+                     f'It runs on for a while so truncation has something to cut.</p>' for i in range(40))
+           + '<aside class="sidebar">Trending</aside><div class="share-buttons"><button>Share</button></div>'
+           '<script>track()</script><footer>(c) 2026</footer></div>')
+
+FIXTURES = [
+    ARTICLE,
+    '<p>Hello <b>world</b></p><div class="ad-box">buy</div><p>after</p>',
+    '<p>One &amp;amp; two</p><script>x</script><p>three',
+    '<div class="Header">hi</div><p>x</p>',
+    '<p>a<br>b</p><img src="/x.png"><p>c</p>',
+    '<ul><li>one<li>two</ul></p>stray</div> text',
+    '<div><p>unclosed <span class="share">s</span> end',
+    '<p>&lt;tag&gt; text &nbsp; more</p>',
+    '<![CDATA[ data ]]><p>x</p>',
+    '<!-- c -->a<!-- d -->b',
+    'plain &amp; simple',
+    '<table><tr><td>a</td><td>b</td></tr></table>',
+    '<p class="ad">x</p><p class="AD">y</p><p>z</p>',
+    '<div class="x"><aside>s</aside>keep</div>',
+    '<p>a</p ><p>b</P>',
+    '<select><option>x</select>after',
+    '<textarea><p>t</p></textarea>after',
+    '<a href=x>link</a> text <i>it</i>',
+    '<div class=""><p>ok</p></div>',
+    '<p>5 < 6 and 7 > 3</p>',
+    '<p>&#8220;quoted&#8221; &hellip;</p>',
+    '<template><p>t</p></template>after',
+    '<input value=1>after<p>p</p>',
+    '<p>para <iframe src=x>inner</iframe> after</p>',
+    '<div class="related-posts"><p>r</p></div><p>main</p>',
+    '<p>x</p></div></div><p>y</p>',
+    '<b><i>bi</b>after</i>z',
+    '<noscript>ns</noscript>t',
+    '<p>a<textarea>b',
+    {'value': '<p>From a dict</p>'},
+    [SimpleNamespace(value='<p>From a content list</p>')],
+]
+
+def fuzzed_fragments(count=1000, seed=1):
+    tags = ['p', 'div', 'span', 'b', 'i', 'a', 'script', 'style', 'aside', 'nav', 'br', 'img', 'ul', 'li',
+            'table', 'td', 'header']
+    classes = ['', 'ad', 'share', 'lead', 'header', 'badge', 'x', 'related', 'promo-box', 'main']
+    words = ['hello', 'world', '&amp;', '&nbsp;', '<', '>', 'text', '.', 'Eskom', '&#39;', '  \n ']
+    rng = random.Random(seed)
+    for _ in range(count):
+        out = []
+        for _ in range(rng.randint(1, 25)):
+            r = rng.random()
+            if r < 0.35:
+                cls = rng.choice(classes)
+                out.append(f'<{rng.choice(tags)}' + (f' class="{cls}"' if cls else '') + '>')
+            elif r < 0.55:
+                out.append(f'</{rng.choice(tags)}>')
+            else:
+                out.append(' '.join(rng.choice(words) for _ in range(rng.randint(1, 4))))
+        yield ''.join(out)
+
+@pytest.mark.parametrize('max_length', [40, 250, 2000])
+def test_matches_beautifulsoup_on_fixtures(fetcher, max_length):
+    for fragment in FIXTURES:
+        assert fetcher.clean_html_content(fragment, max_length) == soup_clean_html_content(fragment, max_length), fragment
+
+@pytest.mark.parametrize('max_length', [40, 250, 2000])
+def test_matches_beautifulsoup_on_fuzzed_fragments(fetcher, max_length):
+    mismatches = [fragment for fragment in fuzzed_fragments()
+                  if fetcher.clean_html_content(fragment, max_length) != soup_clean_html_content(fragment, max_length)]
+    assert mismatches == []
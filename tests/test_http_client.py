@@ -0,0 +1,116 @@
+# tests/test_http_client.py
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, HTTPServer
+
+import pytest
+import requests
+from urllib3.exceptions import ConnectTimeoutError, MaxRetryError, NewConnectionError
+from urllib3.response import HTTPResponse
+
+from utils.http_client import CappedRetry, HTTPClient
+
+def unavailable(retry_after):
+    return HTTPResponse(body=b'', status=503, headers={'Retry-After': retry_after}, preload_content=False)
+
+def test_retry_after_is_capped():
+    retry = CappedRetry(total=2, status_forcelist=(503,), max_retry_after=5)
+    assert retry.get_retry_after(unavailable('3600')) == 5
+    assert retry.get_retry_after(unavailable('2')) == 2
+
+    # The cap survives the copy urllib3 makes after each attempt
+    retry = retry.increment('GET', '/feed', response=unavailable('3600'))
+    assert retry.get_retry_after(unavailable('3600')) == 5
+
+def test_503_with_long_retry_after_does_not_block():
+    calls = []
+
+    class Unavailable(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(self.path)
+            self.send_response(503)
+            self.send_header('Retry-After', '3600')
+            self.send_header('Content-Length', '0')
+            self.end_headers()
+
+        def log_message(self, *args):
+            pass
+
+    server = HTTPServer(('127.0.0.1', 0), Unavailable)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    client = HTTPClient(retries=2, backoff_factor=0, timeout=0.3)
+    try:
+        started = time.monotonic()
+        response = client.get(f'http://127.0.0.1:{server.server_port}/feed')
+        elapsed = time.monotonic() - started
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert response.status_code == 503
+    assert len(calls) == 3
+    assert elapsed < 2
+
+def serve(handler):
+    server = HTTPServer(('127.0.0.1', 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server
+
+def test_connect_timeout_is_not_retried():
+    retry = CappedRetry(total=2, connect=2, read=2, other=0)
+    with pytest.raises(MaxRetryError):
+        retry.increment('GET', '/feed', error=ConnectTimeoutError('timed out'))
+
+    # A refused connection fails fast, so it gets another try
+    retry = retry.increment('GET', '/feed', error=NewConnectionError(None, 'refused'))
+    assert retry.connect == 1
+
+def test_read_timeout_is_not_retried():
+    calls = []
+
+    class Slow(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(self.path)
+            time.sleep(0.5)
+
+        def log_message(self, *args):
+            pass
+
+    server = serve(Slow)
+    client = HTTPClient(retries=2, backoff_factor=0, timeout=0.2)
+    try:
+        with pytest.raises(requests.exceptions.ConnectionError):
+            client.get(f'http://127.0.0.1:{server.server_port}/feed')
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert len(calls) == 1
+
+def test_reset_connection_is_retried():
+    calls = []
+
+    class DropsFirst(BaseHTTPRequestHandler):
+        def do_GET(self):
+            calls.append(self.path)
+            if len(calls) == 1:
+                self.close_connection = True
+                return
+            self.send_response(200)
+            self.send_header('Content-Length', '2')
+            self.end_headers()
+            self.wfile.write(b'ok')
+
+        def log_message(self, *args):
+            pass
+
+    server = serve(DropsFirst)
+    client = HTTPClient(retries=2, backoff_factor=0)
+    try:
+        response = client.get(f'http://127.0.0.1:{server.server_port}/feed')
+    finally:
+        client.close()
+        server.shutdown()
+
+    assert response.status_code == 200
+    assert len(calls) == 2
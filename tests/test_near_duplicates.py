@@ -0,0 +1,87 @@
+# tests/test_near_duplicates.py
+from app import ContentIdentity, MinimalFeed, SimHash
+
+TEMPLATE_BODY = ' '.join(
+    f"Load shedding schedule update number {i} applies to all suburbs in the metro until further notice"
+    for i in range(12))
+
+def make_article(source, title, body, url):
+    return {
+        'title': title,
+        'slug': ContentIdentity.title_fingerprint(title, source['name'])[:40] + str(abs(hash(url)) % 10 ** 8),
+        'canonical_url': ContentIdentity.canonical_url(url),
+        'title_fingerprint': ContentIdentity.title_fingerprint(title, source['name']),
+        'content': body,
+        'excerpt': body[:200],
+        'image_url': None,
+        'source_url': url,
+        'pub_date': '2026-10-17 08:00:00',
+        'published_at': 1792224000,
+        'guids': [url],
+        'simhash': SimHash.signature(title, body),
+    }
+
+def save(fetcher, conn, source, articles):
+    feed = MinimalFeed()
+    feed.entries = articles
+    saved = fetcher.save_source_entries(conn, source, feed, articles)
+    conn.commit()
+    fetcher.index_saved_signatures(source)
+    return saved
+
+def source(name):
+    return {'name': name, 'category': 'news', 'url': f'https://{name.lower()}.example/feed'}
+
+def test_signature_includes_headline():
+    assert SimHash.signature('Eskom cuts power', TEMPLATE_BODY) != SimHash.signature('Water outage in Soweto', TEMPLATE_BODY)
+
+def test_same_source_templated_bodies_are_all_saved(fetcher, conn):
+    city = source('CityNotices')
+    headlines = ['Stage 2 tonight in Soweto', 'Stage 4 from Monday in Sandton', 'Water outage in Tembisa',
+                 'Road closure on the N1 north', 'Refuse collection delayed in Midrand']
+    articles = [make_article(city, title, TEMPLATE_BODY, f'https://citynotices.example/n/{i}')
+                for i, title in enumerate(headlines)]
+
+    assert save(fetcher, conn, city, articles) == 5
+    assert conn.execute("SELECT COUNT(*) FROM post_duplicates").fetchone()[0] == 0
+
+    # Another notice on the same template a cycle later is still a new post
+    later = make_article(city, 'Power restored in Alexandra', TEMPLATE_BODY, 'https://citynotices.example/n/9')
+    assert save(fetcher, conn, city, [later]) == 1
+
+def test_cross_source_syndicated_copy_is_linked(fetcher, conn):
+    wire, outlet = source('WireDesk'), source('Outlet')
+    body = ' '.join(f"Parliament adopted the revised budget on Tuesday after a long debate item {i}" for i in range(20))
+    original = make_article(wire, 'Parliament adopts revised budget', body, 'https://wiredesk.example/budget')
+    assert save(fetcher, conn, wire, [original]) == 1
+    original_id = conn.execute("SELECT id FROM posts WHERE source_name = 'WireDesk'").fetchone()[0]
+
+    copy = make_article(outlet, 'Parliament adopts the revised budget', body + ' Additional reporting by staff.',
+                        'https://outlet.example/politics/budget-adopted')
+    assert save(fetcher, conn, outlet, [copy]) == 0
+
+    link = conn.execute("SELECT post_id, source_name, canonical_url FROM post_duplicates").fetchall()
+    assert [tuple(row) for row in link] == [(original_id, 'Outlet', copy['canonical_url'])]
+    assert conn.execute("SELECT COUNT(*) FROM posts WHERE source_name = 'Outlet'").fetchone()[0] == 0
+
+def test_existing_posts_are_signed_in_chunks(app, conn, monkeypatch):
+    conn.executemany(
+        "INSERT INTO posts (title, slug, content, source_url, source_name, simhash, simhash_version) "
+        "VALUES (?, ?, ?, ?, 'Wire', ?, ?)",
+        [(f'Story {i}', f'story-{i}', f'Body of story {i} about the rand', f'https://x.example/{i}',
+          None if i % 2 else 1, None if i % 2 else 1) for i in range(7)])
+    conn.commit()
+
+    commits = []
+    monkeypatch.setattr(app.FlaskConfig, 'SIMHASH_BACKFILL_CHUNK', 3)
+    conn.set_trace_callback(lambda statement: statement == 'COMMIT' and commits.append(statement))
+    try:
+        app.sign_existing_posts(conn)
+    finally:
+        conn.set_trace_callback(None)
+
+    assert len(commits) == 3
+    assert not conn.in_transaction
+    rows = conn.execute("SELECT title, content, simhash, simhash_version FROM posts").fetchall()
+    assert all(row['simhash_version'] == app.SIGNATURE_VERSION and
+               SimHash.from_db(row['simhash']) == SimHash.signature(row['title'], row['content']) for row in rows)
@@ -0,0 +1,59 @@
+# tests/test_poll_schedule.py
+from datetime import datetime, timedelta
+
+import pytest
+
+SOURCE = {'name': 'PacedSource'}
+
+def schedule(fetcher):
+    return fetcher.poll_schedule[SOURCE['name']]
+
+def test_interval_follows_the_smoothed_publication_rate(app, fetcher, conn):
+    fetcher.load_poll_schedule(conn)
+    config = app.FlaskConfig
+    now = datetime(2026, 10, 17, 8, 0)
+
+    # The first poll only records when it happened: its backlog is not a rate
+    fetcher.update_poll_schedule(conn, SOURCE, 20, True, now)
+    assert schedule(fetcher)['new_per_hour'] is None
+    assert schedule(fetcher)['interval_minutes'] == config.UPDATE_INTERVAL_MINUTES
+    assert not fetcher.is_poll_due(SOURCE, now + timedelta(minutes=config.UPDATE_INTERVAL_MINUTES - 1))
+    assert fetcher.is_poll_due(SOURCE, now + timedelta(minutes=config.UPDATE_INTERVAL_MINUTES))
+
+    now += timedelta(hours=1)
+    fetcher.update_poll_schedule(conn, SOURCE, 6, True, now)
+    assert schedule(fetcher)['new_per_hour'] == 6
+    assert schedule(fetcher)['interval_minutes'] == pytest.approx(config.POLL_TARGET_NEW_ENTRIES / 6 * 60)
+
+    now += timedelta(minutes=30)
+    fetcher.update_poll_schedule(conn, SOURCE, 0, True, now)
+    rate = (1 - config.POLL_RATE_SMOOTHING) * 6
+    assert schedule(fetcher)['new_per_hour'] == pytest.approx(rate)
+    assert schedule(fetcher)['interval_minutes'] == pytest.approx(config.POLL_TARGET_NEW_ENTRIES / rate * 60)
+
+    # A failed poll reschedules on the same interval and leaves the rate alone
+    fetcher.update_poll_schedule(conn, SOURCE, 0, False, now + timedelta(minutes=5))
+    assert schedule(fetcher)['new_per_hour'] == pytest.approx(rate)
+    assert schedule(fetcher)['last_polled_at'] == now.strftime('%Y-%m-%d %H:%M:%S')
+    conn.commit()
+
+    # The persisted row is what the next process starts from
+    fetcher.load_poll_schedule(conn)
+    assert schedule(fetcher)['new_per_hour'] == pytest.approx(rate)
+
+def test_interval_stays_within_bounds(app, fetcher, conn):
+    fetcher.load_poll_schedule(conn)
+    config = app.FlaskConfig
+    now = datetime(2026, 10, 17, 8, 0)
+    fetcher.update_poll_schedule(conn, SOURCE, 0, True, now)
+
+    now += timedelta(hours=1)
+    fetcher.update_poll_schedule(conn, SOURCE, 500, True, now)
+    assert schedule(fetcher)['interval_minutes'] == config.POLL_MIN_MINUTES
+
+    # A source gone quiet backs off until the ceiling, and no further
+    for _ in range(40):
+        now += timedelta(minutes=schedule(fetcher)['interval_minutes'])
+        fetcher.update_poll_schedule(conn, SOURCE, 0, True, now)
+        assert config.POLL_MIN_MINUTES <= schedule(fetcher)['interval_minutes'] <= config.POLL_MAX_MINUTES
+    assert schedule(fetcher)['interval_minutes'] == config.POLL_MAX_MINUTES
@@ -0,0 +1,54 @@
+# tests/test_post_counts.py
+
+def add_post(conn, slug, category_id=1, source_name='Wire', is_published=1):
+    conn.execute(
+        "INSERT INTO posts (title, slug, content, source_url, category_id, source_name, is_published) "
+        "VALUES (?, ?, 'Body', ?, ?, ?, ?)",
+        (slug, slug, f'https://x.example/{slug}', category_id, source_name, is_published))
+    conn.commit()
+
+def counts(conn):
+    categories = {row[0]: row[1] for row in conn.execute(
+        "SELECT category_id, post_count FROM category_post_counts WHERE post_count != 0")}
+    sources = {row[0]: row[1] for row in conn.execute(
+        "SELECT source_name, post_count FROM source_post_counts WHERE post_count != 0")}
+    return categories, sources
+
+def test_insert_and_delete(conn):
+    add_post(conn, 'a')
+    add_post(conn, 'b', category_id=2, source_name='Desk')
+    add_post(conn, 'draft', is_published=0)
+    assert counts(conn) == ({1: 1, 2: 1}, {'Wire': 1, 'Desk': 1})
+
+    conn.execute("DELETE FROM posts WHERE slug = 'a'")
+    conn.commit()
+    assert counts(conn) == ({2: 1}, {'Desk': 1})
+
+def test_category_and_publish_changes(conn):
+    add_post(conn, 'a')
+    conn.execute("UPDATE posts SET category_id = 3 WHERE slug = 'a'")
+    conn.commit()
+    assert counts(conn) == ({3: 1}, {'Wire': 1})
+
+    conn.execute("UPDATE posts SET is_published = 0 WHERE slug = 'a'")
+    conn.commit()
+    assert counts(conn) == ({}, {})
+
+    # View increments leave the counts alone
+    conn.execute("UPDATE posts SET is_published = 1 WHERE slug = 'a'")
+    conn.execute("UPDATE posts SET views = views + 1 WHERE slug = 'a'")
+    conn.commit()
+    assert counts(conn) == ({3: 1}, {'Wire': 1})
+
+def test_setup_recounts_after_reset(app, conn):
+    add_post(conn, 'a')
+    add_post(conn, 'b')
+    # reset_db.py drops posts, and the triggers with it, but not the counters
+    conn.execute("DROP TABLE posts")
+    conn.commit()
+    assert counts(conn) == ({1: 2}, {'Wire': 2})
+
+    assert app.setup_database()
+    assert counts(conn) == ({}, {})
+    add_post(conn, 'c', category_id=4)
+    assert counts(conn) == ({4: 1}, {'Wire': 1})
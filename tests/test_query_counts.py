@@ -0,0 +1,53 @@
+# tests/test_query_counts.py
+import pytest
+
+def add_posts(conn, count, start=0):
+    conn.executemany(
+        "INSERT INTO posts (title, slug, content, excerpt, source_url, category_id, source_name) "
+        "VALUES (?, ?, ?, ?, ?, ?, ?)",
+        [(f'Story {i}', f'story-{i}', 'Body text', 'Excerpt', f'https://x.example/{i}', i % 5 + 1, 'Wire')
+         for i in range(start, start + count)])
+    conn.commit()
+
+def count_queries(client, conn, path):
+    client.get(path)  # Warm the process-level caches
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        response = client.get(path)
+    finally:
+        conn.set_trace_callback(None)
+    assert response.status_code == 200
+    return len(statements)
+
+# Listings decorate posts from the category registry and read counts from
+# category_post_counts, so a page costs the same however many posts it shows
+EXPECTED_QUERIES = {
+    '/': 4,
+    '/category/news': 3,
+    '/post/story-0': 5,
+}
+
+@pytest.mark.parametrize('path', list(EXPECTED_QUERIES))
+def test_query_count_is_fixed(app, conn, path):
+    client = app.app.test_client()
+    add_posts(conn, 12)
+    assert count_queries(client, conn, path) == EXPECTED_QUERIES[path]
+
+    add_posts(conn, 40, start=12)
+    assert count_queries(client, conn, path) == EXPECTED_QUERIES[path]
+
+def test_listings_follow_publication_time(app, conn):
+    # Ingested in the opposite order to publication; the older story has no feed date
+    conn.executemany(
+        "INSERT INTO posts (title, slug, content, source_url, category_id, source_name, published_at, created_at) "
+        "VALUES (?, ?, 'Body', ?, 1, 'Wire', ?, ?)",
+        [('Published first story', 'published-first', 'https://x.example/a', 1500000000, '2026-10-17 09:00:00'),
+         ('Published last story', 'published-last', 'https://x.example/b', 1790000000, '2026-10-16 09:00:00')])
+    conn.commit()
+    page = app.app.test_client().get('/category/news').get_data(as_text=True)
+    assert page.index('Published last story') < page.index('Published first story')
+
+    plan = ' '.join(row[-1] for row in conn.execute(
+        "EXPLAIN QUERY PLAN SELECT * FROM posts WHERE is_published = 1 ORDER BY published_at DESC LIMIT 12"))
+    assert 'idx_posts_published_at' in plan and 'TEMP B-TREE' not in plan
@@ -0,0 +1,55 @@
+# tests/test_source_health.py
+from datetime import datetime, timedelta
+
+SOURCE = {'name': 'FlakySource'}
+
+def state(fetcher):
+    health = fetcher.source_health[SOURCE['name']]
+    return health['state'], health['consecutive_failures']
+
+def test_breaker_closed_open_half_open_closed(app, fetcher, conn):
+    fetcher.load_source_health(conn)
+    now = datetime(2026, 10, 17, 8, 0)
+    threshold = app.FlaskConfig.BREAKER_FAILURE_THRESHOLD
+
+    for failures in range(1, threshold):
+        fetcher.record_source_health(conn, SOURCE, False, now)
+        assert state(fetcher) == ('closed', failures)
+        assert fetcher.breaker_allows(SOURCE, now)
+
+    fetcher.record_source_health(conn, SOURCE, False, now)
+    assert state(fetcher) == ('open', threshold)
+    backoff = timedelta(minutes=app.FlaskConfig.BREAKER_BASE_BACKOFF_MINUTES)
+    assert not fetcher.breaker_allows(SOURCE, now + backoff - timedelta(seconds=1))
+
+    # Backoff over: one trial fetch goes through
+    assert fetcher.breaker_allows(SOURCE, now + backoff)
+    assert state(fetcher) == ('half_open', threshold)
+
+    fetcher.record_source_health(conn, SOURCE, True, now + backoff)
+    assert state(fetcher) == ('closed', 0)
+    conn.commit()
+
+    # The persisted row is what the next process starts from
+    fetcher.load_source_health(conn)
+    assert state(fetcher) == ('closed', 0)
+
+def test_failed_trial_reopens_with_doubled_backoff_up_to_the_cap(app, fetcher, conn):
+    fetcher.load_source_health(conn)
+    now = datetime(2026, 10, 17, 8, 0)
+    for _ in range(app.FlaskConfig.BREAKER_FAILURE_THRESHOLD):
+        fetcher.record_source_health(conn, SOURCE, False, now)
+
+    backoffs = []
+    for _ in range(10):
+        next_attempt = datetime.strptime(fetcher.source_health[SOURCE['name']]['next_attempt_at'],
+                                         '%Y-%m-%d %H:%M:%S')
+        backoffs.append((next_attempt - now) / timedelta(minutes=1))
+        now = next_attempt
+        assert fetcher.breaker_allows(SOURCE, now)
+        fetcher.record_source_health(conn, SOURCE, False, now)
+        assert state(fetcher)[0] == 'open'
+
+    base, cap = app.FlaskConfig.BREAKER_BASE_BACKOFF_MINUTES, app.FlaskConfig.BREAKER_MAX_BACKOFF_MINUTES
+    assert backoffs[:3] == [base, base * 2, base * 4]
+    assert backoffs[-1] == cap and max(backoffs) == cap
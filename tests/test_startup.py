@@ -0,0 +1,55 @@
+# tests/test_startup.py
+import os
+import subprocess
+import sys
+import threading
+import time
+
+def test_ready_recovers_after_failed_setup(app, monkeypatch):
+    attempts = []
+    second_attempt = threading.Event()
+    proceed = threading.Event()
+
+    def flaky_setup():
+        attempts.append(time.monotonic())
+        if len(attempts) == 1:
+            return False
+        second_attempt.set()
+        proceed.wait(5)
+        return True
+
+    monkeypatch.setattr(app, 'setup_database', flaky_setup)
+    monkeypatch.setattr(app, 'run_startup_fetch', lambda: None)
+    monkeypatch.setattr(app, 'start_auto_fetcher', lambda: None)
+    monkeypatch.setattr(app.FlaskConfig, 'FETCH_IN_WEB', True)
+    monkeypatch.setattr(app.FlaskConfig, 'STARTUP_RETRY_SECONDS', 0.05)
+    # Keep the first request from starting the real warm-up
+    monkeypatch.setattr(app, '_background_pid', os.getpid())
+    for key, value in (('database', False), ('caches', False), ('error', None), ('ready_at', None)):
+        monkeypatch.setitem(app.boot_state, key, value)
+
+    client = app.app.test_client()
+    booting = threading.Thread(target=app.warm_up)
+    booting.start()
+    try:
+        assert second_attempt.wait(5)
+        response = client.get('/ready')
+        assert response.status_code == 503
+        assert 'retrying' in response.get_json()['error']
+    finally:
+        proceed.set()
+        booting.join(5)
+
+    response = client.get('/ready')
+    assert response.status_code == 200
+    assert response.get_json()['error'] is None
+    assert len(attempts) == 2
+
+def test_import_leaves_optional_fetch_libraries_unloaded(tmp_path):
+    root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+    script = ("import sys, app; "
+              "print(sorted(m for m in ('aiohttp', 'feedparser', 'bs4') if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', script], cwd=tmp_path, capture_output=True, text=True,
+                            env={**os.environ, 'PYTHONPATH': root, 'FETCH_IN_WEB': 'false'}, timeout=60)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout.strip().splitlines()[-1] == '[]'
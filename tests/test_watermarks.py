@@ -0,0 +1,63 @@
+# tests/test_watermarks.py
+import time
+
+from test_feed_stream import rss
+
+SOURCE = {'name': 'WatermarkSource', 'url': 'https://feeds.example/feed', 'base_url': 'https://feeds.example',
+          'category': 'news', 'color': '#000', 'icon': 'rss'}
+
+def entries(app, numbers, published_at=None):
+    return [app.Entry(f'Story number {n}', f'https://feeds.example/{n}', guid=f'story-{n}',
+                      published_at=published_at) for n in numbers]
+
+def ingest(app, fetcher, conn, numbers, published_at=None):
+    feed = app.MinimalFeed()
+    feed.entries = entries(app, numbers, published_at)
+    articles = fetcher.normalize_entries(SOURCE, feed, watermark=fetcher.get_watermark(SOURCE))
+    fetcher.save_watermark(conn, SOURCE, articles)
+    conn.commit()
+    return articles
+
+def test_entries_are_matched_by_guid_link_or_age(app, fetcher, conn):
+    now = int(time.time())
+    fetcher.load_watermarks(conn)
+    ingest(app, fetcher, conn, [3, 2, 1], now)
+
+    # A restarted process reads the mark back from source_watermarks
+    fetcher.load_watermarks(conn)
+    watermark = fetcher.get_watermark(SOURCE)
+    grace = app.FlaskConfig.FEED_WATERMARK_GRACE_MINUTES * 60
+
+    assert fetcher.is_entry_seen(watermark, app.Entry('Story', 'https://other.example/x', guid='story-2'))
+    assert fetcher.is_entry_seen(watermark, app.Entry('Story', 'http://www.feeds.example/2?utm_source=rss'))
+    assert fetcher.is_entry_seen(watermark, app.Entry('Story', 'https://feeds.example/99', published_at=now - grace - 60))
+    assert not fetcher.is_entry_seen(watermark, app.Entry('Story', 'https://feeds.example/99', published_at=now - grace + 60))
+    assert not fetcher.is_entry_seen(watermark, app.Entry('Story', 'https://feeds.example/99', guid='story-99'))
+    assert not fetcher.is_entry_seen(None, app.Entry('Story', 'https://feeds.example/2', guid='story-2'))
+
+def test_collect_stops_at_the_first_seen_entry(app, fetcher, conn):
+    fetcher.load_watermarks(conn)
+    assert len(ingest(app, fetcher, conn, [3, 2, 1])) == 3
+
+    articles = ingest(app, fetcher, conn, [5, 4, 3, 2, 1])
+    assert [article['title'] for article in articles] == ['Story number 5', 'Story number 4']
+
+    # Nothing newer: no articles, and the mark stays where it was
+    assert ingest(app, fetcher, conn, [5, 4, 3]) == []
+    assert fetcher.get_watermark(SOURCE)['newest_guid'] == 'story-5'
+
+def test_stream_stops_reading_at_the_first_seen_entry(app, fetcher, conn):
+    fetcher.load_watermarks(conn)
+    ingest(app, fetcher, conn, [0])
+
+    stream = fetcher.new_feed_stream(SOURCE, 'feedparser')
+    # Two new stories on top of the one already ingested and 29 older ones
+    body = rss(32, first=-2)
+    for offset in range(0, len(body), 256):
+        if stream.feed(body[offset:offset + 256]):
+            break
+    feed = stream.finish()
+
+    assert feed.stopped_at_seen
+    assert stream.bytes_read < len(body)
+    assert [entry.guid for entry in feed.entries] == ['story--2', 'story--1']
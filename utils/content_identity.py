@@ -0,0 +1,72 @@
+# utils/content_identity.py
+"""
+Stable identity for ingested articles: canonical URLs and title fingerprints
+"""
+
+import hashlib
+import re
+import unicodedata
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
+
+# Query parameters that only track the click, never change the article
+TRACKING_PARAMS = {
+    'fbclid', 'gclid', 'dclid', 'msclkid', 'mc_cid', 'mc_eid', 'igshid',
+    'ref', 'ref_src', 'cmpid', 'ito', 'amp', 'outputtype', 'output', 'share'
+}
+TRACKING_PREFIXES = ('utm_', '_ga', '_gl')
+
+# Host prefixes that serve the same article on another hostname or layout
+ALTERNATE_HOST_PREFIXES = ('www.', 'm.', 'mobile.', 'amp.')
+
+class ContentIdentity:
+    @staticmethod
+    def canonical_url(url: str) -> str:
+        """Normalize an article URL so tracking and AMP/mobile variants match.
+
+        Drops fragments, utm_* and other tracking parameters, mobile/AMP
+        hosts and /amp path suffixes; lowercases the host, treats http and
+        https alike and sorts the remaining query parameters. A URL
+        urllib cannot split (bad port, unbalanced IPv6 brackets) is kept
+        as given, stripped.
+        """
+        if not url:
+            return ''
+
+        url = url.strip()
+        try:
+            parts = urlsplit(url)
+            port = parts.port
+        except ValueError:
+            return url
+        host = (parts.hostname or '').lower()
+        for prefix in ALTERNATE_HOST_PREFIXES:
+            if host.startswith(prefix):
+                host = host[len(prefix):]
+                break
+        if port and port not in (80, 443):
+            host = f"{host}:{port}"
+
+        path = re.sub(r'/+', '/', parts.path or '/')
+        path = re.sub(r'(/amp|\.amp)/?$', '', path, flags=re.IGNORECASE)
+        if len(path) > 1:
+            path = path.rstrip('/')
+
+        query = sorted(
+            (key, value) for key, value in parse_qsl(parts.query, keep_blank_values=True)
+            if key.lower() not in TRACKING_PARAMS and not key.lower().startswith(TRACKING_PREFIXES)
+        )
+
+        return urlunsplit(('https', host, path or '/', urlencode(query), ''))
+
+    @staticmethod
+    def normalize_title(title: str) -> str:
+        """Lowercase, accent-free, punctuation-free title words"""
+        text = unicodedata.normalize('NFKD', title or '')
+        text = text.encode('ascii', 'ignore').decode('ascii').lower()
+        return ' '.join(re.findall(r'[a-z0-9]+', text))
+
+    @staticmethod
+    def title_fingerprint(title: str, source_name: str) -> str:
+        """Short hash of a normalized title, scoped to one source"""
+        key = f"{source_name.lower()}|{ContentIdentity.normalize_title(title)}"
+        return hashlib.sha1(key.encode('utf-8')).hexdigest()[:20]
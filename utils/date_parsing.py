@@ -0,0 +1,173 @@
+# utils/date_parsing.py
+"""
+Exception-free feed date parsing to UTC epoch seconds, memoized per source
+"""
+
+import calendar
+import re
+from typing import Dict, Optional, Tuple
+
+MONTHS = {name: number for number, name in enumerate(
+    ('jan', 'feb', 'mar', 'apr', 'may', 'jun', 'jul', 'aug', 'sep', 'oct', 'nov', 'dec'), 1)}
+
+# Zone names seen in feeds, as minutes east of UTC; unknown names count as UTC like email.utils does
+ZONES = {'ut': 0, 'utc': 0, 'gmt': 0, 'z': 0,
+         'est': -300, 'edt': -240, 'cst': -360, 'cdt': -300,
+         'mst': -420, 'mdt': -360, 'pst': -480, 'pdt': -420,
+         'bst': 60, 'cet': 60, 'cest': 120, 'eet': 120, 'eest': 180,
+         'sast': 120, 'cat': 120, 'eat': 180, 'wat': 60}
+
+_ZONE = r'(?:\s*(?P<zone>[A-Za-z]{1,5}|[+-]\d{2}:?\d{2}|[+-]\d{2}))?'
+# Matched ahead of _ZONE, so a bare 'PM' is never read as a zone name
+_MERIDIEM = r'(?:\s*(?P<meridiem>[AaPp][Mm])\b)?'
+# Trailing zone comment, e.g. '+0200 (SAST)'; the numeric offset wins
+_COMMENT = r'(?:\s*\([^()]*\))?'
+
+# 'Fri, 16 Oct 2026 21:30:00 +0200', '16 Oct 2026 21:30 GMT', '16 Oct 2026 9:30 PM +0200 (SAST)'
+RFC822 = re.compile(
+    r'\s*(?:[A-Za-z]{3,9},?\s+)?(?P<day>\d{1,2})\s+(?P<month>[A-Za-z]{3,9})\.?,?\s+(?P<year>\d{4}|\d{2})'
+    r'(?:\s+(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?' + _MERIDIEM + r')?'
+    + _ZONE + _COMMENT + r'\s*$')
+
+# '2026-10-16T21:30:00.123+02:00', '2026-10-16 21:30:00', '2026-10-16'
+ISO8601 = re.compile(
+    r'\s*(?P<year>\d{4})-(?P<month>\d{2})-(?P<day>\d{2})'
+    r'(?:[Tt ](?P<hour>\d{2}):(?P<minute>\d{2})(?::(?P<second>\d{2})(?:[.,]\d+)?)?)?' + _ZONE + r'\s*$')
+
+# 'Oct 16, 2026 21:30:00', 'October 16, 2026 9:30 PM'
+MONTH_FIRST = re.compile(
+    r'\s*(?:[A-Za-z]{3,9},?\s+)?(?P<month>[A-Za-z]{3,9})\.?\s+(?P<day>\d{1,2}),?\s+(?P<year>\d{4})'
+    r'(?:\s+(?:at\s+)?(?P<hour>\d{1,2}):(?P<minute>\d{2})(?::(?P<second>\d{2}))?' + _MERIDIEM + r')?'
+    + _ZONE + _COMMENT + r'\s*$')
+
+STRING_FORMATS = (RFC822, ISO8601, MONTH_FIRST)
+STRUCT = -1  # Format slot for feedparser's already parsed *_parsed tuples
+
+# Entry fields holding a date, in order of preference
+DATE_FIELDS = ('published_parsed', 'updated_parsed', 'created_parsed',
+               'published', 'pubDate', 'updated', 'dc:date', 'date', 'created')
+
+DAYS_IN_MONTH = (0, 31, 28, 31, 30, 31, 30, 31, 31, 30, 31, 30, 31)
+
+def _days_since_epoch(year: int, month: int, day: int) -> int:
+    """Days from 1970-01-01 to a proleptic Gregorian date"""
+    year -= month <= 2
+    era = year // 400
+    year_of_era = year - era * 400
+    day_of_year = (153 * (month + (-3 if month > 2 else 9)) + 2) // 5 + day - 1
+    day_of_era = year_of_era * 365 + year_of_era // 4 - year_of_era // 100 + day_of_year
+    return era * 146097 + day_of_era - 719468
+
+def _zone_offset(zone: Optional[str]) -> Optional[int]:
+    """Seconds east of UTC, None for a malformed numeric offset"""
+    if not zone:
+        return 0
+    if zone[0] in '+-':
+        hours, minutes = int(zone[1:3]), int(zone[-2:]) if len(zone) > 3 else 0
+        if hours > 14 or minutes > 59:
+            return None
+        offset = hours * 3600 + minutes * 60
+        return -offset if zone[0] == '-' else offset
+    return ZONES.get(zone.lower(), 0) * 60
+
+def _epoch(match) -> Optional[int]:
+    year, month, day, hour, minute, second, zone = match.group(
+        'year', 'month', 'day', 'hour', 'minute', 'second', 'zone')
+    if month.isdigit():
+        month = int(month)
+    else:
+        month = MONTHS.get(month[:3].lower())
+        if month is None:
+            return None
+
+    year, day = int(year), int(day)
+    if year < 100:
+        year += 2000 if year < 50 else 1900
+    hour = int(hour) if hour else 0
+    minute = int(minute) if minute else 0
+    second = min(int(second), 59) if second else 0  # Leap seconds land on :59
+
+    meridiem = match.re is not ISO8601 and match.group('meridiem')
+    if meridiem:
+        if hour > 12:
+            return None
+        hour = hour % 12 + (12 if meridiem.lower() == 'pm' else 0)
+
+    leap_day = month == 2 and year % 4 == 0 and (year % 100 != 0 or year % 400 == 0)
+    if not (1 <= month <= 12 and 1 <= day <= DAYS_IN_MONTH[month] + leap_day
+            and hour <= 23 and minute <= 59 and year >= 1970):
+        return None
+    offset = _zone_offset(zone)
+    if offset is None:
+        return None
+    return _days_since_epoch(year, month, day) * 86400 + hour * 3600 + minute * 60 + second - offset
+
+class DateParser:
+    @staticmethod
+    def parse(value, preferred: int = 0) -> Tuple[Optional[int], int]:
+        """(UTC epoch, format slot) for a date string or a *_parsed tuple.
+
+        Formats are matched with regexes rather than strptime so a miss costs
+        a failed match, not an exception. preferred is the slot to try first.
+        """
+        if not isinstance(value, str):
+            try:
+                return calendar.timegm(tuple(value)[:6] + (0, 0, 0)), STRUCT
+            except (TypeError, ValueError, OverflowError):
+                return None, STRUCT
+
+        if 0 <= preferred < len(STRING_FORMATS):
+            match = STRING_FORMATS[preferred].match(value)
+            if match:
+                epoch = _epoch(match)
+                if epoch is not None:
+                    return epoch, preferred
+        for slot, pattern in enumerate(STRING_FORMATS):
+            if slot == preferred:
+                continue
+            match = pattern.match(value)
+            if match:
+                epoch = _epoch(match)
+                if epoch is not None:
+                    return epoch, slot
+        return None, 0
+
+    @staticmethod
+    def to_epoch(value) -> Optional[int]:
+        """UTC epoch of a date string or *_parsed tuple, None if unreadable"""
+        return DateParser.parse(value)[0] if value else None
+
+class DateNormalizer:
+    """Publication time of feed entries, remembering what worked per source.
+
+    A source's feed uses the same date field and format in every entry, so
+    after the first hit the remembered (field, format) is tried on its own
+    and the full search only runs again when that stops working.
+    """
+
+    def __init__(self):
+        self.hints: Dict[str, Tuple[str, int]] = {}
+
+    def timestamp(self, entry, source_name: Optional[str] = None) -> Optional[int]:
+        """UTC epoch of an entry's publication date, None if it has none"""
+        hint = self.hints.get(source_name)
+        if hint:
+            field, slot = hint
+            value = entry.get(field)
+            if value:
+                epoch, found = DateParser.parse(value, slot)
+                if epoch is not None:
+                    if found != slot:
+                        self.hints[source_name] = (field, found)
+                    return epoch
+
+        for field in DATE_FIELDS:
+            value = entry.get(field)
+            if not value:
+                continue
+            epoch, slot = DateParser.parse(value)
+            if epoch is not None:
+                if source_name is not None:
+                    self.hints[source_name] = (field, slot)
+                return epoch
+        return None
@@ -0,0 +1,101 @@
+# utils/db_pool.py
+"""
+Per-thread SQLite connections, opened once with tuned pragmas and reused
+"""
+
+import os
+import sqlite3
+import threading
+import weakref
+from typing import Dict
+
+def apply_pragmas(conn: sqlite3.Connection, pragmas: Dict[str, object]):
+    """Run PRAGMA name = value for each pragma, in order"""
+    for name, value in pragmas.items():
+        conn.execute(f"PRAGMA {name} = {value}")
+
+class PooledConnection(sqlite3.Connection):
+    """sqlite3 connection whose close() checks it back in instead of closing.
+
+    get/close pairs nest (a route and the helpers it calls share one
+    connection), so only the outermost close() ends an open transaction,
+    rolling it back exactly as closing a plain connection would.
+    """
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.checkouts = 0
+
+    def close(self):
+        self.checkouts = max(self.checkouts - 1, 0)
+        if self.checkouts == 0 and self.in_transaction:
+            self.rollback()
+
+    def release(self):
+        """Drop every checkout, including ones never closed, and end any open transaction"""
+        self.checkouts = 0
+        if self.in_transaction:
+            self.rollback()
+
+    def dispose(self):
+        """Really close the connection"""
+        super().close()
+
+class ConnectionPool:
+    """One long-lived connection per thread.
+
+    Opening a connection and applying pragmas happens once per thread rather
+    than once per query helper, and the connection's prepared statement cache
+    survives between requests. A pid check reopens connections inherited
+    across fork, which SQLite does not support using.
+    """
+
+    def __init__(self, db_path: str, pragmas: Dict[str, object], timeout: float = 5.0,
+                 cached_statements: int = 256):
+        self.db_path = db_path
+        self.pragmas = pragmas
+        self.timeout = timeout
+        self.cached_statements = cached_statements
+        self.local = threading.local()
+        self.lock = threading.Lock()
+        self.connections = weakref.WeakSet()
+        self.opened = 0
+
+    def connection(self) -> PooledConnection:
+        """This thread's connection, opened on first use; pair with close()"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is None or self.local.pid != os.getpid():
+            conn = self.open()
+            self.local.conn, self.local.pid = conn, os.getpid()
+        conn.checkouts += 1
+        return conn
+
+    def open(self) -> PooledConnection:
+        # check_same_thread=False only so close_all() can close other threads'
+        # connections at shutdown; each connection is still used by one thread
+        conn = sqlite3.connect(self.db_path, timeout=self.timeout, factory=PooledConnection,
+                               cached_statements=self.cached_statements, check_same_thread=False)
+        conn.row_factory = sqlite3.Row
+        apply_pragmas(conn, self.pragmas)
+        with self.lock:
+            self.connections.add(conn)
+            self.opened += 1
+        return conn
+
+    def release(self):
+        """End the current thread's checkouts (request teardown); the connection stays open"""
+        conn = getattr(self.local, 'conn', None)
+        if conn is not None:
+            conn.release()
+
+    def close_all(self):
+        """Close every thread's connection, e.g. at process exit"""
+        with self.lock:
+            connections = list(self.connections)
+            self.connections.clear()
+        for conn in connections:
+            try:
+                conn.dispose()
+            except sqlite3.Error:
+                pass
+        self.local = threading.local()
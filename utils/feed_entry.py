@@ -0,0 +1,79 @@
+# utils/feed_entry.py
+"""
+Compact feed entry record shared by every parser strategy
+"""
+
+from typing import Optional
+
+class Entry:
+    """One feed item reduced to what the ingest pipeline reads.
+
+    content is the full body (content:encoded / Atom content), summary the
+    description. media_image comes from media:content, media:thumbnail or an
+    image enclosure; link_image from an image <link>, which is only used
+    when the body has no <img>. published_at is UTC epoch seconds.
+    """
+    __slots__ = ('title', 'link', 'guid', 'content', 'summary',
+                 'published_at', 'media_image', 'link_image')
+
+    def __init__(self, title: str, link: str = '', guid: Optional[str] = None,
+                 content: str = '', summary: str = '', published_at: Optional[int] = None,
+                 media_image: Optional[str] = None, link_image: Optional[str] = None):
+        self.title = title
+        self.link = link
+        self.guid = guid
+        self.content = content
+        self.summary = summary
+        self.published_at = published_at
+        self.media_image = media_image
+        self.link_image = link_image
+
+    def __repr__(self):
+        return f"Entry({self.title[:40]!r}, {self.link!r})"
+
+    @staticmethod
+    def from_feedparser(raw, published_at: Optional[int] = None) -> 'Entry':
+        """Entry from a feedparser entry; raw is not kept"""
+        content = raw.get('content')
+        if isinstance(content, list):
+            content = content[0].get('value', '') if content and isinstance(content[0], dict) else ''
+
+        summary = raw.get('summary')
+        if not summary:
+            detail = raw.get('summary_detail')
+            summary = detail.get('value', '') if isinstance(detail, dict) else raw.get('description', '')
+
+        guid = raw.get('id') or raw.get('guid')
+        return Entry(
+            title=str(raw.get('title') or ''),
+            link=str(raw.get('link') or raw.get('url') or ''),
+            guid=str(guid) if guid else None,
+            content=str(content or ''),
+            summary=str(summary or ''),
+            published_at=published_at,
+            media_image=first_image_url(raw),
+            link_image=first_typed_url(raw.get('links'), 'href')
+        )
+
+def first_typed_url(items, *url_keys) -> Optional[str]:
+    """First absolute URL among media dicts whose type is image/*"""
+    for item in items or ():
+        if isinstance(item, dict) and item.get('type', '').startswith('image/'):
+            for key in url_keys:
+                url = item.get(key, '')
+                if url:
+                    break
+            if url and url.startswith('http'):
+                return url
+    return None
+
+def first_image_url(raw) -> Optional[str]:
+    """Lead image declared by media:content, media:thumbnail or an enclosure"""
+    image = first_typed_url(raw.get('media_content'), 'url')
+    if image:
+        return image
+    for thumb in raw.get('media_thumbnail') or ():
+        url = thumb.get('url', '') if isinstance(thumb, dict) else ''
+        if url and url.startswith('http'):
+            return url
+    return first_typed_url(raw.get('enclosures'), 'href', 'url')
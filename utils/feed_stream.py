@@ -0,0 +1,202 @@
+# utils/feed_stream.py
+"""
+Incremental RSS/Atom parsing with a byte cap and early termination
+"""
+
+import time
+from typing import Callable, List, Optional
+from xml.etree.ElementTree import XMLPullParser, ParseError, tostring
+
+from utils.date_parsing import DateParser
+from utils.feed_entry import Entry, first_image_url, first_typed_url
+
+MEDIA_NS = 'http://search.yahoo.com/mrss/'
+CONTENT_NS = 'http://purl.org/rss/1.0/modules/content/'
+DC_NS = 'http://purl.org/dc/elements/1.1/'
+
+ENTRY_TAGS = {'item', 'entry'}
+
+class StreamedFeed:
+    """Feed built from the entries a FeedStreamParser kept"""
+    strategy = 'stream'
+
+    def __init__(self, entries: List[Entry], stopped_at_seen: bool, truncated: bool):
+        self.entries = entries
+        self.bozo = False
+        self.stopped_at_seen = stopped_at_seen
+        self.truncated = truncated
+
+class FeedStreamParser:
+    """Push parser for a feed body that arrives in chunks.
+
+    feed() returns True once nothing more is needed: max_entries new entries
+    were kept, stop_after_seen entries in a row were already known (feeds
+    list newest first, so the rest is older), or max_bytes were read.
+    Consumed bytes are kept so a malformed document can still be handed to
+    a lenient parser without downloading it again. parse_seconds is the time
+    spent parsing, which callers subtract from the read time.
+    """
+
+    def __init__(self, max_entries: int, is_seen: Optional[Callable[[Entry], bool]] = None,
+                 max_bytes: int = 1048576, stop_after_seen: int = 3, parse: bool = True):
+        self.max_entries = max_entries
+        self.is_seen = is_seen
+        self.max_bytes = max_bytes
+        self.stop_after_seen = stop_after_seen
+        self.parse = parse
+
+        self.parser = XMLPullParser(events=('start', 'end'))
+        self.open_elements = []
+        self.chunks: List[bytes] = []
+        self.bytes_read = 0
+        self.parse_seconds = 0.0
+        self.entries: List[Entry] = []
+        self.seen_in_a_row = 0
+        self.stopped_at_seen = False
+        self.truncated = False
+        self.failed = False
+        self.done = False
+
+    def feed(self, chunk: bytes) -> bool:
+        """Consume one chunk of the body, True when reading can stop"""
+        if self.done or not chunk:
+            return self.done
+
+        remaining = self.max_bytes - self.bytes_read
+        if len(chunk) >= remaining:
+            chunk = chunk[:remaining]
+            self.truncated = True
+            self.done = True
+        self.chunks.append(chunk)
+        self.bytes_read += len(chunk)
+
+        if self.parse and not self.failed:
+            started = time.perf_counter()
+            try:
+                self.parser.feed(chunk)
+                self._read_events()
+            except ParseError:
+                # Keep buffering: the caller falls back to a lenient parser
+                self.failed = True
+            self.parse_seconds += time.perf_counter() - started
+        return self.done
+
+    def finish(self) -> StreamedFeed:
+        """Entries kept so far; call after the last chunk"""
+        if self.parse and not self.failed and not self.done:
+            try:
+                self.parser.close()
+                self._read_events()
+            except ParseError:
+                self.failed = True
+        return StreamedFeed(self.entries, self.stopped_at_seen, self.truncated)
+
+    @property
+    def complete(self) -> bool:
+        """True when the whole body was read rather than cut short"""
+        return not self.done
+
+    def body(self) -> bytes:
+        return b''.join(self.chunks)
+
+    def _read_events(self):
+        for event, element in self.parser.read_events():
+            if event == 'start':
+                self.open_elements.append(element)
+                continue
+
+            self.open_elements.pop()
+            if _local(element.tag) not in ENTRY_TAGS or self.done:
+                continue
+
+            entry = _build_entry(element)
+            # Drop the finished item so a long feed never sits in memory
+            element.clear()
+            if self.open_elements:
+                self.open_elements[-1].remove(element)
+
+            if self.is_seen and self.is_seen(entry):
+                self.seen_in_a_row += 1
+                if self.seen_in_a_row >= self.stop_after_seen:
+                    self.stopped_at_seen = True
+                    self.done = True
+                continue
+
+            self.seen_in_a_row = 0
+            if entry.title:
+                self.entries.append(entry)
+                if len(self.entries) >= self.max_entries:
+                    self.done = True
+
+def _local(tag: str) -> str:
+    return tag.rsplit('}', 1)[-1]
+
+def _namespace(tag: str) -> str:
+    return tag[1:].split('}', 1)[0] if tag.startswith('{') else ''
+
+def _text(element) -> str:
+    """Text of an element; inline XHTML children are kept as markup"""
+    if len(element):
+        return (element.text or '') + ''.join(tostring(child, encoding='unicode') for child in element)
+    return element.text or ''
+
+def _build_entry(element) -> Entry:
+    """Entry for one <item> or Atom <entry>, read the way feedparser would"""
+    title = link = guid = content = summary = None
+    published_at = updated_at = None
+    published_seen = updated_seen = False
+    media = {'media_content': [], 'media_thumbnail': [], 'enclosures': []}
+    links = []
+
+    for child in element.iter():
+        if child is element:
+            continue
+        name, namespace = _local(child.tag), _namespace(child.tag)
+
+        if namespace == MEDIA_NS:
+            if name == 'content' and child.get('url'):
+                media['media_content'].append(child.attrib)
+            elif name == 'thumbnail' and child.get('url'):
+                media['media_thumbnail'].append(child.attrib)
+            continue
+
+        if name == 'title' and title is None:
+            title = ''.join(child.itertext()).strip()
+        elif name == 'link':
+            href = child.get('href')
+            if href:
+                rel = child.get('rel', 'alternate')
+                links.append({'href': href, 'type': child.get('type', '')})
+                if rel == 'alternate' and link is None:
+                    link = href
+            elif (child.text or '').strip() and link is None:
+                link = child.text.strip()
+        elif name in ('description', 'summary') and summary is None:
+            summary = _text(child)
+        elif (name == 'encoded' and namespace == CONTENT_NS) or name == 'content':
+            if content is None:
+                content = _text(child)
+        elif name in ('guid', 'id') and guid is None:
+            guid = (child.text or '').strip()
+        elif name == 'enclosure' and child.get('url'):
+            enclosure = {'href': child.get('url'), 'type': child.get('type', '')}
+            media['enclosures'].append(enclosure)
+            links.append(enclosure)
+        elif name in ('pubDate', 'published', 'issued') or (name == 'date' and namespace == DC_NS):
+            if not published_seen and child.text:
+                published_seen = True
+                published_at = DateParser.to_epoch(child.text.strip())
+        elif name in ('updated', 'modified') and child.text and not updated_seen:
+            updated_seen = True
+            updated_at = DateParser.to_epoch(child.text.strip())
+
+    return Entry(
+        title=title or '',
+        link=link or '',
+        guid=guid or None,
+        content=content or '',
+        summary=summary if summary is not None else content or '',
+        published_at=published_at if published_at is not None else updated_at,
+        media_image=first_image_url(media),
+        link_image=first_typed_url(links, 'href')
+    )
@@ -0,0 +1,156 @@
+# utils/fetch_lease.py
+"""
+SQLite lease that elects a single fetching process across workers and instances
+"""
+
+import os
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Dict, Optional
+
+class FetchLease:
+    """Time-limited claim on fetch leadership, stored in the fetch_leases table.
+
+    The process holding an unexpired lease is the only one that fetches; a
+    heartbeat thread renews it every ttl/3 seconds. A holder that crashes or
+    hangs stops renewing, so its lease runs out after ttl and the next process
+    to call acquire() takes over. Expiry compares wall clocks, so instances
+    sharing a database need clocks that agree well within ttl.
+    """
+
+    def __init__(self, db_path: str, name: str = 'fetch', ttl: float = 90):
+        self.db_path = db_path
+        self.name = name
+        self.ttl = ttl
+        self.pid = os.getpid()
+        self.holder = f"{socket.gethostname()}:{self.pid}:{uuid.uuid4().hex[:8]}"
+        self.expires_at = 0.0
+        # Bumped each time leadership starts; renewals keep it. State built while
+        # leading (e.g. in-memory indexes) is stale once the term changes
+        self.term = 0
+        self.lock = threading.Lock()
+        self.stopped = threading.Event()
+        self.heartbeat: Optional[threading.Thread] = None
+
+    def connect(self) -> sqlite3.Connection:
+        # Autocommit: every statement below is a single atomic write
+        return sqlite3.connect(self.db_path, timeout=self.ttl / 3, isolation_level=None)
+
+    def is_leader(self) -> bool:
+        """True while this process holds the lease; also false once it ran out unrenewed"""
+        return time.time() < self.expires_at
+
+    def acquire(self) -> bool:
+        """Take the lease if it is free, expired or already ours (which renews it)"""
+        now = time.time()
+        try:
+            conn = self.connect()
+            try:
+                # Column names inside DO UPDATE refer to the row as it was
+                cursor = conn.execute('''INSERT INTO fetch_leases
+                    (name, holder, acquired_at, heartbeat_at, expires_at, fetching)
+                    VALUES (?, ?, ?, ?, ?, 0)
+                    ON CONFLICT(name) DO UPDATE SET
+                        acquired_at = CASE WHEN holder = excluded.holder THEN acquired_at
+                                           ELSE excluded.acquired_at END,
+                        fetching = CASE WHEN holder = excluded.holder THEN fetching ELSE 0 END,
+                        holder = excluded.holder,
+                        heartbeat_at = excluded.heartbeat_at,
+                        expires_at = excluded.expires_at
+                    WHERE holder = excluded.holder OR expires_at < excluded.heartbeat_at''',
+                    (self.name, self.holder, now, now, now + self.ttl))
+                won = cursor.rowcount == 1
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            # Busy database: keep whatever lease time is left, try again next beat
+            return self.is_leader()
+
+        with self.lock:
+            if not won:
+                self.expires_at = 0.0
+                return False
+            if not self.is_leader():
+                # Not a renewal: another process may have led in between
+                self.term += 1
+            self.expires_at = now + self.ttl
+            if self.heartbeat is None or self.stopped.is_set() or not self.heartbeat.is_alive():
+                # A fresh event per thread, so a heartbeat still winding down from
+                # release() cannot swallow the new one's stop signal
+                self.stopped = threading.Event()
+                self.heartbeat = threading.Thread(target=self.beat, args=(self.stopped,),
+                                                  name='fetch-lease-heartbeat', daemon=True)
+                self.heartbeat.start()
+        return True
+
+    def beat(self, stopped: threading.Event):
+        """Renew the lease until it is released or lost to another process"""
+        while not stopped.wait(self.ttl / 3):
+            if not self.acquire():
+                return
+
+    def release(self):
+        """Give the lease up now instead of letting it expire"""
+        with self.lock:
+            self.stopped.set()
+            was_leader = self.is_leader()
+            self.expires_at = 0.0
+        if was_leader:
+            self.execute("UPDATE fetch_leases SET expires_at = 0, fetching = 0 WHERE name = ? AND holder = ?",
+                         (self.name, self.holder))
+
+    def set_fetching(self, fetching: bool):
+        """Publish whether the leader is fetching right now"""
+        self.execute("UPDATE fetch_leases SET fetching = ? WHERE name = ? AND holder = ?",
+                     (int(fetching), self.name, self.holder))
+
+    def request_fetch(self):
+        """Ask the leader, whichever process it is, for a full fetch on its next beat"""
+        self.execute('''INSERT INTO fetch_leases (name, expires_at, fetch_requested_at) VALUES (?, 0, ?)
+            ON CONFLICT(name) DO UPDATE SET fetch_requested_at = excluded.fetch_requested_at''',
+            (self.name, time.time()))
+
+    def take_fetch_request(self) -> bool:
+        """Clear a pending fetch request; True if there was one and we lead"""
+        return self.execute('''UPDATE fetch_leases SET fetch_requested_at = NULL
+            WHERE name = ? AND holder = ? AND fetch_requested_at IS NOT NULL''',
+            (self.name, self.holder)) == 1
+
+    def status(self) -> Dict:
+        """Current holder, expiry and fetching flag as seen in the database"""
+        row = None
+        try:
+            conn = self.connect()
+            try:
+                row = conn.execute('''SELECT holder, acquired_at, heartbeat_at, expires_at, fetching,
+                    fetch_requested_at FROM fetch_leases WHERE name = ?''', (self.name,)).fetchone()
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            pass
+
+        holder, acquired_at, heartbeat_at, expires_at, fetching, requested_at = row or (None,) * 6
+        alive = bool(holder) and (expires_at or 0) > time.time()
+        return {
+            'leader': holder if alive else None,
+            'is_leader': alive and holder == self.holder,
+            'fetching': alive and bool(fetching),
+            'acquired_at': acquired_at if alive else None,
+            'heartbeat_at': heartbeat_at,
+            'expires_at': expires_at if alive else None,
+            'fetch_requested': requested_at is not None
+        }
+
+    def execute(self, sql: str, params: tuple) -> int:
+        """Run one write, returning the affected row count (0 if the database was busy)"""
+        try:
+            conn = self.connect()
+            try:
+                return conn.execute(sql, params).rowcount
+            finally:
+                conn.close()
+        except sqlite3.Error:
+            return 0
@@ -0,0 +1,77 @@
+# utils/fetch_trace.py
+"""
+Per-source stage timings and counters for one ingestion run
+"""
+
+import math
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional
+
+# Pipeline stages in the order a source goes through them
+STAGES = ('connect', 'download', 'parse', 'clean', 'image', 'dedupe', 'insert')
+COUNTERS = ('bytes', 'entries_seen', 'entries_new', 'errors')
+
+class SourceTrace:
+    """Spans and counters of one source within a fetch run.
+
+    Span times are summed per stage, so a stage that runs once per URL
+    variation or once per entry reports its total. The fetch side and the
+    writer both record into the same trace, hence the lock.
+    """
+
+    def __init__(self, source_name: str):
+        self.source_name = source_name
+        self.started_at = time.time()
+        self.spans: Dict[str, float] = dict.fromkeys(STAGES, 0.0)
+        self.counters: Dict[str, int] = dict.fromkeys(COUNTERS, 0)
+        self.last_error: Optional[str] = None
+        self.lock = threading.Lock()
+
+    @contextmanager
+    def span(self, stage: str):
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.add(stage, time.perf_counter() - started)
+
+    def add(self, stage: str, seconds: float):
+        with self.lock:
+            self.spans[stage] += seconds
+
+    def count(self, counter: str, amount: int = 1):
+        with self.lock:
+            self.counters[counter] += amount
+
+    def error(self, message: str):
+        with self.lock:
+            self.counters['errors'] += 1
+            self.last_error = str(message)[:200]
+
+    def merge(self, spans: Dict[str, float], errors: int = 0):
+        """Fold in spans recorded elsewhere, e.g. by a normalize worker process"""
+        with self.lock:
+            for stage, seconds in spans.items():
+                self.spans[stage] += seconds
+            self.counters['errors'] += errors
+
+    def record_stream(self, stream, seconds: float):
+        """Split a streamed read into download and parse time"""
+        with self.lock:
+            self.spans['parse'] += stream.parse_seconds
+            self.spans['download'] += max(seconds - stream.parse_seconds, 0.0)
+            self.counters['bytes'] += stream.bytes_read
+
+    def milliseconds(self) -> Dict[str, int]:
+        with self.lock:
+            return {stage: round(seconds * 1000) for stage, seconds in self.spans.items()}
+
+def percentile(values: List[float], pct: float) -> Optional[float]:
+    """Nearest-rank percentile, None for no values"""
+    if not values:
+        return None
+    ordered = sorted(values)
+    rank = max(math.ceil(pct / 100 * len(ordered)), 1)
+    return ordered[rank - 1]
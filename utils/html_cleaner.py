@@ -0,0 +1,166 @@
+# utils/html_cleaner.py
+"""
+Single-pass HTML to plain text conversion for feed entry content
+"""
+
+import html
+from html.parser import HTMLParser
+from typing import List, NamedTuple, Optional
+
+# Elements dropped together with everything inside them
+UNWANTED_TAGS = {'script', 'style', 'iframe', 'nav', 'header', 'footer',
+                 'aside', 'form', 'button', 'input', 'select', 'textarea',
+                 'template'}  # template text is never rendered
+
+# Any element whose class contains one of these is dropped with its subtree
+UNWANTED_CLASSES = ('advertisement', 'ad', 'sidebar', 'navigation',
+                    'comments', 'share', 'related', 'promo')
+
+# Elements that never have children or an end tag
+VOID_TAGS = {'area', 'base', 'br', 'col', 'embed', 'hr', 'img', 'input', 'keygen',
+             'link', 'menuitem', 'meta', 'param', 'source', 'track', 'wbr',
+             'basefont', 'bgsound', 'command', 'frame', 'image', 'isindex',
+             'nextid', 'spacer'}
+
+class ParsedHTML(NamedTuple):
+    text: str
+    image_src: Optional[str]  # src of the first <img>, '' if it has none, None without an <img>
+    complete: bool  # False when text was cut at max_chars
+
+class _EnoughText(Exception):
+    """Raised from a handler once there is nothing left worth collecting"""
+
+class _TextCollector(HTMLParser):
+    """Streams tags and text, keeping only text outside unwanted subtrees.
+
+    Also remembers the first <img> anywhere in the fragment, so one pass
+    gives both the article text and its lead image.
+
+    Tracks open elements the way an html.parser tree would be built: an
+    end tag closes the nearest open element of that name and everything
+    opened after it, and stray end tags are ignored.
+    """
+
+    def __init__(self, max_chars: Optional[int]):
+        super().__init__(convert_charrefs=True)
+        self.max_chars = max_chars
+        self.open_tags: List[str] = []
+        self.skip_from: Optional[int] = None  # Stack depth of the outermost unwanted element
+        self.buffer: List[str] = []
+        self.pieces: List[str] = []
+        self.length = -1
+        self.text_done = False
+        self.image_src: Optional[str] = None
+
+    def flush(self):
+        """End the current text node, as a tag or comment would in a tree"""
+        if not self.buffer:
+            return
+        text = ''.join(self.buffer)
+        self.buffer = []
+        self.add_text(text)
+
+    def add_text(self, text: str):
+        if self.text_done:
+            return
+        piece = ' '.join(html.unescape(text.strip()).split())
+        if not piece:
+            return
+        self.pieces.append(piece)
+        self.length += len(piece) + 1
+        if self.max_chars is not None and self.length > self.max_chars:
+            self.text_done = True
+            if self.image_src is not None:
+                raise _EnoughText()
+
+    def see_image(self, attrs):
+        if self.image_src is not None:
+            return
+        src = ''
+        for name, value in attrs:
+            if name == 'src':
+                src = value or ''
+        self.image_src = src
+        if self.text_done:
+            raise _EnoughText()
+
+    def handle_starttag(self, tag, attrs):
+        self.flush()
+        if tag == 'img':
+            self.see_image(attrs)
+        if tag in VOID_TAGS:
+            return
+        if self.skip_from is None and self.is_unwanted(tag, attrs):
+            self.skip_from = len(self.open_tags)
+        self.open_tags.append(tag)
+
+    def handle_startendtag(self, tag, attrs):
+        # <div/> opens and closes at once, nothing can end up inside it
+        self.flush()
+        if tag == 'img':
+            self.see_image(attrs)
+
+    def handle_endtag(self, tag):
+        self.flush()
+        for depth in range(len(self.open_tags) - 1, -1, -1):
+            if self.open_tags[depth] == tag:
+                del self.open_tags[depth:]
+                if self.skip_from is not None and depth <= self.skip_from:
+                    self.skip_from = None
+                break
+
+    def handle_data(self, data):
+        if self.skip_from is None and not self.text_done:
+            self.buffer.append(data)
+
+    def handle_comment(self, data):
+        self.flush()
+
+    def handle_decl(self, decl):
+        self.flush()
+
+    def handle_pi(self, data):
+        self.flush()
+
+    def unknown_decl(self, data):
+        self.flush()
+        if data.startswith('CDATA[') and self.skip_from is None:
+            self.add_text(data[len('CDATA['):])
+
+    @staticmethod
+    def is_unwanted(tag, attrs) -> bool:
+        if tag in UNWANTED_TAGS:
+            return True
+        # A repeated class attribute keeps its last value
+        classes = None
+        for name, value in attrs:
+            if name == 'class':
+                classes = value
+        if not classes:
+            return False
+        classes = classes.lower()
+        return any(unwanted in classes for unwanted in UNWANTED_CLASSES)
+
+class HTMLCleaner:
+    @staticmethod
+    def parse(html_content: str, max_chars: Optional[int] = None) -> ParsedHTML:
+        """Visible text and first image of an HTML fragment in a single pass.
+
+        Scripts, styles, navigation, forms and ad/sidebar/share blocks are
+        skipped while parsing, and whitespace is collapsed. With max_chars,
+        text stops once it is longer than that (so callers can still tell it
+        was cut) and parsing stops as soon as the first image is known too.
+        """
+        collector = _TextCollector(max_chars)
+        try:
+            collector.feed(html_content)
+            collector.close()
+            collector.flush()
+        except _EnoughText:
+            pass
+        return ParsedHTML(' '.join(collector.pieces), collector.image_src, not collector.text_done)
+
+    @staticmethod
+    def extract_text(html_content: str, max_chars: Optional[int] = None) -> str:
+        """Visible text of an HTML fragment, see parse()"""
+        return HTMLCleaner.parse(html_content, max_chars).text
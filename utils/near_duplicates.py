@@ -0,0 +1,178 @@
+# utils/near_duplicates.py
+"""
+SimHash signatures and a banded LSH index for near-duplicate articles
+"""
+
+import hashlib
+import re
+from collections import deque
+from typing import Dict, List, Optional, Tuple, Union
+
+SIGNATURE_BITS = 64
+BANDS = 3  # Pigeonhole: two signatures within 5 bits differ by at most 1 bit in some band
+SHINGLE_SIZE = 3
+MAX_CONTENT_WORDS = 300  # Wire copies diverge further down, the lead is what matters
+SIGNATURE_VERSION = 2  # Bump when signature() changes so stored signatures get recomputed
+
+_LANE_BITS = 16  # Per-bit counter width; an article never reaches 65536 shingles
+_LANE_MASK = (1 << _LANE_BITS) - 1
+
+def _byte_lanes() -> List[List[int]]:
+    """Per digest byte (big-endian), each byte value with its 8 bits moved
+    into the counter lanes of the signature bits they land on"""
+    return [[sum((value >> bit & 1) << _LANE_BITS * (8 * (7 - position) + bit) for bit in range(8))
+             for value in range(256)] for position in range(8)]
+
+_BYTE_LANES = _byte_lanes()
+
+class SimHash:
+    @staticmethod
+    def _tokens(text: str) -> List[str]:
+        return re.findall(r'[a-z0-9]+', (text or '').lower())
+
+    @staticmethod
+    def _shingles(words: List[str]) -> List[str]:
+        if len(words) <= SHINGLE_SIZE:
+            return [' '.join(words)] if words else []
+        return [' '.join(words[i:i + SHINGLE_SIZE]) for i in range(len(words) - SHINGLE_SIZE + 1)]
+
+    @staticmethod
+    def signature(title: str, content: str) -> int:
+        """64-bit SimHash of the normalized headline plus the leading word
+        shingles of an article body.
+
+        The body dominates, so a wire copy under a rewritten headline stays
+        close; the headline still separates stories that share a templated body.
+        """
+        words = SimHash._tokens(title) + SimHash._tokens(content)[:MAX_CONTENT_WORDS]
+        shingles = SimHash._shingles(words)
+        if not shingles:
+            return 0
+
+        # Spread each hash's bits into per-bit counter lanes, so one addition per
+        # shingle counts all 64 columns at once
+        t0, t1, t2, t3, t4, t5, t6, t7 = _BYTE_LANES
+        counts = 0
+        for shingle in shingles:
+            d = hashlib.blake2b(shingle.encode('utf-8'), digest_size=8).digest()
+            counts += t0[d[0]] | t1[d[1]] | t2[d[2]] | t3[d[3]] | t4[d[4]] | t5[d[5]] | t6[d[6]] | t7[d[7]]
+
+        signature = 0
+        for bit in range(SIGNATURE_BITS):
+            if (counts >> _LANE_BITS * bit & _LANE_MASK) * 2 > len(shingles):
+                signature |= 1 << bit
+        return signature
+
+    @staticmethod
+    def distance(a: int, b: int) -> int:
+        """Hamming distance between two signatures"""
+        return bin(a ^ b).count('1')
+
+    @staticmethod
+    def to_db(signature: int) -> int:
+        """Unsigned signature -> SQLite's signed 64-bit INTEGER"""
+        return signature - (1 << 64) if signature >= 1 << 63 else signature
+
+    @staticmethod
+    def from_db(value: int) -> int:
+        """SQLite's signed 64-bit INTEGER -> unsigned signature"""
+        return value + (1 << 64) if value < 0 else value
+
+def _band_layout() -> List[Tuple[int, int]]:
+    """(shift, mask) per band, 64 bits split as evenly as BANDS allows"""
+    layout, shift = [], 0
+    for band in range(BANDS):
+        width = SIGNATURE_BITS // BANDS + (1 if band < SIGNATURE_BITS % BANDS else 0)
+        layout.append((shift, (1 << width) - 1))
+        shift += width
+    return layout
+
+_BAND_LAYOUT = _band_layout()
+
+class NearDuplicateIndex:
+    """Rolling window of recent post signatures, bucketed by band.
+
+    Posts are bucketed on three ~21-bit bands. A lookup probes each band's
+    value and its single-bit neighbours, which finds every post within
+    5 bits while touching only a few candidates even with hundreds of
+    thousands indexed. The oldest posts drop out once the window is full.
+    Each post remembers its source, so a lookup can skip the caller's own:
+    a source repeating itself is not syndication.
+    """
+
+    def __init__(self, window: int = 100000, max_distance: int = 5):
+        self.window = window
+        self.max_distance = min(max_distance, 2 * BANDS - 1)
+        self.signatures: Dict[int, int] = {}
+        self.sources: Dict[int, str] = {}
+        self.order = deque()
+        # Band key -> post id, or a list of post ids once a bucket is shared
+        self.buckets: Dict[int, Union[int, List[int]]] = {}
+        self.loaded = False
+
+    @staticmethod
+    def _band_keys(signature: int):
+        for band, (shift, mask) in enumerate(_BAND_LAYOUT):
+            yield band << 32 | (signature >> shift) & mask
+
+    @staticmethod
+    def _probe_keys(signature: int):
+        for band, (shift, mask) in enumerate(_BAND_LAYOUT):
+            key = band << 32 | (signature >> shift) & mask
+            yield key
+            for bit in range(mask.bit_length()):
+                yield key ^ (1 << bit)
+
+    def add(self, post_id: int, signature: int, source_name: str):
+        """Index a post, evicting the oldest one past the window"""
+        if post_id in self.signatures:
+            return
+        self.signatures[post_id] = signature
+        self.sources[post_id] = source_name
+        self.order.append(post_id)
+        buckets = self.buckets
+        for key in self._band_keys(signature):
+            bucket = buckets.get(key)
+            if bucket is None:
+                buckets[key] = post_id
+            elif isinstance(bucket, list):
+                bucket.append(post_id)
+            else:
+                buckets[key] = [bucket, post_id]
+
+        while len(self.order) > self.window:
+            self._evict(self.order.popleft())
+
+    def _evict(self, post_id: int):
+        signature = self.signatures.pop(post_id, None)
+        if signature is None:
+            return
+        self.sources.pop(post_id, None)
+        for key in self._band_keys(signature):
+            bucket = self.buckets.get(key)
+            if isinstance(bucket, list):
+                bucket.remove(post_id)
+                if len(bucket) == 1:
+                    self.buckets[key] = bucket[0]
+            elif bucket == post_id:
+                del self.buckets[key]
+
+    def find(self, signature: int, exclude_source: Optional[str] = None) -> Optional[Tuple[int, int]]:
+        """Closest indexed post within max_distance as (post_id, distance),
+        ignoring posts from exclude_source"""
+        best = None
+        signatures, sources = self.signatures, self.sources
+        for key in self._probe_keys(signature):
+            bucket = self.buckets.get(key)
+            if bucket is None:
+                continue
+            for post_id in (bucket if isinstance(bucket, list) else (bucket,)):
+                if exclude_source is not None and sources[post_id] == exclude_source:
+                    continue
+                distance = bin(signature ^ signatures[post_id]).count('1')
+                if distance <= self.max_distance and (best is None or distance < best[1]):
+                    best = (post_id, distance)
+        return best
+
+    def __len__(self):
+        return len(self.signatures)
@@ -0,0 +1,42 @@
+# worker.py
+"""
+Fetch worker: runs ingestion as its own process type, apart from the web server
+
+    python worker.py          # set up the database, then fetch on schedule
+    python worker.py --once   # one full fetch, then exit
+
+Run the web side with FETCH_IN_WEB=false so it leaves fetching to this
+process; both must use the same database file. Several workers can run:
+the fetch lease lets only one of them fetch at a time.
+"""
+
+import argparse
+import atexit
+import signal
+import sys
+
+from app import fetcher, logger, run_fetch_loop, run_startup_fetch, setup_database_with_retry
+
+def main():
+    parser = argparse.ArgumentParser(description='Mzansi Insights fetch worker')
+    parser.add_argument('--once', action='store_true', help='run one full fetch and exit')
+    args = parser.parse_args()
+
+    # Deploys and scale-downs send SIGTERM; exit through atexit so the lease is handed over
+    signal.signal(signal.SIGTERM, lambda signum, frame: sys.exit(0))
+    atexit.register(fetcher.lease.release)
+
+    setup_database_with_retry()
+
+    if args.once:
+        saved = fetcher.fetch_and_save()
+        logger.info(f"✅ Fetch worker saved {saved} new articles")
+        return 0
+
+    logger.info(f"🚀 Fetch worker started as {fetcher.lease.holder}")
+    run_startup_fetch()
+    run_fetch_loop()
+    return 0
+
+if __name__ == '__main__':
+    sys.exit(main())